@@ -0,0 +1,27 @@
+"""add state_version to seasons
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-01-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c3d4e5f6a7b8'
+down_revision = 'b2c3d4e5f6g7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'seasons',
+        sa.Column('state_version', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.alter_column('seasons', 'state_version', server_default=None)
+
+
+def downgrade():
+    op.drop_column('seasons', 'state_version')
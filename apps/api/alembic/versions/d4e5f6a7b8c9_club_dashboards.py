@@ -0,0 +1,50 @@
+"""club_dashboards: 月次ダッシュボード（非正規化）
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-01-21 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'd4e5f6a7b8c9'
+down_revision = 'c3d4e5f6a7b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "club_dashboards",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("club_id", UUID(as_uuid=True), sa.ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("season_id", UUID(as_uuid=True), sa.ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("turn_id", UUID(as_uuid=True), sa.ForeignKey("turns.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("month_index", sa.Integer, nullable=False),
+        sa.Column("balance", sa.Numeric(14, 2), nullable=False),
+        sa.Column("is_bankrupt", sa.Boolean, nullable=False, server_default=sa.text("false")),
+        sa.Column("pl_month", JSONB, nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("pl_season", JSONB, nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("fb_count", sa.Integer, nullable=True),
+        sa.Column("followers_public", sa.Integer, nullable=True),
+        sa.Column("sponsor_pipeline", JSONB, nullable=True),
+        sa.Column("staff_counts", JSONB, nullable=True),
+        sa.Column("rank", sa.Integer, nullable=True),
+        sa.Column("points", sa.Integer, nullable=True),
+        sa.Column("team_power", sa.Numeric(8, 2), nullable=True),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+    op.create_unique_constraint(
+        "uq_dashboard_club_season_month",
+        "club_dashboards",
+        ["club_id", "season_id", "month_index"],
+    )
+
+
+def downgrade():
+    op.drop_constraint("uq_dashboard_club_season_month", "club_dashboards", type_="unique")
+    op.drop_table("club_dashboards")
@@ -0,0 +1,42 @@
+"""turn_resolve_reports: ターン解決の性能記録
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-01-28 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'e5f6a7b8c9d0'
+down_revision = 'd4e5f6a7b8c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "turn_resolve_reports",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("turn_id", UUID(as_uuid=True), sa.ForeignKey("turns.id", ondelete="CASCADE"), nullable=False, unique=True),
+        sa.Column("season_id", UUID(as_uuid=True), sa.ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("season_number", sa.Integer, nullable=True),
+        sa.Column("month_index", sa.Integer, nullable=False),
+        sa.Column("total_ms", sa.Float, nullable=False),
+        sa.Column("phases", JSONB, nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("total_queries", sa.Integer, nullable=True),
+        sa.Column("clubs_processed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("fixtures_processed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("ledger_rows_written", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("peak_memory_kb", sa.Integer, nullable=True),
+        sa.Column("app_version", sa.String, nullable=True),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_turn_resolve_reports_season_id", "turn_resolve_reports", ["season_id"])
+
+
+def downgrade():
+    op.drop_index("ix_turn_resolve_reports_season_id", table_name="turn_resolve_reports")
+    op.drop_table("turn_resolve_reports")
@@ -0,0 +1,220 @@
+"""
+レスポンス圧縮（Accept-Encoding による gzip / brotli の切り替え）
+
+CompressionMiddleware は純粋な ASGI ミドルウェアで、アプリが返した本文を
+バッファし、次の条件をすべて満たすときだけ圧縮する:
+
+- Accept-Encoding で br（brotli がインストールされている場合）か gzip が受け入れられる
+- 本文が compression_min_size 以上（小さい本文は圧縮しても得にならない）
+- Content-Type が JSON / msgpack / テキスト（SSE の text/event-stream は除く）
+- まだ Content-Encoding が付いていない（public_cache の事前圧縮済みファイルなど）
+
+ETag 付きのレスポンス（シーズン単位の参照API。終了したシーズンは ETag が変わらない）は
+同じ本文が繰り返し返るため、圧縮結果を本文の SHA-256 をキーにしたLRUに保持して再利用する。
+"""
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.config import get_settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "application/x-msgpack", "text/")
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """優先順のサーバ側で使えるエンコーディング"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str, available: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    Accept-Encoding から使うエンコーディングを選ぶ（無ければ None）
+
+    q 値が高いものを優先し、同じ q 値なら available の順（br → gzip）。
+    `*` は明示されていないエンコーディングすべてに適用する。
+    """
+    if available is None:
+        available = available_encodings()
+    qualities: Dict[str, float] = {}
+    wildcard: Optional[float] = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        if coding == "*":
+            wildcard = q
+        else:
+            qualities[coding] = max(q, qualities.get(coding, 0.0))
+    best, best_q = None, 0.0
+    for coding in available:
+        q = qualities.get(coding, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    """body を encoding で圧縮する（設定値は呼び出し側が一度だけ読んで渡す）"""
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    # mtime=0 で出力を本文に対して決定的にする（public_cache と同じ）
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    if content_type.startswith(UNCOMPRESSIBLE_TYPES):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressedCache:
+    """(本文の digest, エンコーディング) -> 圧縮済みバイト列 のLRU（合計バイト数で制限）"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[str, str], value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._items[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+
+def _header_values(headers: List[Tuple[bytes, bytes]], name: bytes) -> List[str]:
+    return [value.decode("latin-1") for key, value in headers if key.lower() == name]
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+class CompressionMiddleware:
+    """Accept-Encoding に応じて本文を gzip / brotli で圧縮する"""
+
+    def __init__(self, app, min_size: Optional[int] = None, cache_bytes: Optional[int] = None):
+        settings = get_settings()
+        self.app = app
+        self.min_size = settings.compression_min_size if min_size is None else min_size
+        self.gzip_level = settings.compression_gzip_level
+        self.brotli_quality = settings.compression_brotli_quality
+        if cache_bytes is None:
+            cache_bytes = settings.compression_cache_bytes
+        self.cache = CompressedCache(cache_bytes) if cache_bytes > 0 else None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = None
+        for name, value in scope.get("headers") or ():
+            if name == b"accept-encoding":
+                encoding = choose_encoding(value.decode("latin-1"))
+                break
+        if encoding is None or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = message.get("headers") or []
+                if (
+                    message["status"] in (204, 304)
+                    or _header(headers, b"content-encoding") is not None
+                    or not is_compressible(_header(headers, b"content-type") or "")
+                ):
+                    # SSE・事前圧縮済み・バイナリはそのまま流す
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            await self._send_buffered(send, start_message, b"".join(chunks), encoding)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_buffered(self, send, start_message, body: bytes, encoding: str) -> None:
+        headers = [(k, v) for k, v in start_message.get("headers") or [] if k.lower() != b"vary"]
+        # Vary は複数行で届くことがある（FastJSONResponse の Accept と private な本文の X-User-Email）
+        vary = ", ".join(_header_values(start_message.get("headers") or [], b"vary"))
+        headers.append((b"vary", (f"{vary}, Accept-Encoding" if vary else "Accept-Encoding").encode("latin-1")))
+        if len(body) >= self.min_size:
+            cacheable = self.cache is not None and _header(headers, b"etag") is not None
+            key = (hashlib.sha256(body).hexdigest(), encoding) if cacheable else None
+            compressed = self.cache.get(key) if key else None
+            if compressed is None:
+                compressed = compress(body, encoding, self.gzip_level, self.brotli_quality)
+                if key:
+                    self.cache.put(key, compressed)
+            if len(compressed) < len(body):
+                body = compressed
+                headers = [(k, v) for k, v in headers if k.lower() != b"content-length"]
+                headers.append((b"content-encoding", encoding.encode("ascii")))
+                headers.append((b"content-length", str(len(body)).encode("ascii")))
+        await send({**start_message, "headers": headers})
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+__all__ = [
+    "CompressedCache",
+    "CompressionMiddleware",
+    "available_encodings",
+    "choose_encoding",
+    "compress",
+    "is_compressible",
+]
@@ -1,6 +1,8 @@
 # App config package
 # Re-export from original config.py to maintain compatibility
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -13,6 +15,56 @@ class Settings(BaseSettings):
         env="DATABASE_URL",
     )
     api_prefix: str = Field("/api", env="API_PREFIX")
+    # リリース識別子（解決性能レポートに記録し、リリース間の比較に使う）
+    app_version: str = Field("dev", env="APP_VERSION")
+    # PR-perf: 公開情報の事前シリアライズ済みJSON/gzipの保存先（コンテンツアドレス）
+    public_cache_dir: str = Field("/tmp/club-game/public", env="PUBLIC_CACHE_DIR")
+    # PR-perf: 同一形状のSQLが1リクエストでこの回数を超えたらエラー（0で無効）
+    db_n_plus_one_threshold: int = Field(0, env="DB_N_PLUS_ONE_THRESHOLD")
+    # 運用者のメールアドレス（カンマ区切り）。プロセス全体を対象にする診断API（プロファイル・
+    # スロークエリ）はゲームのGMではなくここに列挙されたユーザーだけが使える
+    operator_emails: str = Field("", env="OPERATOR_EMAILS")
+    # PR-perf: ?profile=1 / X-Profile による運用者向けサンプリングプロファイル
+    profile_dir: str = Field("/tmp/club-game/profiles", env="PROFILE_DIR")
+    profile_interval_ms: float = Field(5.0, env="PROFILE_INTERVAL_MS")
+    # PR-perf: ターン解決スパンのJSON Lines出力先
+    trace_dir: str = Field("/tmp/club-game/traces", env="TRACE_DIR")
+    # PR-perf: スロークエリログ（0で無効）と EXPLAIN (ANALYZE, BUFFERS) のサンプリング率
+    slow_query_ms: float = Field(50.0, env="SLOW_QUERY_MS")
+    slow_query_explain_sample: float = Field(0.0, env="SLOW_QUERY_EXPLAIN_SAMPLE")
+    slow_query_buffer_size: int = Field(200, env="SLOW_QUERY_BUFFER_SIZE")
+    # EXPLAIN ANALYZE は遅い文を再実行するため、専用接続にこの statement_timeout を付ける
+    slow_query_explain_timeout_ms: int = Field(5000, env="SLOW_QUERY_EXPLAIN_TIMEOUT_MS")
+    # PR-perf: ターン解決レポートで tracemalloc によるピークメモリを計測するか（既定は無効）。
+    # tracemalloc はプロセス全体に効くため、解決中はそのワーカーの全リクエストの確保が遅くなり、
+    # ピークも同時に動いている他スレッドの確保を含む。調査時に一時的に有効にする
+    resolve_tracemalloc: bool = Field(False, env="RESOLVE_TRACEMALLOC")
+    # PR-perf: コネクションプール（ワーカー数 × (size + overflow) が DB / PgBouncer の上限に収まるよう設定する）
+    db_pool_size: int = Field(5, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, env="DB_POOL_PRE_PING")
+    # 1文あたりのタイムアウト（0で無効）
+    db_statement_timeout_ms: int = Field(0, env="DB_STATEMENT_TIMEOUT_MS")
+    # pg_stat_activity に出る名前（プロセスIDを付与する）
+    db_application_name: str = Field("club-game-api", env="DB_APPLICATION_NAME")
+    # PgBouncer（transaction pooling）経由で接続する場合は true
+    db_pgbouncer: bool = Field(False, env="DB_PGBOUNCER")
+    # PR-perf: SSE イベント配信。LISTEN 用の接続先（PgBouncer 利用時は直接接続のURL、未指定なら DATABASE_URL）
+    events_listen_url: Optional[str] = Field(None, env="EVENTS_LISTEN_URL")
+    # 無通信時に送る SSE コメントの間隔（プロキシのアイドル切断対策）
+    events_keepalive_s: float = Field(15.0, env="EVENTS_KEEPALIVE_S")
+    events_queue_size: int = Field(100, env="EVENTS_QUEUE_SIZE")
+    # long-poll（/turns/seasons/{id}/wait）の最大待ち時間と、イベントが無くても読み直す間隔
+    wait_max_timeout_s: float = Field(60.0, env="WAIT_MAX_TIMEOUT_S")
+    wait_recheck_s: float = Field(5.0, env="WAIT_RECHECK_S")
+    # PR-perf: Accept-Encoding による gzip / brotli 圧縮（この大きさ未満の本文は圧縮しない）
+    compression_min_size: int = Field(1024, env="COMPRESSION_MIN_SIZE")
+    compression_gzip_level: int = Field(6, env="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(5, env="COMPRESSION_BROTLI_QUALITY")
+    # ETag 付きレスポンスの圧縮結果を本文の digest で再利用するキャッシュの上限（0で無効）
+    compression_cache_bytes: int = Field(32 * 1024 * 1024, env="COMPRESSION_CACHE_BYTES")
 
     class Config:
         env_file = ".env"
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
     Integer,
     Numeric,
@@ -142,6 +143,8 @@ class Season(Base):
     status = Column(Enum(SeasonStatus), nullable=False, default=SeasonStatus.setup)
     is_finalized = Column(Boolean, nullable=False, default=False)
     finalized_at = Column(DateTime, nullable=True)
+    # 読み取り系データのキャッシュ検証用（resolve/advance/commit/勝点剥奪で増加）
+    state_version = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     game = relationship("Game", back_populates="seasons")
@@ -658,3 +661,71 @@ class GameFinalResult(Base):
         UniqueConstraint("game_id", "club_id", name="uq_game_club_result"),
     )
 
+
+
+class ClubDashboard(Base):
+    """クラブ別・月次ダッシュボード（finalize_turn_finance 終了時に非正規化して保存）"""
+    __tablename__ = "club_dashboards"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    club_id = Column(UUID(as_uuid=True), ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False)
+    season_id = Column(UUID(as_uuid=True), ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False)
+    turn_id = Column(UUID(as_uuid=True), ForeignKey("turns.id", ondelete="CASCADE"), nullable=False)
+    month_index = Column(Integer, nullable=False)
+
+    # 財務
+    balance = Column(Numeric(14, 2), nullable=False)
+    is_bankrupt = Column(Boolean, nullable=False, default=False)
+    pl_month = Column(JSONB, nullable=False, default=dict)  # 正規化済み kind -> 当月金額
+    pl_season = Column(JSONB, nullable=False, default=dict)  # 正規化済み kind -> シーズン累計
+
+    # ファン
+    fb_count = Column(Integer, nullable=True)
+    followers_public = Column(Integer, nullable=True)
+
+    # スポンサー（get_pipeline_status と同じ形）
+    sponsor_pipeline = Column(JSONB, nullable=True)
+
+    # スタッフ（role -> count）
+    staff_counts = Column(JSONB, nullable=True)
+
+    # 順位・チーム力（公開値）
+    rank = Column(Integer, nullable=True)
+    points = Column(Integer, nullable=True)
+    team_power = Column(Numeric(8, 2), nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    club = relationship("Club")
+    season = relationship("Season")
+    turn = relationship("Turn")
+
+    __table_args__ = (
+        UniqueConstraint("club_id", "season_id", "month_index", name="uq_dashboard_club_season_month"),
+    )
+
+
+class TurnResolveReport(Base):
+    """ターン解決の性能記録（resolve_turn 終了時に1ターン1行、再解決時は上書き）"""
+    __tablename__ = "turn_resolve_reports"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    turn_id = Column(UUID(as_uuid=True), ForeignKey("turns.id", ondelete="CASCADE"), nullable=False, unique=True)
+    season_id = Column(UUID(as_uuid=True), ForeignKey("seasons.id", ondelete="CASCADE"), nullable=False, index=True)
+    season_number = Column(Integer, nullable=True)
+    month_index = Column(Integer, nullable=False)
+
+    total_ms = Column(Float, nullable=False)
+    phases = Column(JSONB, nullable=False, default=dict)  # phase -> {"ms": float, "queries": int}
+    total_queries = Column(Integer, nullable=True)  # リクエスト計測外（バッチ等）では NULL
+    clubs_processed = Column(Integer, nullable=False, default=0)
+    fixtures_processed = Column(Integer, nullable=False, default=0)
+    ledger_rows_written = Column(Integer, nullable=False, default=0)
+    peak_memory_kb = Column(Integer, nullable=True)  # tracemalloc のピーク（無効時は NULL）
+    app_version = Column(String, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    turn = relationship("Turn")
+    season = relationship("Season")
@@ -0,0 +1,163 @@
+"""
+リクエスト単位のSQL発行数・DB時間の計測とN+1検知。
+
+`before_cursor_execute` / `after_cursor_execute` で文数と経過時間を数え、
+`X-DB-Queries` / `X-DB-Time-ms` ヘッダとして返す。`query_phase()` で囲んだ
+区間（ターン解決の各フェーズなど）は個別に集計される。
+
+`DB_N_PLUS_ONE_THRESHOLD` が正の値のとき strict モードとなり、同一形状の
+SQL（バインド値を除いた文）が1リクエスト内でその回数を超えて発行されると
+`RepeatedQueryError` を送出する。
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Queries"
+QUERY_TIME_HEADER = "X-DB-Time-ms"
+QUERY_PHASES_HEADER = "X-DB-Phases"
+
+_WHITESPACE = re.compile(r"\s+")
+# IN句の展開数やリテラル数値の違いで形状が分かれないように潰す
+_IN_LIST = re.compile(r"IN \((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_NUMBER = re.compile(r"\b\d+\b")
+
+
+class RepeatedQueryError(RuntimeError):
+    """strict モードで同一形状のSQLが閾値を超えて繰り返されたときに送出される。"""
+
+
+@dataclass
+class PhaseStats:
+    queries: int = 0
+    time_ms: float = 0.0
+
+
+@dataclass
+class QueryStats:
+    threshold: int = 0
+    queries: int = 0
+    time_ms: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+    phase_stack: List[str] = field(default_factory=list)
+
+    def record(self, elapsed_ms: float) -> None:
+        self.queries += 1
+        self.time_ms += elapsed_ms
+        for name in self.phase_stack:
+            phase = self.phases.setdefault(name, PhaseStats())
+            phase.queries += 1
+            phase.time_ms += elapsed_ms
+
+    def check_shape(self, statement: str) -> None:
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.threshold and self.shapes[shape] > self.threshold:
+            raise RepeatedQueryError(
+                f"Statement repeated {self.shapes[shape]} times in one request "
+                f"(threshold {self.threshold}): {shape[:200]}"
+            )
+
+    def repeated(self, minimum: int = 2) -> Dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count >= minimum}
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            QUERY_COUNT_HEADER: str(self.queries),
+            QUERY_TIME_HEADER: f"{self.time_ms:.1f}",
+        }
+        if self.phases:
+            headers[QUERY_PHASES_HEADER] = ", ".join(
+                f"{name}={stats.queries};{stats.time_ms:.1f}ms" for name, stats in self.phases.items()
+            )
+        return headers
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _IN_LIST.sub("IN (?)", shape)
+    return _NUMBER.sub("?", shape)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(threshold: int = 0) -> Iterator[QueryStats]:
+    """この区間で発行されたSQLを新しい QueryStats に集計する。"""
+    stats = QueryStats(threshold=threshold)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def query_phase(name: str) -> Iterator[None]:
+    """計測中であれば、区間内のSQLを `name` フェーズとしても集計する。"""
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+    stats.phase_stack.append(name)
+    try:
+        yield
+    finally:
+        stats.phase_stack.pop()
+        phase = stats.phases.get(name)
+        if phase is not None:
+            logger.debug("db phase %s: %d queries, %.1f ms", name, phase.queries, phase.time_ms)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.check_shape(statement)
+    context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    start = getattr(context, "_query_stats_start", None)
+    if stats is None or start is None:
+        return
+    stats.record((time.perf_counter() - start) * 1000.0)
+
+
+def install(engine: Engine) -> None:
+    """engine にカウンタ用のイベントリスナを登録する（多重登録はしない）。"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+__all__ = [
+    "QUERY_COUNT_HEADER",
+    "QUERY_TIME_HEADER",
+    "QUERY_PHASES_HEADER",
+    "RepeatedQueryError",
+    "PhaseStats",
+    "QueryStats",
+    "statement_shape",
+    "current_stats",
+    "track_queries",
+    "query_phase",
+    "install",
+]
@@ -1,12 +1,129 @@
-from sqlalchemy import create_engine
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.metrics import instrument_pool
+from app.db import query_stats, slow_queries
 from app.db.base import Base
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, future=True)
+# (pid, 名前)。import 後に fork されたワーカーでは pid が変わるので作り直す
+_application_name: Optional[Tuple[int, str]] = None
+# (pid, 名前)。engine が実際に接続に使った application_name（/api/health 用）
+_connected_application_name: Optional[Tuple[int, str]] = None
+
+
+def application_name(settings: Settings) -> str:
+    """プロセスごとの application_name（pg_stat_activity でワーカーを見分ける）"""
+    global _application_name
+    pid = os.getpid()
+    if _application_name is None or _application_name[0] != pid:
+        _application_name = (pid, f"{settings.db_application_name}:{pid}"[:63])
+    return _application_name[1]
+
+
+def connected_application_name(settings: Settings) -> str:
+    """engine が接続に使った application_name（未接続なら次の接続で使う値）"""
+    connected = _connected_application_name
+    if connected is not None and connected[0] == os.getpid():
+        return connected[1]
+    return application_name(settings)
+
+
+def engine_options(settings: Settings) -> Dict[str, Any]:
+    """
+    Settings から create_engine の引数を組み立てる。
+
+    PostgreSQL では application_name を接続時に渡す（install_application_name が
+    接続ごとにその時点の pid で設定する）。statement_timeout は通常
+    接続オプション（-c statement_timeout=...）で設定するが、PgBouncer の
+    transaction pooling ではセッション単位の設定がサーバー接続に残ってしまい、
+    startup の options も受け付けないため、トランザクションごとに SET LOCAL する
+    （install_statement_timeout）。psycopg (v3) はサーバー側プリペアド文を使うため
+    PgBouncer モードでは無効にする。
+    """
+    url = make_url(settings.database_url)
+    options: Dict[str, Any] = {"future": True}
+    if url.get_backend_name() != "postgresql":
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    connect_args: Dict[str, Any] = {}
+    if settings.db_statement_timeout_ms > 0 and not settings.db_pgbouncer:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    if settings.db_pgbouncer and url.get_driver_name() == "psycopg":
+        connect_args["prepare_threshold"] = None
+    options["connect_args"] = connect_args
+    return options
+
+
+def install_application_name(engine: Engine, settings: Settings) -> None:
+    """接続ごとに application_name を渡す（import 時ではなく接続時の pid を使う）"""
+
+    @event.listens_for(engine, "do_connect")
+    def _set_application_name(dialect, conn_rec, cargs, cparams):
+        global _connected_application_name
+        name = application_name(settings)
+        cparams["application_name"] = name
+        _connected_application_name = (os.getpid(), name)
+
+
+def install_statement_timeout(engine: Engine, timeout_ms: int) -> None:
+    """
+    PgBouncer モード用: トランザクション開始ごとに SET LOCAL statement_timeout を発行する
+
+    SessionLocal だけでなく engine.connect() を直接使う処理にも効くよう、engine の
+    begin イベントに登録する。
+    """
+
+    @event.listens_for(engine, "begin")
+    def _set_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """/api/health 用のプール状況（DBには接続しない）"""
+    pool = engine.pool
+    status: Dict[str, Any] = {"class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            status[name] = method()
+    if "overflow" in status:
+        # QueuePool.overflow() は size 未満の間は負の値になる
+        status["overflow"] = max(status["overflow"], 0)
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if max_overflow is not None and "size" in status:
+        status["max_overflow"] = max_overflow
+        status["capacity"] = status["size"] + max(max_overflow, 0)
+    return status
+
+
+engine = create_engine(settings.database_url, **engine_options(settings))
+if engine.dialect.name == "postgresql":
+    install_application_name(engine, settings)
+    if settings.db_pgbouncer and settings.db_statement_timeout_ms > 0:
+        install_statement_timeout(engine, settings.db_statement_timeout_ms)
+query_stats.install(engine)
+slow_queries.install(
+    engine,
+    threshold_ms=settings.slow_query_ms,
+    explain_sample=settings.slow_query_explain_sample,
+    buffer_size=settings.slow_query_buffer_size,
+    explain_timeout_ms=settings.slow_query_explain_timeout_ms,
+)
+instrument_pool(engine)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 
@@ -19,4 +136,13 @@ def get_db():
         db.close()
 
 
-__all__ = ["engine", "SessionLocal", "get_db", "Base"]
+__all__ = [
+    "engine",
+    "SessionLocal",
+    "get_db",
+    "Base",
+    "application_name",
+    "connected_application_name",
+    "engine_options",
+    "pool_status",
+]
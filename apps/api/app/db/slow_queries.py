@@ -0,0 +1,239 @@
+"""
+スロークエリログ。
+
+`SLOW_QUERY_MS` を超えた文を、正規化SQL・バインドパラメータの形（名前と型のみ、
+値は残さない）・呼び出し元のサービス関数とともにログ出力し、直近
+`SLOW_QUERY_BUFFER_SIZE` 件をリングバッファに保持する（`/api/admin/slow-queries`）。
+
+`SLOW_QUERY_EXPLAIN_SAMPLE`（0〜1）の割合で、SELECT 文については
+`EXPLAIN (ANALYZE, BUFFERS)` を実行し、実行計画もエントリに追記する。EXPLAIN は
+リクエストの外側（バックグラウンドの1スレッド）で、プールを使わない専用接続から
+`SLOW_QUERY_EXPLAIN_TIMEOUT_MS` の statement_timeout 付きで実行する。リクエストが
+プールの接続を余分に占有することはなく、同時に走る EXPLAIN はプロセスあたり1本まで
+（待ちが溢れた分は捨てる）。ANALYZE は文を実際に実行するため、更新系の文には
+行わない。PostgreSQL 以外では計画を取得しない。
+"""
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from app.db.query_stats import statement_shape
+
+logger = logging.getLogger(__name__)
+
+_APP_ROOT = str(Path(__file__).resolve().parent.parent)
+_DB_ROOT = str(Path(__file__).resolve().parent)
+# 呼び出し元として報告するパッケージ（pagination.py などの共有クエリヘルパは飛ばす）
+_CALLER_ROOTS = tuple(os.path.join(_APP_ROOT, name) + os.sep for name in ("routers", "services"))
+
+DEFAULT_BUFFER_SIZE = 200
+DEFAULT_EXPLAIN_TIMEOUT_MS = 5000
+EXPLAIN_QUEUE_SIZE = 20
+
+_buffer: deque = deque(maxlen=DEFAULT_BUFFER_SIZE)
+_lock = threading.Lock()
+# install() で設定される（文ごとに Settings を読まない）
+_threshold_ms = 0.0
+_explain_sample = 0.0
+_explain_timeout_ms = DEFAULT_EXPLAIN_TIMEOUT_MS
+# (engine, 文, パラメータ, エントリ)。_explain_worker が1件ずつ処理する
+_explain_queue: "queue.Queue" = queue.Queue(maxsize=EXPLAIN_QUEUE_SIZE)
+_explain_thread: Optional[threading.Thread] = None
+_explain_engines: Dict[str, Engine] = {}
+# EXPLAIN 自体がスロークエリとして再帰的に計測されないようにする
+_explaining: ContextVar[bool] = ContextVar("slow_query_explaining", default=False)
+
+
+def parameter_shape(parameters) -> Any:
+    """バインド値を型名に置き換える（値はログに残さない）。"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany
+            return {"rows": len(parameters), "row": parameter_shape(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+
+def _describe_frame(frame) -> str:
+    filename = frame.f_code.co_filename
+    return f"{filename[len(_APP_ROOT) + 1:]}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+def _caller() -> Optional[str]:
+    """
+    最も内側の routers / services の呼び出し元
+
+    どちらも無い場合（起動処理など）は app 配下（db パッケージ以外）で最も内側の呼び出し元。
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_CALLER_ROOTS):
+            return _describe_frame(frame)
+        if fallback is None and filename.startswith(_APP_ROOT) and not filename.startswith(_DB_ROOT):
+            fallback = _describe_frame(frame)
+        frame = frame.f_back
+    return fallback
+
+
+def _explain_engine(engine: Engine) -> Engine:
+    """EXPLAIN 専用のプールしない engine（リクエスト用のプールから接続を借りない）"""
+    key = str(engine.url)
+    explain_engine = _explain_engines.get(key)
+    if explain_engine is None:
+        explain_engine = create_engine(engine.url, poolclass=NullPool, future=True)
+        _explain_engines[key] = explain_engine
+    return explain_engine
+
+
+def _explain(engine: Engine, statement: str, parameters) -> Optional[str]:
+    token = _explaining.set(True)
+    try:
+        with _explain_engine(engine).connect() as conn:
+            # ANALYZE は遅い文をもう一度実行するので、必ず上限を付ける（PgBouncer 経由でも効く SET LOCAL）
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(_explain_timeout_ms)}")
+            rows = conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters).all()
+            conn.rollback()
+        return "\n".join(row[0] for row in rows)
+    except Exception:  # 計画取得の失敗で本処理を止めない
+        logger.exception("EXPLAIN failed for slow query")
+        return None
+    finally:
+        _explaining.reset(token)
+
+
+def _explain_worker() -> None:
+    while True:
+        engine, statement, parameters, entry = _explain_queue.get()
+        try:
+            plan = _explain(engine, statement, parameters)
+            with _lock:
+                entry["plan"] = plan
+        finally:
+            _explain_queue.task_done()
+
+
+def _schedule_explain(engine: Engine, statement: str, parameters, entry: Dict[str, Any]) -> None:
+    global _explain_thread
+    if isinstance(parameters, dict):
+        parameters = dict(parameters)
+    elif isinstance(parameters, list):
+        parameters = tuple(parameters)
+    try:
+        _explain_queue.put_nowait((engine, statement, parameters, entry))
+    except queue.Full:
+        logger.info("EXPLAIN queue is full; skipping plan capture")
+        return
+    with _lock:
+        if _explain_thread is None or not _explain_thread.is_alive():
+            _explain_thread = threading.Thread(target=_explain_worker, name="slow-query-explain", daemon=True)
+            _explain_thread.start()
+
+
+def wait_for_explains(timeout: float = 5.0) -> bool:
+    """予約済みの EXPLAIN がすべて終わるまで待つ（テスト・管理用）。時間切れなら False。"""
+    deadline = time.monotonic() + timeout
+    with _explain_queue.all_tasks_done:
+        while _explain_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _explain_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+def _should_explain(engine: Engine, statement: str, executemany: bool, sample_rate: float) -> bool:
+    if executemany or sample_rate <= 0 or engine.dialect.name != "postgresql":
+        return False
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return False
+    return random.random() < sample_rate
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not _explaining.get():
+        context._slow_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_slow_query_start", None)
+    if start is None:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    if _threshold_ms <= 0 or elapsed_ms < _threshold_ms:
+        return
+
+    entry: Dict[str, Any] = {
+        "at": datetime.utcnow().isoformat(),
+        "duration_ms": round(elapsed_ms, 2),
+        "sql": statement_shape(statement),
+        "params": parameter_shape(parameters),
+        "caller": _caller(),
+        "plan": None,
+    }
+    logger.warning(
+        "slow query %.1f ms (%s): %s params=%s",
+        elapsed_ms, entry["caller"], entry["sql"], entry["params"],
+    )
+    with _lock:
+        _buffer.append(entry)
+    if _should_explain(conn.engine, statement, executemany, _explain_sample):
+        _schedule_explain(conn.engine, statement, parameters, entry)
+
+
+def recent_slow_queries(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """新しい順"""
+    with _lock:
+        entries = list(_buffer)
+    entries.reverse()
+    return entries[:limit] if limit else entries
+
+
+def clear_slow_queries() -> None:
+    with _lock:
+        _buffer.clear()
+
+
+def install(
+    engine: Engine,
+    threshold_ms: float,
+    explain_sample: float = 0.0,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    explain_timeout_ms: int = DEFAULT_EXPLAIN_TIMEOUT_MS,
+) -> None:
+    """engine にスロークエリ計測を登録する。threshold_ms <= 0 で無効。"""
+    global _buffer, _threshold_ms, _explain_sample, _explain_timeout_ms
+    _threshold_ms = threshold_ms
+    _explain_sample = explain_sample
+    _explain_timeout_ms = explain_timeout_ms
+    if _buffer.maxlen != buffer_size:
+        with _lock:
+            _buffer = deque(_buffer, maxlen=buffer_size)
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+__all__ = [
+    "parameter_shape",
+    "recent_slow_queries",
+    "clear_slow_queries",
+    "install",
+    "wait_for_explains",
+]
@@ -4,6 +4,7 @@ from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.db.models import Membership, MembershipRole, User
+from app.config import get_settings
 from app.db.session import SessionLocal, get_db
 
 
@@ -54,4 +55,29 @@ def require_role(
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
 
 
-__all__ = ["get_db", "SessionLocal", "get_current_user", "require_role"]
+def is_operator(user_email: Optional[str]) -> bool:
+    """
+    運用者（OPERATOR_EMAILS に列挙）であるか
+
+    プロファイルやスロークエリは全ゲームのリクエストを含むため、誰でもなれる
+    ゲームのGMではなく、設定で指定した運用者だけに許可する。
+    """
+    if not user_email:
+        return False
+    operators = {email.strip().lower() for email in get_settings().operator_emails.split(",") if email.strip()}
+    return user_email.strip().lower() in operators
+
+
+def require_operator(user: User) -> None:
+    if not is_operator(user.email):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Operator role required")
+
+
+__all__ = [
+    "get_db",
+    "SessionLocal",
+    "get_current_user",
+    "require_role",
+    "is_operator",
+    "require_operator",
+]
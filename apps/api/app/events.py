@@ -0,0 +1,381 @@
+"""
+シーズン単位のイベント配信（SSE `/api/seasons/{id}/events` 用の pub/sub）。
+
+書き込み系エンドポイントは commit 前に `publish(db, season_id, type, ...)` を呼ぶ。
+イベントはセッションに積まれ、commit 後（after_commit）に同じプロセスの購読者へ
+配信される。rollback されたイベントは捨てる。
+
+PostgreSQL では同じトランザクション内で `pg_notify` も発行する。NOTIFY は
+commit 時にだけ届くため、他のワーカーは LISTEN スレッド（最初の購読時に起動）
+経由で同じイベントを受け取る。自プロセス発のイベントは origin で見分けて
+二重配信しない。PgBouncer（transaction pooling）では LISTEN できないため、
+`EVENTS_LISTEN_URL` に直接接続のURLを指定する。
+
+購読者ごとのキューは有界で、溢れた場合はキューを捨てて `resync` を1件送る
+（クライアントはREST で状態を取り直す）。
+
+long-poll（`/api/turns/seasons/{id}/wait`）も同じ BUS を購読して待機する
+（wait_for_season_change）。
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event as sa_event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.metrics import SSE_CONNECTIONS, Gauge
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "club_game_events"
+DEFAULT_QUEUE_SIZE = 100
+
+TURN_OPENED = "turn_opened"
+TURN_LOCKED = "turn_locked"
+TURN_RESOLVED = "turn_resolved"
+TURN_ADVANCED = "turn_advanced"
+DECISION_COMMITTED = "decision_committed"
+ACK_RECEIVED = "ack_received"
+DISCLOSURE_PUBLISHED = "disclosure_published"
+RESYNC = "resync"
+
+# 該当クラブのメンバーと GM にだけ配信するイベント
+CLUB_PRIVATE_EVENTS = {DECISION_COMMITTED}
+
+# pg_notify の発行元（自プロセスのイベントを LISTEN で二重に受け取らないため）
+ORIGIN = uuid.uuid4().hex
+
+_PENDING_KEY = "season_events"
+
+
+@dataclass
+class SeasonEvent:
+    type: str
+    season_id: str
+    club_id: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    origin: str = ORIGIN
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"type": self.type, "season_id": self.season_id, "club_id": self.club_id, "data": self.data, "origin": self.origin},
+            separators=(",", ":"),
+            default=str,
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "SeasonEvent":
+        payload = json.loads(raw)
+        return cls(
+            type=payload["type"],
+            season_id=payload["season_id"],
+            club_id=payload.get("club_id"),
+            data=payload.get("data") or {},
+            origin=payload.get("origin", ""),
+        )
+
+    def public_payload(self) -> Dict[str, Any]:
+        """SSE の data 行に載せる内容（origin は内部用なので出さない）"""
+        payload = {"season_id": self.season_id, **self.data}
+        if self.club_id is not None:
+            payload["club_id"] = self.club_id
+        return payload
+
+
+class Subscription:
+    def __init__(
+        self,
+        season_id: str,
+        clubs: Optional[Set[str]],
+        loop: asyncio.AbstractEventLoop,
+        queue_size: int,
+        gauge: Gauge = SSE_CONNECTIONS,
+    ):
+        self.season_id = season_id
+        # None は全クラブ（GM）
+        self.clubs = clubs
+        self.loop = loop
+        self.gauge = gauge
+        self.queue: "asyncio.Queue[SeasonEvent]" = asyncio.Queue(maxsize=queue_size)
+
+    def accepts(self, event: SeasonEvent) -> bool:
+        if event.type not in CLUB_PRIVATE_EVENTS or self.clubs is None:
+            return True
+        return event.club_id in self.clubs
+
+    def _deliver(self, event: SeasonEvent) -> None:
+        # イベントループ上で実行される
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(SeasonEvent(RESYNC, self.season_id))
+
+
+class EventBus:
+    """プロセス内の購読者一覧。dispatch はどのスレッドからでも呼べる。"""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, season_id: str, clubs: Optional[Set[str]] = None, gauge: Gauge = SSE_CONNECTIONS) -> Subscription:
+        """イベントループ上で呼ぶ（gauge は購読数を数えるメトリクス）"""
+        subscription = Subscription(str(season_id), clubs, asyncio.get_running_loop(), self.queue_size, gauge)
+        with self._lock:
+            self._subscriptions.setdefault(subscription.season_id, set()).add(subscription)
+        gauge.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.season_id)
+            if not subscriptions or subscription not in subscriptions:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.season_id]
+        subscription.gauge.dec()
+
+    def subscriber_count(self, season_id: Optional[str] = None) -> int:
+        with self._lock:
+            if season_id is not None:
+                return len(self._subscriptions.get(str(season_id), ()))
+            return sum(len(subs) for subs in self._subscriptions.values())
+
+    def dispatch(self, event: SeasonEvent) -> None:
+        with self._lock:
+            targets = [sub for sub in self._subscriptions.get(event.season_id, ()) if sub.accepts(event)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # ループが既に閉じている（切断済みの購読者）
+                self.unsubscribe(subscription)
+
+
+BUS = EventBus(get_settings().events_queue_size)
+
+
+def publish(db: Session, season_id, event_type: str, club_id=None, **data: Any) -> SeasonEvent:
+    """
+    イベントを現在のトランザクションに積む（commit 後に配信、rollback で破棄）。
+
+    PostgreSQL では pg_notify も同じトランザクションで発行し、他ワーカーへ届ける。
+    """
+    season_event = SeasonEvent(
+        type=event_type,
+        season_id=str(season_id),
+        club_id=str(club_id) if club_id is not None else None,
+        data=data,
+    )
+    # トランザクションを確実に開始しておく（rollback 時に after_rollback が発火するように）
+    connection = db.connection()
+    db.info.setdefault(_PENDING_KEY, []).append(season_event)
+    if connection.dialect.name == "postgresql":
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": season_event.to_json()})
+    return season_event
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _dispatch_pending(session: Session) -> None:
+    for season_event in session.info.pop(_PENDING_KEY, ()):
+        BUS.dispatch(season_event)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+class PgListener:
+    """
+    専用コネクションで LISTEN し、他ワーカー発のイベントを BUS に流すデーモンスレッド。
+
+    接続が切れた場合は待ってから再接続する（その間のイベントは失われるので、
+    再接続時には全購読者に resync を送る）。psycopg2 専用。
+    """
+
+    POLL_TIMEOUT_S = 5.0
+    RECONNECT_DELAY_S = 2.0
+
+    def __init__(self, url: str, bus: EventBus = BUS):
+        self.url = make_url(url)
+        self.bus = bus
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._connected_once = False
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pg-event-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _connect(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        args = self.url.translate_connect_args(username="user", database="dbname")
+        conn = psycopg2.connect(application_name="club-game-events", **args)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        return conn
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn = self._connect()
+            except Exception:
+                logger.exception("event listener could not connect; retrying")
+                self._stop.wait(self.RECONNECT_DELAY_S)
+                continue
+            if self._connected_once:
+                self._resync_all()
+            self._connected_once = True
+            try:
+                self._listen(conn)
+            except Exception:
+                logger.exception("event listener connection lost; reconnecting")
+            finally:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+    def _listen(self, conn) -> None:
+        while not self._stop.is_set():
+            if select.select([conn], [], [], self.POLL_TIMEOUT_S) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                self.handle(notify.payload)
+
+    def handle(self, payload: str) -> None:
+        try:
+            season_event = SeasonEvent.from_json(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("ignoring malformed event notification: %.200s", payload)
+            return
+        if season_event.origin != ORIGIN:
+            self.bus.dispatch(season_event)
+
+    def _resync_all(self) -> None:
+        with self.bus._lock:
+            season_ids = list(self.bus._subscriptions)
+        for season_id in season_ids:
+            self.bus.dispatch(SeasonEvent(RESYNC, season_id))
+
+
+_listener: Optional[PgListener] = None
+_listener_lock = threading.Lock()
+
+
+def ensure_listener(url: str) -> Optional[PgListener]:
+    """PostgreSQL(psycopg2) の場合だけ LISTEN スレッドを起動する（プロセスに1本）"""
+    global _listener
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql" or parsed.get_driver_name() != "psycopg2":
+        return None
+    with _listener_lock:
+        if _listener is None:
+            _listener = PgListener(url)
+        _listener.start()
+        return _listener
+
+
+async def wait_for_season_change(
+    season_id: str,
+    after_version: int,
+    timeout_s: float,
+    read_state: Callable[[], Dict[str, Any]],
+    recheck_s: float,
+    gauge: Gauge,
+    bus: Optional[EventBus] = None,
+    after_acks: Optional[int] = None,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    state_version が after_version を超えるか timeout_s が過ぎるまで待つ（long-poll 用）。
+
+    after_acks を渡すと、state_version が同じでも ack_count（現在のターンの ACK 数）が
+    変わった時点で返す。ACK はシーズンの ETag を無効にしないよう state_version を進めない。
+
+    read_state は短いセッションで {"state_version": ..., ...} を読む同期関数で、
+    スレッドプールで実行する。待機中は DB コネクションを持たず、シーズンの
+    イベントで起きて読み直す。イベントを伴わない更新（勝点剥奪など）も拾えるよう
+    recheck_s ごとにも読み直す。
+
+    Returns: (state, changed)
+    """
+    bus = bus or BUS
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_s
+    # 読み取りとの間に発生したイベントを取りこぼさないよう、先に購読する
+    subscription = bus.subscribe(season_id, None, gauge)
+    try:
+        while True:
+            state = await run_in_threadpool(read_state)
+            if season_state_changed(state, after_version, after_acks):
+                return state, True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return state, False
+            try:
+                await asyncio.wait_for(subscription.queue.get(), timeout=min(remaining, recheck_s))
+            except asyncio.TimeoutError:
+                pass
+            # まとめて届いたイベントは1回の読み直しで足りる
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+    finally:
+        bus.unsubscribe(subscription)
+
+
+def season_state_changed(state: Dict[str, Any], after_version: int, after_acks: Optional[int] = None) -> bool:
+    if state["state_version"] > after_version:
+        return True
+    return after_acks is not None and state.get("ack_count") != after_acks
+
+
+def format_sse(event_type: str, payload: Any) -> str:
+    """SSE のイベント1件分（data は1行のJSON）"""
+    return f"event: {event_type}\ndata: {json.dumps(payload, separators=(',', ':'), default=str)}\n\n"
+
+
+__all__ = [
+    "BUS",
+    "CHANNEL",
+    "EventBus",
+    "PgListener",
+    "SeasonEvent",
+    "Subscription",
+    "ensure_listener",
+    "format_sse",
+    "publish",
+    "season_state_changed",
+    "wait_for_season_change",
+    "TURN_OPENED",
+    "TURN_LOCKED",
+    "TURN_RESOLVED",
+    "TURN_ADVANCED",
+    "DECISION_COMMITTED",
+    "ACK_RECEIVED",
+    "DISCLOSURE_PUBLISHED",
+    "RESYNC",
+]
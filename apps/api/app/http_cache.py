@@ -0,0 +1,61 @@
+"""
+HTTP caching helpers (ETag / If-None-Match).
+
+Read endpoints derive a weak ETag from `Season.state_version` and return
+304 Not Modified before running any heavy query when the client already
+holds the current representation.
+
+Per-club bodies are only visible to some users, so they are marked
+`Cache-Control: private` with `Vary: X-User-Email`; a shared cache must not
+serve one club's data to another user.
+"""
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.db.models import Season
+
+PRIVATE_HEADERS = {"Cache-Control": "private", "Vary": "X-User-Email"}
+
+
+def season_etag(season: Season, scope: str = "") -> str:
+    """Build a weak ETag for season-scoped data."""
+    version = season.state_version or 0
+    tag = f"{season.id}-{version}"
+    if scope:
+        tag = f"{scope}-{tag}"
+    return f'W/"{tag}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in candidates:
+        candidate_bare = candidate[2:] if candidate.startswith("W/") else candidate
+        if candidate_bare == bare:
+            return True
+    return False
+
+
+def not_modified(request: Request, response: Response, etag: str, private: bool = False) -> Optional[Response]:
+    """
+    Attach `etag` to the outgoing response and short-circuit if it matches.
+
+    Returns a 304 response when the request's If-None-Match matches `etag`;
+    otherwise sets the ETag header on `response` and returns None so the
+    endpoint continues with its normal work. With `private=True` both
+    responses also carry PRIVATE_HEADERS.
+    """
+    headers = {"ETag": etag, **(PRIVATE_HEADERS if private else {})}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    for name, value in headers.items():
+        response.headers[name] = value
+    return None
+
+
+__all__ = ["season_etag", "not_modified"]
@@ -1,14 +1,88 @@
-from fastapi import FastAPI
+import time
 
+from fastapi import FastAPI, Request
+from starlette.concurrency import run_in_threadpool
+
+from .compression import CompressionMiddleware
 from .config import get_settings
-from .routers import finance, games, health, seasons, turns, finance_structural, management, fanbase, sponsors, bankruptcy, disclosures, clubs
+from .db.query_stats import track_queries
+from .dependencies import is_operator
+from .metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+from .responses import FastJSONResponse, NegotiationMiddleware
+from .profiling import PROFILE_ID_HEADER, profile_request_finish, profile_request_start, profiling_requested
+from .routers import finance, games, health, seasons, turns, finance_structural, management, fanbase, sponsors, bankruptcy, disclosures, clubs, public_cache, metrics, admin, events
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name)
+# PR-perf: orjson で直列化し、Accept: application/msgpack には msgpack で返す
+app = FastAPI(title=settings.app_name, default_response_class=FastJSONResponse)
+
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    # PR-perf: 運用者が ?profile=1 / X-Profile を付けたリクエストだけをサンプリング計測
+    if not profiling_requested(request) or not is_operator(request.headers.get("x-user-email")):
+        return await call_next(request)
+
+    profiler = profile_request_start()
+    start = time.perf_counter()
+    response = None
+    try:
+        response = await call_next(request)
+    finally:
+        meta = {
+            "method": request.method,
+            "path": request.url.path,
+            "status": response.status_code if response is not None else 500,
+            "duration_ms": round((time.perf_counter() - start) * 1000.0, 1),
+        }
+        profile_id = await run_in_threadpool(profile_request_finish, profiler, meta)
+    if profile_id:
+        response.headers[PROFILE_ID_HEADER] = profile_id
+    return response
+
+
+@app.middleware("http")
+async def count_db_queries(request: Request, call_next):
+    # PR-perf: リクエスト単位のSQL発行数とDB時間をヘッダで返す
+    with track_queries(settings.db_n_plus_one_threshold) as stats:
+        response = await call_next(request)
+    response.headers.update(stats.headers())
+    return response
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    # PR-perf: ルートテンプレート単位のレイテンシと同時処理数
+    HTTP_REQUESTS_IN_FLIGHT.inc(method=request.method)
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        HTTP_REQUESTS_IN_FLIGHT.dec(method=request.method)
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status_code,
+        )
+
+
+# 最後に追加したミドルウェアが最も外側になる。NegotiationMiddleware は上の
+# @app.middleware より外側にあり、全リクエストの Accept を記録する
+app.add_middleware(NegotiationMiddleware)
+# PR-perf: 最も外側。他のミドルウェアがヘッダを付け終えた最終的な本文を
+# Accept-Encoding に応じて圧縮する
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(health.router, prefix=settings.api_prefix)
 app.include_router(games.router, prefix=settings.api_prefix)
 app.include_router(seasons.router, prefix=settings.api_prefix)
+app.include_router(events.router, prefix=settings.api_prefix)  # PR-perf: SSE /seasons/{id}/events
 app.include_router(turns.router, prefix=settings.api_prefix)
 app.include_router(finance.router, prefix=settings.api_prefix)
 app.include_router(finance_structural.router, prefix=settings.api_prefix)
@@ -18,6 +92,9 @@ app.include_router(sponsors.router, prefix=settings.api_prefix)
 app.include_router(bankruptcy.router)  # PR8: 債務超過関連API
 app.include_router(disclosures.router, prefix=settings.api_prefix)  # PR9: 情報公開イベントAPI
 app.include_router(clubs.router, prefix=settings.api_prefix)
+app.include_router(public_cache.router, prefix=settings.api_prefix)
+app.include_router(metrics.router, prefix=settings.api_prefix)
+app.include_router(admin.router, prefix=settings.api_prefix)
 
 
 @app.get("/")
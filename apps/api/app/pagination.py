@@ -0,0 +1,187 @@
+"""
+Keyset (cursor) pagination and `fields=` projection for list endpoints.
+
+List endpoints keep returning a plain JSON array so existing clients are
+unaffected. When `limit` is given, at most that many rows are returned and
+the cursor for the next page is sent in the `X-Next-Cursor` header. Pass it
+back as `cursor=` to continue after the last row. Rows are ordered by a
+composite key such as (season_number, month_index, id), and the next page
+is selected with a row-value comparison, so deep pages cost the same as
+the first.
+
+`fields=a,b,c` restricts both the SELECT list and the response objects to
+the requested columns.
+"""
+import base64
+import json
+import uuid
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import literal, select, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.responses import FastJSONResponse
+
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([str(v) if not isinstance(v, (int, float)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _coerce_key(value: Any, column: ColumnElement) -> Any:
+    """Convert one decoded cursor value to the Python type of its order_by column."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if isinstance(value, bool):
+        raise ValueError("boolean cursor value")
+    if python_type is int:
+        if not isinstance(value, int):
+            raise ValueError("expected an integer")
+        return value
+    if python_type is float:
+        if not isinstance(value, (int, float)):
+            raise ValueError("expected a number")
+        return value
+    if python_type is Decimal:
+        # encode_cursor writes Decimals as strings
+        return Decimal(str(value))
+    if not isinstance(value, str):
+        raise ValueError("expected a string")
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return value
+
+
+def decode_cursor(cursor: str, size: int, order_by: Optional[Sequence[ColumnElement]] = None) -> List[Any]:
+    """
+    Decode a cursor into its key values.
+
+    With `order_by`, each value is checked against its column type so a
+    tampered cursor fails as 400 instead of reaching the database.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+    if not isinstance(values, list) or len(values) != size:
+        raise _invalid_cursor()
+    if order_by is not None:
+        try:
+            values = [_coerce_key(value, col) for value, col in zip(values, order_by)]
+        except (ValueError, TypeError, InvalidOperation):
+            raise _invalid_cursor()
+    return values
+
+
+def parse_fields(fields: Optional[str], available: Sequence[str]) -> List[str]:
+    """Validate a comma-separated `fields=` value; None selects every field."""
+    if not fields:
+        return list(available)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)} (available: {', '.join(available)})",
+        )
+    return requested
+
+
+def keyset_select(
+    db: Session,
+    columns: Dict[str, ColumnElement],
+    order_by: Sequence[ColumnElement],
+    *,
+    from_clause,
+    where: Sequence[ColumnElement] = (),
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    converters: Optional[Dict[str, Callable[[Any], Any]]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Run a Core SELECT of only the requested `columns`, paged by `order_by`.
+
+    Returns (rows, next_cursor). `next_cursor` is None on the last page or
+    when `limit` is not given.
+    """
+    selected = parse_fields(fields, list(columns))
+    key_labels = [f"_key{i}" for i in range(len(order_by))]
+
+    stmt = select(
+        *[columns[name].label(name) for name in selected],
+        *[col.label(label) for col, label in zip(order_by, key_labels)],
+    ).select_from(from_clause)
+    for clause in where:
+        stmt = stmt.where(clause)
+
+    if cursor:
+        values = decode_cursor(cursor, len(order_by), order_by)
+        key = tuple_(*order_by)
+        bound = tuple_(*[literal(value, col.type) for value, col in zip(values, order_by)])
+        stmt = stmt.where(key < bound if descending else key > bound)
+
+    stmt = stmt.order_by(*[col.desc() if descending else col.asc() for col in order_by])
+    if limit is not None:
+        stmt = stmt.limit(min(limit, MAX_PAGE_SIZE) + 1)
+
+    result = db.execute(stmt).mappings().all()
+
+    next_cursor = None
+    if limit is not None and len(result) > min(limit, MAX_PAGE_SIZE):
+        result = result[: min(limit, MAX_PAGE_SIZE)]
+        last = result[-1]
+        next_cursor = encode_cursor([last[label] for label in key_labels])
+
+    converters = converters or {}
+    rows = []
+    for record in result:
+        row = {}
+        for name in selected:
+            value = record[name]
+            if name in converters and value is not None:
+                value = converters[name](value)
+            row[name] = value
+        rows.append(row)
+    return rows, next_cursor
+
+
+def page_response(response: Response, rows: List[Dict[str, Any]], next_cursor: Optional[str], projected: bool):
+    """
+    Attach the next-page cursor and return the rows.
+
+    Projected rows (`fields=` given) do not satisfy the endpoint's
+    response_model, so they are returned as a FastJSONResponse that carries over
+    headers already set on `response` (e.g. ETag).
+    """
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if not projected:
+        return rows
+    headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+    return FastJSONResponse(content=rows, headers=headers)
+
+
+__all__ = [
+    "MAX_PAGE_SIZE",
+    "NEXT_CURSOR_HEADER",
+    "encode_cursor",
+    "decode_cursor",
+    "parse_fields",
+    "keyset_select",
+    "page_response",
+]
@@ -0,0 +1,176 @@
+"""
+運用者向けのオンデマンド・プロファイリング。
+
+`?profile=1` または `X-Profile: 1` 付きのリクエストを、運用者（OPERATOR_EMAILS）が送った場合に限り
+サンプリングプロファイラで計測する。FastAPI の同期エンドポイントは
+スレッドプールで実行されるため、イベントループ側で cProfile を有効にしても
+処理本体は捕捉できない。そこで別スレッドから `sys._current_frames()` を
+一定間隔で読み、app パッケージのフレームを含むスタックだけを集計する。
+同時に処理中の別リクエストのスタックも混ざりうる点に注意。
+
+結果は PROFILE_DIR に collapsed-stack 形式（`a;b;c count`、flamegraph.pl /
+speedscope でそのまま読める）とメタデータJSONで保存し、レスポンスの
+`X-Profile-Id` でIDを返す。`GET /api/admin/profiles/{id}` が累積ホットスポットを返す。
+"""
+import json
+import logging
+import re
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_APP_ROOT = str(Path(__file__).resolve().parent)
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def profiling_requested(request) -> bool:
+    flag = request.query_params.get(PROFILE_QUERY_PARAM) or request.headers.get(PROFILE_HEADER)
+    return flag is not None and flag.lower() in ("1", "true", "yes")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_APP_ROOT):
+        filename = "app" + filename[len(_APP_ROOT):]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """別スレッドから他スレッドのスタックを定期的に採取する。"""
+
+    def __init__(self, interval: float, exclude_thread_ids=()):
+        self.interval = interval
+        self.exclude = set(exclude_thread_ids)
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self.exclude.add(threading.get_ident())
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        self.exclude.add(threading.get_ident())
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in self.exclude:
+                    continue
+                stack = []
+                in_app = False
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    in_app = in_app or frame.f_code.co_filename.startswith(_APP_ROOT)
+                    frame = frame.f_back
+                if not in_app:
+                    # アイドル中のワーカースレッドなど
+                    continue
+                self.stacks[";".join(reversed(stack))] += 1
+                self.samples += 1
+
+
+def _profile_dir() -> Path:
+    return Path(get_settings().profile_dir)
+
+
+def save_profile(profiler: SamplingProfiler, meta: Dict[str, Any]) -> str:
+    profile_id = uuid.uuid4().hex
+    directory = _profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    collapsed = "\n".join(f"{stack} {count}" for stack, count in profiler.stacks.most_common())
+    (directory / f"{profile_id}.collapsed").write_text(collapsed + "\n", encoding="utf-8")
+    meta = {
+        **meta,
+        "id": profile_id,
+        "samples": profiler.samples,
+        "interval_ms": profiler.interval * 1000.0,
+        "created_at": datetime.utcnow().isoformat(),
+    }
+    (directory / f"{profile_id}.json").write_text(json.dumps(meta), encoding="utf-8")
+    return profile_id
+
+
+def load_hotspots(profile_id: str, top: int = 20) -> Optional[Dict[str, Any]]:
+    """保存済みプロファイルから累積サンプル数の多い関数 top 件を返す。"""
+    if not _PROFILE_ID.match(profile_id):
+        return None
+    directory = _profile_dir()
+    meta_path = directory / f"{profile_id}.json"
+    stacks_path = directory / f"{profile_id}.collapsed"
+    if not meta_path.exists() or not stacks_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+
+    cumulative: Counter = Counter()
+    own: Counter = Counter()
+    total = 0
+    for line in stacks_path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        stack, _, count_text = line.rpartition(" ")
+        count = int(count_text)
+        frames = stack.split(";")
+        total += count
+        own[frames[-1]] += count
+        # 再帰で同じ関数が複数回現れても1回と数える
+        for frame in set(frames):
+            cumulative[frame] += count
+
+    interval_ms = meta.get("interval_ms", 0.0)
+    hotspots: List[Dict[str, Any]] = [
+        {
+            "function": function,
+            "cumulative_samples": count,
+            "cumulative_pct": round(100.0 * count / total, 1) if total else 0.0,
+            "self_samples": own.get(function, 0),
+            "estimated_cumulative_ms": round(count * interval_ms, 1),
+        }
+        for function, count in cumulative.most_common(top)
+    ]
+    return {**meta, "hotspots": hotspots}
+
+
+def profile_request_start() -> SamplingProfiler:
+    settings = get_settings()
+    profiler = SamplingProfiler(settings.profile_interval_ms / 1000.0)
+    profiler.start()
+    return profiler
+
+
+def profile_request_finish(profiler: SamplingProfiler, meta: Dict[str, Any]) -> Optional[str]:
+    profiler.stop()
+    try:
+        return save_profile(profiler, meta)
+    except OSError:
+        logger.exception("Failed to write profile")
+        return None
+
+
+__all__ = [
+    "PROFILE_QUERY_PARAM",
+    "PROFILE_HEADER",
+    "PROFILE_ID_HEADER",
+    "SamplingProfiler",
+    "profiling_requested",
+    "save_profile",
+    "load_hotspots",
+    "profile_request_start",
+    "profile_request_finish",
+]
@@ -0,0 +1,156 @@
+"""
+レスポンスのエンコード（orjson による JSON と、Accept による msgpack の切り替え）
+
+FastAPI の既定レスポンスクラスを FastJSONResponse に差し替え、json.dumps の代わりに
+orjson で直列化する（orjson が無い環境では標準の json にフォールバック）。Decimal /
+UUID / datetime / Enum もそのまま渡せるので、jsonable_encoder を通す必要はない。
+
+リクエストの Accept が application/msgpack を JSON 以上に優先していて、msgpack が
+インストールされている場合は同じ内容を msgpack で返す（`Vary: Accept` を付ける）。
+Accept は NegotiationMiddleware が contextvar に記録する。エラー応答は常に JSON。
+"""
+import json
+from contextvars import ContextVar
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson は requirements.txt に含まれる
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+
+_accept: ContextVar[str] = ContextVar("response_accept", default="")
+
+
+def encode_default(value: Any) -> Any:
+    """orjson / msgpack / json が直接扱えない値の変換（jsonable_encoder と同じ表現）"""
+    if isinstance(value, Decimal):
+        # 整数値は int、それ以外は float（fastapi.encoders.decimal_encoder と同じ）
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def render_json(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=encode_default).encode("utf-8")
+
+
+def render_msgpack(content: Any) -> bytes:
+    return msgpack.packb(content, default=encode_default, use_bin_type=True)
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.strip().partition("=")
+        if name == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """Accept で msgpack が JSON（application/json・*/*）と同等以上に優先されているか"""
+    msgpack_q = json_q = 0.0
+    for item in accept.split(","):
+        media_type, _, params = item.strip().partition(";")
+        media_type = media_type.strip().lower()
+        q = _quality(params)
+        if media_type in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            json_q = max(json_q, q)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson で直列化し、Accept に応じて msgpack で返す既定レスポンス"""
+
+    media_type = JSON_MEDIA_TYPE
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        negotiable = media_type is None and msgpack is not None
+        if negotiable and prefers_msgpack(_accept.get()):
+            media_type = MSGPACK_MEDIA_TYPE
+        super().__init__(content, status_code, headers, media_type, background)
+        if negotiable:
+            vary = self.headers.get("vary")
+            self.headers["Vary"] = f"{vary}, Accept" if vary else "Accept"
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return render_msgpack(content)
+        return render_json(content)
+
+
+class NegotiationMiddleware:
+    """リクエストの Accept を contextvar に記録する（FastJSONResponse が参照する）"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope.get("headers") or ():
+            if name == b"accept":
+                accept = value.decode("latin-1")
+                break
+        token = _accept.set(accept)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _accept.reset(token)
+
+
+__all__ = [
+    "FastJSONResponse",
+    "MSGPACK_MEDIA_TYPE",
+    "NegotiationMiddleware",
+    "encode_default",
+    "msgpack_available",
+    "prefers_msgpack",
+    "render_json",
+    "render_msgpack",
+]
@@ -0,0 +1,60 @@
+"""
+運用・診断用API（ターンのトレースはそのゲームのGM、プロセス全体の診断は運用者のみ）
+"""
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.db.slow_queries import clear_slow_queries, recent_slow_queries
+from app.db.models import MembershipRole, Turn
+from app.dependencies import get_current_user, get_db, require_operator, require_role
+from app.profiling import load_hotspots
+from app.tracing import load_trace
+
+# Prefix is provided via main.py include_router(prefix=settings.api_prefix)
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(
+    profile_id: str,
+    top: int = Query(20, ge=1, le=200),
+    user=Depends(get_current_user),
+):
+    """?profile=1 で採取したプロファイルの累積ホットスポット上位 top 件"""
+    require_operator(user)
+    profile = load_hotspots(profile_id, top)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return profile
+
+
+@router.get("/traces/turns/{turn_id}")
+def get_turn_trace(turn_id: UUID, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    """直近のターン解決で記録したスパン一覧（JSON Lines を配列で返す）"""
+    turn = db.query(Turn).filter(Turn.id == turn_id).first()
+    if not turn:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Turn not found")
+    # そのターンのゲームのGMに限る（別ゲームのGMには見せない）
+    require_role(user, db, turn.season.game_id, MembershipRole.gm)
+    spans = load_trace(turn_id)
+    if spans is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Trace not found")
+    return spans
+
+
+@router.get("/slow-queries")
+def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    user=Depends(get_current_user),
+):
+    """SLOW_QUERY_MS を超えた直近の文（新しい順、プロセス単位・全ゲーム分なので運用者のみ）"""
+    require_operator(user)
+    return recent_slow_queries(limit)
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def reset_slow_queries(user=Depends(get_current_user)):
+    require_operator(user)
+    clear_slow_queries()
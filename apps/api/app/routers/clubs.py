@@ -1,19 +1,46 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.dependencies import get_current_user, get_db, require_role
 from app.db.models import Club, MembershipRole, Season, SeasonFinalStanding, User
-from app.schemas import ClubFinalStandingRead
+from app.http_cache import not_modified, season_etag
+from app.pagination import MAX_PAGE_SIZE, keyset_select, page_response
+from app.schemas import ClubDashboardRead, ClubFinalStandingRead
+from app.services import dashboard as dashboard_service
+from app.services.finance import order_pl_items
 
 router = APIRouter(prefix="/clubs", tags=["clubs"])
 
 
+# Columns of a club's final standings rows (one per finalized season)
+FINAL_STANDING_COLUMNS = {
+    "season_id": Season.id,
+    "season_number": Season.season_number,
+    "year_label": Season.year_label,
+    "finalized_at": Season.finalized_at,
+    "club_id": SeasonFinalStanding.club_id,
+    "club_name": Club.name,
+    "rank": SeasonFinalStanding.rank,
+    "points": SeasonFinalStanding.points,
+    "played": SeasonFinalStanding.played,
+    "won": SeasonFinalStanding.won,
+    "drawn": SeasonFinalStanding.drawn,
+    "lost": SeasonFinalStanding.lost,
+    "gf": SeasonFinalStanding.gf,
+    "ga": SeasonFinalStanding.ga,
+    "gd": SeasonFinalStanding.gd,
+}
+
+
 @router.get("/{club_id}/final-standings", response_model=List[ClubFinalStandingRead])
 def get_club_final_standings(
     club_id: UUID,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -23,37 +50,64 @@ def get_club_final_standings(
 
     require_role(user, db, str(club.game_id), MembershipRole.club_viewer)
 
-    rows = (
-        db.query(SeasonFinalStanding, Season)
-        .join(Season, Season.id == SeasonFinalStanding.season_id)
-        .filter(
-            SeasonFinalStanding.club_id == club_id,
-            Season.is_finalized == True,
-        )
-        .order_by(Season.season_number)
-        .all()
+    rows, next_cursor = keyset_select(
+        db,
+        FINAL_STANDING_COLUMNS,
+        (Season.season_number, SeasonFinalStanding.id),
+        from_clause=SeasonFinalStanding.__table__.join(Season, Season.id == SeasonFinalStanding.season_id).join(
+            Club, Club.id == SeasonFinalStanding.club_id
+        ),
+        where=[SeasonFinalStanding.club_id == club_id, Season.is_finalized == True],  # noqa: E712
+        limit=limit,
+        cursor=cursor,
     )
+    return page_response(response, rows, next_cursor, projected=False)
 
-    results: List[ClubFinalStandingRead] = []
-    for standing, season in rows:
-        results.append(
-            ClubFinalStandingRead(
-                season_id=season.id,
-                season_number=season.season_number,
-                year_label=season.year_label,
-                finalized_at=season.finalized_at,
-                club_id=standing.club_id,
-                club_name=club.name,
-                rank=standing.rank,
-                points=standing.points,
-                played=standing.played,
-                won=standing.won,
-                drawn=standing.drawn,
-                lost=standing.lost,
-                gf=standing.gf,
-                ga=standing.ga,
-                gd=standing.gd,
-            )
-        )
-
-    return results
+
+@router.get("/{club_id}/dashboard", response_model=ClubDashboardRead)
+def get_club_dashboard(
+    club_id: UUID,
+    season_id: UUID,
+    request: Request,
+    response: Response,
+    month_index: Optional[int] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """残高・PL・ファン・スポンサー・スタッフ・順位・チーム力をまとめて返す（省略時は最新月）"""
+    club = db.query(Club).filter(Club.id == club_id).first()
+    if not club:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Club not found")
+
+    # fb_count は非公開変数のため /fanbase と同じくオーナー権限
+    require_role(user, db, str(club.game_id), MembershipRole.club_owner, club_id)
+
+    season = db.query(Season).filter(Season.id == season_id, Season.game_id == club.game_id).first()
+    if not season:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
+    cached = not_modified(request, response, season_etag(season, "dashboard"), private=True)
+    if cached:
+        return cached
+
+    row = dashboard_service.get_dashboard(db, club_id, season_id, month_index)
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dashboard not available yet")
+
+    return ClubDashboardRead(
+        club_id=row.club_id,
+        season_id=row.season_id,
+        turn_id=row.turn_id,
+        month_index=row.month_index,
+        balance=float(row.balance),
+        is_bankrupt=row.is_bankrupt,
+        pl_month=order_pl_items(row.pl_month or {}),
+        pl_season=order_pl_items(row.pl_season or {}),
+        fb_count=row.fb_count,
+        followers_public=row.followers_public,
+        sponsor_pipeline=row.sponsor_pipeline,
+        staff_counts=row.staff_counts,
+        rank=row.rank,
+        points=row.points,
+        team_power=float(row.team_power) if row.team_power is not None else None,
+        updated_at=row.updated_at,
+    )
@@ -2,13 +2,14 @@
 PR9: 情報公開イベントと最終結果表示API
 v1Spec Section 1.2, 4, 13
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List, Optional
 
 from app.db.session import get_db
 from app.db.models import Season, Game, Turn
+from app.http_cache import not_modified, season_etag
 from app.schemas import (
     PublicDisclosureRead,
     ExtendedStandingsEntry,
@@ -30,6 +31,8 @@ router = APIRouter(tags=["disclosures"])
 @router.get("/seasons/{season_id}/disclosures", response_model=List[PublicDisclosureRead])
 def get_all_disclosures(
     season_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -38,6 +41,9 @@ def get_all_disclosures(
     season = db.query(Season).filter(Season.id == season_id).first()
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
+    cached = not_modified(request, response, season_etag(season, "disclosures"))
+    if cached:
+        return cached
     
     disclosures = disclosure_service.get_all_disclosures(db, season_id)
     return disclosures
@@ -47,6 +53,8 @@ def get_all_disclosures(
 def get_disclosure_by_type(
     season_id: UUID,
     disclosure_type: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -60,6 +68,9 @@ def get_disclosure_by_type(
     season = db.query(Season).filter(Season.id == season_id).first()
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
+    cached = not_modified(request, response, season_etag(season, "disclosures"))
+    if cached:
+        return cached
     
     disclosure = disclosure_service.get_latest_disclosure(db, season_id, disclosure_type)
     if not disclosure:
@@ -71,6 +82,8 @@ def get_disclosure_by_type(
 @router.get("/seasons/{season_id}/team-power")
 def get_team_power(
     season_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -83,6 +96,9 @@ def get_team_power(
     season = db.query(Season).filter(Season.id == season_id).first()
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
+    cached = not_modified(request, response, season_etag(season, "team-power"))
+    if cached:
+        return cached
     
     # 7月公開を優先、なければ12月公開、さらに引き継ぎ（7月公開値）を参照
     july_disclosure = disclosure_service.get_latest_disclosure(
@@ -113,6 +129,8 @@ def get_team_power(
 @router.get("/seasons/{season_id}/standings/extended", response_model=List[ExtendedStandingsEntry])
 def get_extended_standings(
     season_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """
@@ -125,6 +143,9 @@ def get_extended_standings(
     season = db.query(Season).filter(Season.id == season_id).first()
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
+    cached = not_modified(request, response, season_etag(season, "standings"))
+    if cached:
+        return cached
     
     calculator = StandingsCalculator(db, season_id)
     standings = calculator.calculate_with_may_extras()
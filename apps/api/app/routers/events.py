@@ -0,0 +1,146 @@
+"""
+シーズンのイベントストリーム（Server-Sent Events）
+
+`GET /api/seasons/{season_id}/events` はターンの open / lock / resolve / advance、
+決定の commit（該当クラブと GM のみ）、ACK、情報公開を push する。接続直後に
+現在のターンと state_version を `snapshot` として送るため、クライアントは
+ポーリングせずに状態を追える。
+
+ストリーム中は DB コネクションを保持しない（認可とスナップショットはそれぞれ
+短いセッションで読む）。スナップショットは購読を始めてから読むので、その間に
+commit された遷移もキューに残り、取りこぼさない（wait_for_season_change と同じ順序）。
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.db.models import Membership, MembershipRole, Season, Turn, TurnState
+from app.db.session import SessionLocal
+from app.dependencies import get_current_user, require_role
+from app.events import BUS, Subscription, ensure_listener, format_sse
+
+router = APIRouter(prefix="/seasons", tags=["events"])
+
+# ブラウザの EventSource が再接続するまでの待ち時間
+RETRY_MS = 3000
+
+
+def _turn_snapshot(turn: Optional[Turn]) -> Optional[Dict[str, Any]]:
+    if turn is None:
+        return None
+    return {
+        "turn_id": str(turn.id),
+        "month_index": turn.month_index,
+        "month_name": turn.month_name,
+        "turn_state": turn.turn_state.value if hasattr(turn.turn_state, "value") else turn.turn_state,
+    }
+
+
+def authorize_season_stream(
+    season_id: str,
+    user_email: Optional[str],
+    user_name: Optional[str] = None,
+) -> Tuple[str, Optional[Set[str]]]:
+    """
+    購読可否の確認。
+
+    認可は他のエンドポイントと同じ get_current_user / require_role を短いセッションで使う。
+
+    Returns: (season_id, clubs) season_id は正規化したUUID文字列、clubs は閲覧できる
+    クラブIDの集合（GM は None = 全クラブ）
+    """
+    db = SessionLocal()
+    try:
+        user = get_current_user(db, user_email, user_name)
+        season = db.query(Season).filter(Season.id == season_id).first()
+        if not season:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
+        require_role(user, db, season.game_id, MembershipRole.club_viewer)
+        memberships = (
+            db.query(Membership)
+            .filter(Membership.user_id == user.id, Membership.game_id == season.game_id)
+            .all()
+        )
+        clubs: Optional[Set[str]] = None
+        if not any(m.role == MembershipRole.gm for m in memberships):
+            clubs = {str(m.club_id) for m in memberships if m.club_id is not None}
+        return str(season.id), clubs
+    finally:
+        db.close()
+
+
+def read_season_snapshot(season_id: str) -> Dict[str, Any]:
+    """接続時スナップショット（現在のターンと state_version）"""
+    db = SessionLocal()
+    try:
+        season = db.query(Season).filter(Season.id == season_id).first()
+        if not season:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
+        turn = (
+            db.query(Turn)
+            .filter(Turn.season_id == season.id, Turn.turn_state != TurnState.acked)
+            .order_by(Turn.month_index)
+            .first()
+        )
+        snapshot = {
+            "season_id": str(season.id),
+            "state_version": season.state_version,
+            "status": season.status.value if hasattr(season.status, "value") else season.status,
+            "turn": _turn_snapshot(turn),
+        }
+        return snapshot
+    finally:
+        db.close()
+
+
+async def stream_events(
+    request: Request,
+    subscription: Subscription,
+    snapshot: Dict[str, Any],
+    keepalive_s: float,
+) -> AsyncIterator[str]:
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        yield format_sse("snapshot", snapshot)
+        while True:
+            try:
+                season_event = await asyncio.wait_for(subscription.queue.get(), timeout=keepalive_s)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(season_event.type, season_event.public_payload())
+    finally:
+        BUS.unsubscribe(subscription)
+
+
+@router.get("/{season_id}/events")
+async def season_events(
+    season_id: str,
+    request: Request,
+    x_user_email: Optional[str] = Header(None),
+    x_user_name: Optional[str] = Header(None),
+):
+    """シーズンのイベントを SSE (text/event-stream) で配信する（club_viewer 以上）"""
+    # イベントは正規化したUUID文字列で配信される
+    season_id, clubs = await run_in_threadpool(authorize_season_stream, season_id, x_user_email, x_user_name)
+
+    settings = get_settings()
+    ensure_listener(settings.events_listen_url or settings.database_url)
+    # スナップショットを読む前に購読する（読み取りとの間の遷移はキューに残る）
+    subscription = BUS.subscribe(season_id, clubs)
+    try:
+        snapshot = await run_in_threadpool(read_season_snapshot, season_id)
+    except BaseException:
+        BUS.unsubscribe(subscription)
+        raise
+    return StreamingResponse(
+        stream_events(request, subscription, snapshot, settings.events_keepalive_s),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
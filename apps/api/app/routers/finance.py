@@ -1,12 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.db import models
 from app.db.models import MembershipRole, User
 from app.dependencies import get_current_user, get_db, require_role
+from app.http_cache import not_modified, season_etag
+from app.pagination import MAX_PAGE_SIZE, keyset_select, page_response
 from app.schemas import (
     ClubFinancialProfileRead,
     ClubFinancialProfileUpdate,
@@ -14,9 +16,9 @@ from app.schemas import (
     ClubFinancialStateRead,
     ClubFinancialLedgerRead,
     ClubTaxInfoRead,
+    FinancePLRead,
 )
 from app.services import finance as finance_service
-from sqlalchemy import select
 
 router = APIRouter(prefix="/clubs/{club_id}/finance", tags=["finance"])
 
@@ -28,6 +30,14 @@ def get_club_or_404(db: Session, club_id: UUID) -> models.Club:
     return club
 
 
+def _season_not_modified(db: Session, request: Request, response: Response, season_id: UUID, scope: str):
+    season = db.query(models.Season).filter(models.Season.id == season_id).first()
+    if not season:
+        return None
+    # 本文はクラブごと・閲覧者ごと
+    return not_modified(request, response, season_etag(season, scope), private=True)
+
+
 @router.put("/profile", response_model=ClubFinancialProfileRead)
 def update_finance_profile(
     club_id: UUID,
@@ -57,64 +67,125 @@ def get_finance_state(
     return state
 
 
+SNAPSHOT_COLUMNS = {
+    "id": models.ClubFinancialSnapshot.id,
+    "club_id": models.ClubFinancialSnapshot.club_id,
+    "season_id": models.ClubFinancialSnapshot.season_id,
+    "turn_id": models.ClubFinancialSnapshot.turn_id,
+    "month_index": models.ClubFinancialSnapshot.month_index,
+    "opening_balance": models.ClubFinancialSnapshot.opening_balance,
+    "income_total": models.ClubFinancialSnapshot.income_total,
+    "expense_total": models.ClubFinancialSnapshot.expense_total,
+    "closing_balance": models.ClubFinancialSnapshot.closing_balance,
+    "created_at": models.ClubFinancialSnapshot.created_at,
+}
+SNAPSHOT_CONVERTERS = {
+    name: float for name in ("opening_balance", "income_total", "expense_total", "closing_balance")
+}
+
+LEDGER_COLUMNS = {
+    "turn_id": models.ClubFinancialLedger.turn_id,
+    "month_index": models.Turn.month_index,
+    "kind": models.ClubFinancialLedger.kind,
+    "amount": models.ClubFinancialLedger.amount,
+    "meta": models.ClubFinancialLedger.meta,
+}
+
+
 @router.get("/snapshots", response_model=List[ClubFinancialSnapshotRead])
 def get_finance_snapshots(
     club_id: UUID,
     season_id: UUID,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     club = get_club_or_404(db, club_id)
     # Club Owner, Viewer, or GM can view snapshots
     require_role(user, db, club.game_id, MembershipRole.club_viewer, club_id=club_id)
-    
-    snapshots = finance_service.get_financial_snapshots(db, club_id, season_id)
-    return snapshots
+    cached = _season_not_modified(db, request, response, season_id, "snapshots")
+    if cached:
+        return cached
+
+    snapshot = models.ClubFinancialSnapshot
+    rows, next_cursor = keyset_select(
+        db,
+        SNAPSHOT_COLUMNS,
+        (snapshot.month_index, snapshot.id),
+        from_clause=snapshot.__table__,
+        where=[snapshot.club_id == club_id, snapshot.season_id == season_id],
+        fields=fields,
+        limit=limit,
+        cursor=cursor,
+        converters=SNAPSHOT_CONVERTERS,
+    )
+    return page_response(response, rows, next_cursor, projected=bool(fields))
 
 
 @router.get("/ledger", response_model=List[ClubFinancialLedgerRead])
 def get_finance_ledger(
     club_id: UUID,
     season_id: UUID,
+    request: Request,
+    response: Response,
     month_index: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """Return ledger entries for a club in a season, optionally filtered by month."""
     club = get_club_or_404(db, club_id)
     require_role(user, db, club.game_id, MembershipRole.club_viewer, club_id=club_id)
+    cached = _season_not_modified(db, request, response, season_id, "ledger")
+    if cached:
+        return cached
 
-    stmt = (
-        select(
-            models.ClubFinancialLedger.turn_id,
-            models.Turn.month_index,
-            models.ClubFinancialLedger.kind,
-            models.ClubFinancialLedger.amount,
-            models.ClubFinancialLedger.meta,
-        )
-        .join(models.Turn, models.Turn.id == models.ClubFinancialLedger.turn_id)
-        .where(
-            models.ClubFinancialLedger.club_id == club_id,
-            models.Turn.season_id == season_id,
-        )
-        .order_by(models.Turn.month_index)
+    ledger = models.ClubFinancialLedger
+    where = [ledger.club_id == club_id, models.Turn.season_id == season_id]
+    if month_index is not None:
+        where.append(models.Turn.month_index == month_index)
+
+    rows, next_cursor = keyset_select(
+        db,
+        LEDGER_COLUMNS,
+        (models.Turn.month_index, ledger.id),
+        from_clause=ledger.__table__.join(models.Turn, models.Turn.id == ledger.turn_id),
+        where=where,
+        fields=fields,
+        limit=limit,
+        cursor=cursor,
+        converters={"amount": float},
     )
+    return page_response(response, rows, next_cursor, projected=bool(fields))
 
-    if month_index is not None:
-        stmt = stmt.where(models.Turn.month_index == month_index)
-
-    rows = db.execute(stmt).all()
-    # Map to list of dicts for Pydantic
-    return [
-        {
-            "turn_id": r.turn_id,
-            "month_index": r.month_index,
-            "kind": r.kind,
-            "amount": float(r.amount),
-            "meta": r.meta,
-        }
-        for r in rows
-    ]
+
+@router.get("/pl", response_model=FinancePLRead)
+def get_finance_pl(
+    club_id: UUID,
+    season_id: UUID,
+    request: Request,
+    response: Response,
+    month_index: Optional[int] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Return the month and season-to-date PL, normalized, grouped and ordered in SQL."""
+    club = get_club_or_404(db, club_id)
+    require_role(user, db, club.game_id, MembershipRole.club_viewer, club_id=club_id)
+    cached = _season_not_modified(db, request, response, season_id, "pl")
+    if cached:
+        return cached
+
+    try:
+        return finance_service.get_pl_summary(db, club_id, season_id, month_index)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
 
 
 @router.get("/tax-info", response_model=ClubTaxInfoRead)
@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.dependencies import get_current_user, get_db, require_role
+from app.pagination import MAX_PAGE_SIZE, keyset_select, page_response
 from app.db.models import Club, Game, GameStatus, Membership, MembershipRole, Season, User
 from app.schemas import ClubCreate, ClubRead, GameCreate, GameRead, MembershipCreate, SeasonSummaryRead
 
@@ -55,16 +56,37 @@ def create_club(
     return club
 
 
+CLUB_COLUMNS = {
+    "id": Club.id,
+    "name": Club.name,
+    "short_name": Club.short_name,
+    "game_id": Club.game_id,
+}
+
+
 @router.get("/{game_id}/clubs", response_model=List[ClubRead])
 def list_clubs(
     game_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     require_role(user, db, game_id, MembershipRole.club_viewer)
 
-    clubs = db.query(Club).filter(Club.game_id == game_id).order_by(Club.name).all()
-    return clubs
+    rows, next_cursor = keyset_select(
+        db,
+        CLUB_COLUMNS,
+        (Club.name, Club.id),
+        from_clause=Club.__table__,
+        where=[Club.game_id == game_id],
+        fields=fields,
+        limit=limit,
+        cursor=cursor,
+    )
+    return page_response(response, rows, next_cursor, projected=bool(fields))
 
 
 @router.post("/{game_id}/memberships", status_code=status.HTTP_201_CREATED)
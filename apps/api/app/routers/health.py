@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from ..config import get_settings
+from ..db.session import connected_application_name, engine, pool_status
 
 router = APIRouter()
 
@@ -8,4 +9,13 @@ router = APIRouter()
 @router.get("/health")
 def health_check():
     settings = get_settings()
-    return {"status": "ok", "app": settings.app_name}
+    return {
+        "status": "ok",
+        "app": settings.app_name,
+        "database": {
+            "pool": pool_status(engine),
+            "pgbouncer": settings.db_pgbouncer,
+            "statement_timeout_ms": settings.db_statement_timeout_ms,
+            "application_name": connected_application_name(settings),
+        },
+    }
@@ -1,10 +1,11 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from app.db import models
 from app.db.models import MembershipRole, User, StaffRole
 from app.dependencies import get_current_user, get_db, require_role
+from app.pagination import MAX_PAGE_SIZE, keyset_select, page_response
 from app.schemas import (
     AcademyBudgetUpdate,
     SponsorEffortUpdate,
@@ -99,16 +100,31 @@ def get_staff(
     ]
 
 
+# Columns of the staff history rows (monthly staff_cost ledger entries)
+STAFF_HISTORY_COLUMNS = {
+    "turn_id": models.ClubFinancialLedger.turn_id,
+    "season_id": models.Turn.season_id,
+    "month_index": models.Turn.month_index,
+    "month_name": models.Turn.month_name,
+    "total_cost": models.ClubFinancialLedger.amount,
+    "staff": models.ClubFinancialLedger.meta,
+    "created_at": models.ClubFinancialLedger.created_at,
+}
+
+
 @router.get("/staff/history", response_model=List[StaffHistoryEntry])
 def get_staff_history(
     club_id: UUID,
+    response: Response,
     season_id: Optional[UUID] = None,
     from_month: Optional[int] = None,
     to_month: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    """月次スタッフコスト台帳から人員推移を参照"""
+    """月次スタッフコスト台帳から人員推移を参照（limit/cursor でページング可）"""
     club = get_club_or_404(db, club_id)
     require_role(user, db, club.game_id, MembershipRole.club_viewer, club_id=club_id)
 
@@ -119,39 +135,28 @@ def get_staff_history(
         if season.game_id != club.game_id:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Season does not belong to club's game")
 
-    query = (
-        db.query(models.ClubFinancialLedger, models.Turn)
-        .join(models.Turn, models.Turn.id == models.ClubFinancialLedger.turn_id)
-        .filter(
-            models.ClubFinancialLedger.club_id == club_id,
-            models.ClubFinancialLedger.kind == "staff_cost",
-        )
-    )
-
+    ledger = models.ClubFinancialLedger
+    where = [ledger.club_id == club_id, ledger.kind == "staff_cost"]
     if season_id:
-        query = query.filter(models.Turn.season_id == season_id)
+        where.append(models.Turn.season_id == season_id)
     if from_month is not None:
-        query = query.filter(models.Turn.month_index >= from_month)
+        where.append(models.Turn.month_index >= from_month)
     if to_month is not None:
-        query = query.filter(models.Turn.month_index <= to_month)
-
-    ledgers = query.order_by(models.Turn.season_id, models.Turn.month_index).all()
-
-    results: List[StaffHistoryEntry] = []
-    for ledger, turn in ledgers:
-        details = (ledger.meta or {}).get("details", {})
-        results.append(
-            StaffHistoryEntry(
-                turn_id=ledger.turn_id,
-                season_id=turn.season_id,
-                month_index=turn.month_index,
-                month_name=turn.month_name,
-                total_cost=float(abs(ledger.amount)),
-                staff=details,
-                created_at=ledger.created_at,
-            )
-        )
-    return results
+        where.append(models.Turn.month_index <= to_month)
+
+    rows, next_cursor = keyset_select(
+        db,
+        STAFF_HISTORY_COLUMNS,
+        (models.Turn.season_id, models.Turn.month_index, ledger.id),
+        from_clause=ledger.__table__.join(models.Turn, models.Turn.id == ledger.turn_id),
+        where=where,
+        limit=limit,
+        cursor=cursor,
+        converters={"total_cost": lambda amount: float(abs(amount))},
+    )
+    for row in rows:
+        row["staff"] = (row["staff"] or {}).get("details", {})
+    return page_response(response, rows, next_cursor, projected=False)
 
 @router.post("/academy/budget")
 def set_academy_budget(
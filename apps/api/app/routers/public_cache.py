@@ -0,0 +1,86 @@
+"""
+公開情報の事前シリアライズ済みバイト列を配信するAPI
+
+services/public_cache.py が公開時に書き出したJSON/gzipを、Accept-Encoding に
+応じてそのまま返す（圧縮ミドルウェアは Content-Encoding 付きの応答には触れない）。
+brotli 版は最初の br リクエストで作られ、以降はファイルをそのまま返す。
+DBセッションもPydanticも通さないため、観戦者が何度再読み込みしても
+DB負荷は発生しない。未書き出しの場合は 404 を返すので、クライアントは
+通常の /seasons/{id}/disclosures 等にフォールバックする。
+"""
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.compression import choose_encoding
+from app.services import public_cache
+
+# Prefix is provided via main.py include_router(prefix=settings.api_prefix)
+router = APIRouter(prefix="/public", tags=["public"])
+
+# digest URL は内容が変わらないため長期キャッシュ可能
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 論理名 URL は再公開（7月→12月など）で指す先が変わりうる
+REF_CACHE_CONTROL = "public, max-age=60"
+
+
+def _serve_digest(request: Request, digest: str, cache_control: str) -> Response:
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    encoded_path = public_cache.encoded_blob_path(digest, encoding) if encoding else None
+    if encoded_path:
+        headers["Content-Encoding"] = encoding
+        return Response(content=encoded_path.read_bytes(), media_type="application/json", headers=headers)
+
+    path = public_cache.blob_path(digest)
+    if not path:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blob not found")
+    return Response(content=path.read_bytes(), media_type="application/json", headers=headers)
+
+
+def _serve_ref(request: Request, name: str) -> Response:
+    digest = public_cache.read_ref(name)
+    if not digest:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not published")
+    return _serve_digest(request, digest, REF_CACHE_CONTROL)
+
+
+@router.get("/blobs/{digest}")
+def get_blob(digest: str, request: Request):
+    """コンテンツアドレス（SHA-256）で公開済みデータを取得"""
+    return _serve_digest(request, digest, IMMUTABLE_CACHE_CONTROL)
+
+
+@router.get("/seasons/{season_id}/disclosures")
+def get_public_disclosures(season_id: UUID, request: Request):
+    """公開済みの全公開情報（/seasons/{id}/disclosures と同じ内容）"""
+    return _serve_ref(request, public_cache.season_disclosures_ref(season_id))
+
+
+@router.get("/seasons/{season_id}/disclosures/{disclosure_type}")
+def get_public_disclosure_by_type(season_id: UUID, disclosure_type: str, request: Request):
+    """種別ごとの最新公開情報"""
+    return _serve_ref(request, public_cache.season_disclosure_ref(season_id, disclosure_type))
+
+
+@router.get("/seasons/{season_id}/team-power")
+def get_public_team_power(season_id: UUID, request: Request):
+    """最新のチーム力指標（/seasons/{id}/team-power と同じ優先順位）"""
+    return _serve_ref(request, public_cache.season_team_power_ref(season_id))
+
+
+@router.get("/seasons/{season_id}/standings/extended")
+def get_public_extended_standings(season_id: UUID, request: Request):
+    """確定したシーズンの拡張順位表（/seasons/{id}/standings/extended と同じ内容）"""
+    return _serve_ref(request, public_cache.season_extended_standings_ref(season_id))
+
+
+@router.get("/games/{game_id}/final-results")
+def get_public_final_results(game_id: UUID, request: Request):
+    """生成済みのゲーム最終結果"""
+    return _serve_ref(request, public_cache.game_final_results_ref(game_id))
@@ -3,10 +3,13 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app import events
 from app.dependencies import get_current_user, get_db, require_role
+from app.http_cache import not_modified, season_etag
+from app.pagination import MAX_PAGE_SIZE, keyset_select, page_response
 from app.db.models import (
     Club,
     ClubFanbaseState,
@@ -29,6 +32,7 @@ from app.services.standings import StandingsCalculator
 from app.services.season_finalize import SeasonFinalizer
 from app.services import reinforcement, sponsor, academy
 from app.services.public_disclosure import copy_team_power_july_to_new_season
+from app.services.state_version import bump_state_version
 
 router = APIRouter(prefix="/seasons", tags=["seasons"])
 
@@ -73,20 +77,40 @@ def get_latest_season(
     return season
 
 
+SEASON_COLUMNS = {
+    "id": Season.id,
+    "game_id": Season.game_id,
+    "season_number": Season.season_number,
+    "year_label": Season.year_label,
+    "status": Season.status,
+    "state_version": Season.state_version,
+}
+
+
 @router.get("/games/{game_id}", response_model=List[SeasonRead])
 def list_seasons(
     game_id: str,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
     require_role(user, db, game_id, MembershipRole.club_viewer)
-    seasons = (
-        db.query(Season)
-        .filter(Season.game_id == game_id)
-        .order_by(Season.season_number.desc(), Season.created_at.desc())
-        .all()
+    # Newest first; season_number is unique per game
+    rows, next_cursor = keyset_select(
+        db,
+        SEASON_COLUMNS,
+        (Season.season_number, Season.id),
+        from_clause=Season.__table__,
+        where=[Season.game_id == game_id],
+        fields=fields,
+        limit=limit,
+        cursor=cursor,
+        descending=True,
     )
-    return seasons
+    return page_response(response, rows, next_cursor, projected=bool(fields))
 
 
 @router.get("/{season_id}", response_model=SeasonRead)
@@ -194,7 +218,8 @@ def create_season_core(db: Session, game: Game, year_label: str) -> Season:
         db.commit()
 
         # Team Power July: 前シーズンの7月公開値を新シーズンに引き継ぐ
-        copy_team_power_july_to_new_season(db, prev_season.id, season.id)
+        if copy_team_power_july_to_new_season(db, prev_season.id, season.id) is not None:
+            events.publish(db, season.id, events.DISCLOSURE_PUBLISHED, disclosure_types=["team_power_july_carried"])
         db.commit()
 
     # Sponsor state: inherit final next_count (or count) and keep pipelines consistent with Section 10
@@ -245,6 +270,7 @@ def generate_fixtures_core(db: Session, season: Season, force: bool = False) ->
         match = Match(fixture_id=fixture.id, status=MatchStatus.scheduled)
         db.add(match)
 
+    bump_state_version(db, season.id)
     db.commit()
     return db.query(Fixture).filter(Fixture.season_id == season.id).count()
 
@@ -284,6 +310,8 @@ def generate_fixtures(
 @router.get("/{season_id}/schedule")
 def season_schedule(
     season_id: str,
+    request: Request,
+    response: Response,
     month_index: Optional[int] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
@@ -292,6 +320,9 @@ def season_schedule(
     if not season:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
     require_role(user, db, season.game_id, MembershipRole.gm)
+    cached = not_modified(request, response, season_etag(season, "schedule"))
+    if cached:
+        return cached
 
     fixtures_query = db.query(Fixture).filter(Fixture.season_id == season_id)
     if month_index is not None:
@@ -324,6 +355,8 @@ def season_schedule(
 def club_schedule(
     season_id: str,
     club_id: str,
+    request: Request,
+    response: Response,
     month_index: Optional[int] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
@@ -332,6 +365,9 @@ def club_schedule(
     if not season:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
     require_role(user, db, season.game_id, MembershipRole.club_viewer, club_id)
+    cached = not_modified(request, response, season_etag(season, "schedule"))
+    if cached:
+        return cached
 
     club_uuid = uuid.UUID(str(club_id))
     fixtures_query = db.query(Fixture).filter(
@@ -405,6 +441,8 @@ def get_fixture_detail(
 @router.get("/{season_id}/standings", response_model=List[StandingRead])
 def get_season_standings(
     season_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -413,6 +451,9 @@ def get_season_standings(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
     
     require_role(user, db, str(season.game_id), MembershipRole.club_viewer)
+    cached = not_modified(request, response, season_etag(season, "standings"))
+    if cached:
+        return cached
 
     if season.is_finalized:
         finalizer = SeasonFinalizer(db, season.id)
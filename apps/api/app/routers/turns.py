@@ -1,10 +1,20 @@
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy import distinct, func
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.config import get_settings
+from app.db.query_stats import query_phase
+from app.db.session import SessionLocal
+from app.metrics import LONG_POLL_WAITS, RESOLVE_PHASE_DURATION
 from app.dependencies import get_current_user, get_db, require_role
+from app import events
+from app.http_cache import not_modified, season_etag
+from app.pagination import MAX_PAGE_SIZE, keyset_select, page_response
 from app.db.models import (
     Club,
     DecisionState,
@@ -16,8 +26,19 @@ from app.db.models import (
     TurnDecision,
     TurnState,
 )
-from app.schemas import AckRequest, DecisionCommitRequest, DecisionPayload, DecisionRead, TurnStateResponse
+from app.schemas import (
+    AckRequest,
+    DecisionCommitRequest,
+    DecisionPayload,
+    DecisionRead,
+    SeasonWaitResponse,
+    TurnResolveReportRead,
+    TurnStateResponse,
+)
 from app.services.decision_validation import get_available_inputs, get_available_actions
+from app.services.resolve_report import ResolveReportRecorder, get_resolve_report
+from app.services.state_version import bump_state_version
+from app.tracing import span, start_trace
 
 router = APIRouter(prefix="/turns", tags=["turns"])
 
@@ -49,6 +70,8 @@ def _decision_to_response(decision: TurnDecision, turn: Turn, available_inputs:
 @router.get("/seasons/{season_id}/current", response_model=Optional[TurnStateResponse])
 def current_turn(
     season_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -56,6 +79,9 @@ def current_turn(
     if not season:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
     require_role(user, db, season.game_id, MembershipRole.club_viewer)
+    cached = not_modified(request, response, season_etag(season, "turn"))
+    if cached:
+        return cached
     turn = (
         db.query(Turn)
         .filter(Turn.season_id == season_id, Turn.turn_state != TurnState.acked)
@@ -65,6 +91,94 @@ def current_turn(
     return turn
 
 
+def read_season_wait_state(
+    season_id: str,
+    authorize: bool = False,
+    user_email: Optional[str] = None,
+    user_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    long-poll 用に短いセッションで state_version・現在のターン・未commit/未ACK数を読む。
+
+    authorize=True のときは他のエンドポイントと同じ get_current_user / require_role で
+    club_viewer 以上かも確認する（待機中の読み直しでは省略）。
+    """
+    db = SessionLocal()
+    try:
+        user = get_current_user(db, user_email, user_name) if authorize else None
+        season = db.query(Season).filter(Season.id == season_id).first()
+        if not season:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
+        if user is not None:
+            require_role(user, db, season.game_id, MembershipRole.club_viewer)
+
+        turn = (
+            db.query(Turn)
+            .filter(Turn.season_id == season.id, Turn.turn_state != TurnState.acked)
+            .order_by(Turn.month_index)
+            .first()
+        )
+        pending_decisions = pending_acks = acked = 0
+        if turn is not None:
+            pending_decisions = (
+                db.query(TurnDecision)
+                .filter(TurnDecision.turn_id == turn.id, TurnDecision.decision_state != DecisionState.committed)
+                .count()
+            )
+            acked = (
+                db.query(func.count(distinct(TurnAck.club_id)))
+                .filter(TurnAck.turn_id == turn.id, TurnAck.ack == True)  # noqa: E712
+                .scalar()
+            ) or 0
+            clubs = db.query(Club).filter(Club.game_id == season.game_id).count()
+            pending_acks = max(clubs - acked, 0)
+        return {
+            "season_id": str(season.id),
+            "state_version": season.state_version or 0,
+            # セッションを閉じた後に遅延ロードしないよう、ここで変換しておく
+            "turn": TurnStateResponse.model_validate(turn, from_attributes=True) if turn is not None else None,
+            "pending_decisions": pending_decisions,
+            "pending_acks": pending_acks,
+            "ack_count": acked,
+        }
+    finally:
+        db.close()
+
+
+@router.get("/seasons/{season_id}/wait", response_model=SeasonWaitResponse)
+async def wait_for_state(
+    season_id: str,
+    after_version: Optional[int] = Query(None, ge=0, description="この state_version より新しくなるまで待つ（省略時は即時に返す）"),
+    timeout: float = Query(30.0, ge=0, description="最大待ち時間（秒、WAIT_MAX_TIMEOUT_S で頭打ち）"),
+    after_acks: Optional[int] = Query(None, ge=0, description="ack_count がこの値から変わっても返す（ACK 待ち用）"),
+    x_user_email: Optional[str] = Header(None),
+    x_user_name: Optional[str] = Header(None),
+):
+    """
+    シーズンの state_version が after_version を超えるまで待ち、現在のターンと version を返す（club_viewer 以上）。
+
+    ストリームを使えないスクリプト向けの long-poll。待機中は DB コネクションを
+    保持せず、シーズンのイベントで起きて読み直す。タイムアウト時は changed=False。
+    """
+    state = await run_in_threadpool(read_season_wait_state, season_id, True, x_user_email, x_user_name)
+    if after_version is None or events.season_state_changed(state, after_version, after_acks):
+        return {**state, "changed": True}
+
+    settings = get_settings()
+    events.ensure_listener(settings.events_listen_url or settings.database_url)
+    normalized_id = state["season_id"]
+    state, changed = await events.wait_for_season_change(
+        normalized_id,
+        after_version,
+        min(timeout, settings.wait_max_timeout_s),
+        lambda: read_season_wait_state(normalized_id),
+        settings.wait_recheck_s,
+        LONG_POLL_WAITS,
+        after_acks=after_acks,
+    )
+    return {**state, "changed": changed}
+
+
 @router.get("/seasons/{season_id}/decisions/{club_id}/current", response_model=Optional[DecisionRead])
 def get_current_decision(
     season_id: str,
@@ -101,6 +215,8 @@ def open_turn(turn_id: str, db: Session = Depends(get_db), user=Depends(get_curr
     require_role(user, db, turn.season.game_id, MembershipRole.gm)
     turn.turn_state = TurnState.collecting
     turn.opened_at = datetime.utcnow()
+    bump_state_version(db, turn.season_id)
+    events.publish(db, turn.season_id, events.TURN_OPENED, turn_id=str(turn.id), month_index=turn.month_index)
     db.commit()
     return {"state": turn.turn_state}
 
@@ -158,6 +274,11 @@ def commit_decision(
     decision.committed_at = datetime.utcnow()
     decision.committed_by_user_id = user.id
     decision.payload_json = normalized_payload or None
+    bump_state_version(db, turn.season_id)
+    events.publish(
+        db, turn.season_id, events.DECISION_COMMITTED, club_id=club_id,
+        turn_id=str(turn.id), month_index=turn.month_index,
+    )
     db.commit()
     return {"state": decision.decision_state}
 
@@ -193,16 +314,38 @@ def lock_turn(turn_id: str, db: Session = Depends(get_db), user=Depends(get_curr
     turn.turn_state = TurnState.locked
     turn.locked_at = datetime.utcnow()
     db.query(TurnDecision).filter(TurnDecision.turn_id == turn_id).update({"decision_state": DecisionState.locked})
+    bump_state_version(db, turn.season_id)
+    events.publish(db, turn.season_id, events.TURN_LOCKED, turn_id=str(turn.id), month_index=turn.month_index)
     db.commit()
     return {"state": turn.turn_state}
 
 
+# Columns available to `fields=` on the decision history endpoint
+DECISION_HISTORY_COLUMNS = {
+    "turn_id": TurnDecision.turn_id,
+    "season_id": Turn.season_id,
+    "season_number": Season.season_number,
+    "club_id": TurnDecision.club_id,
+    "month_index": Turn.month_index,
+    "month_name": Turn.month_name,
+    "decision_state": TurnDecision.decision_state,
+    "payload": TurnDecision.payload_json,
+    "committed_at": TurnDecision.committed_at,
+    "committed_by_user_id": TurnDecision.committed_by_user_id,
+}
+
+
 @router.get("/seasons/{season_id}/decisions/{club_id}", response_model=List[DecisionRead])
 def get_decision_history(
     season_id: str,
     club_id: str,
+    request: Request,
+    response: Response,
     from_month: Optional[int] = None,
     to_month: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
@@ -211,48 +354,96 @@ def get_decision_history(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
 
     require_role(user, db, season.game_id, MembershipRole.club_viewer, club_id)
+    cached = not_modified(request, response, season_etag(season, "decisions"), private=True)
+    if cached:
+        return cached
 
-    query = (
-        db.query(TurnDecision, Turn)
-        .join(Turn, TurnDecision.turn_id == Turn.id)
-        .filter(TurnDecision.club_id == club_id, Turn.season_id == season_id)
-    )
-
+    where = [TurnDecision.club_id == club_id, Turn.season_id == season_id]
     if from_month is not None:
-        query = query.filter(Turn.month_index >= from_month)
+        where.append(Turn.month_index >= from_month)
     if to_month is not None:
-        query = query.filter(Turn.month_index <= to_month)
+        where.append(Turn.month_index <= to_month)
+
+    rows, next_cursor = keyset_select(
+        db,
+        DECISION_HISTORY_COLUMNS,
+        (Season.season_number, Turn.month_index, TurnDecision.id),
+        from_clause=TurnDecision.__table__.join(Turn, TurnDecision.turn_id == Turn.id).join(
+            Season, Season.id == Turn.season_id
+        ),
+        where=where,
+        fields=fields,
+        limit=limit,
+        cursor=cursor,
+    )
+    return page_response(response, rows, next_cursor, projected=bool(fields))
+
 
-    records = query.order_by(Turn.month_index).all()
-    return [_decision_to_response(decision, turn) for decision, turn in records]
+@contextmanager
+def _resolve_phase(recorder: ResolveReportRecorder, name: str):
+    """解決フェーズ単位でSQL数（X-DB-Phases）・所要時間（/metrics・レポート）・スパンを記録する。"""
+    with query_phase(name), span(name), recorder.phase(name), RESOLVE_PHASE_DURATION.time(
+        phase=name, month_index=recorder.turn.month_index, club_count=recorder.club_count
+    ):
+        yield
 
 
 @router.post("/{turn_id}/resolve")
 def resolve_turn(turn_id: str, db: Session = Depends(get_db), user=Depends(get_current_user)):
     turn = _get_turn(db, turn_id)
     require_role(user, db, turn.season.game_id, MembershipRole.gm)
+    club_count = db.query(Club).filter(Club.game_id == turn.season.game_id).count()
 
-    # Apply finance (Expenses & Updates)
-    from app.services import finance as finance_service
-    finance_service.process_turn_expenses(db, turn.season_id, turn.id)
-
-    # Apply Match Results (PR4.5 + PR5 Attendance)
-    from app.services import match_results
-    match_results.process_matches_for_turn(db, turn.season_id, turn.id, turn.month_index)
-    
-    # Apply finance (Revenue & Snapshot)
-    finance_service.finalize_turn_finance(db, turn.season_id, turn.id)
-
-    # PR9: 情報公開イベント処理
-    from app.services import public_disclosure
-    public_disclosure.process_disclosure_for_turn(db, turn.season_id, turn.id, turn.month_index)
+    recorder = ResolveReportRecorder(db, turn, club_count).start()
+    try:
+        with start_trace("resolve", turn.id, month_index=turn.month_index, club_count=club_count):
+            # Apply finance (Expenses & Updates)
+            from app.services import finance as finance_service
+            with _resolve_phase(recorder, "expenses"):
+                finance_service.process_turn_expenses(db, turn.season_id, turn.id)
+
+            # Apply Match Results (PR4.5 + PR5 Attendance)
+            from app.services import match_results
+            with _resolve_phase(recorder, "matches"):
+                match_results.process_matches_for_turn(db, turn.season_id, turn.id, turn.month_index)
+
+            # Apply finance (Revenue & Snapshot)
+            with _resolve_phase(recorder, "finance"):
+                finance_service.finalize_turn_finance(db, turn.season_id, turn.id)
+
+            # PR9: 情報公開イベント処理
+            from app.services import public_disclosure
+            with _resolve_phase(recorder, "disclosure"):
+                disclosures = public_disclosure.process_disclosure_for_turn(db, turn.season_id, turn.id, turn.month_index)
+    except Exception:
+        recorder.abort()
+        raise
+    recorder.finish()
 
     turn.turn_state = TurnState.resolved
     turn.resolved_at = datetime.utcnow()
+    bump_state_version(db, turn.season_id)
+    events.publish(db, turn.season_id, events.TURN_RESOLVED, turn_id=str(turn.id), month_index=turn.month_index)
+    if disclosures:
+        events.publish(
+            db, turn.season_id, events.DISCLOSURE_PUBLISHED,
+            turn_id=str(turn.id), month_index=turn.month_index, disclosure_types=sorted(disclosures),
+        )
     db.commit()
     return {"state": turn.turn_state}
 
 
+@router.get("/{turn_id}/resolve-report", response_model=TurnResolveReportRead)
+def get_turn_resolve_report(turn_id: str, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    """直近の resolve の性能記録（フェーズ別時間・SQL数、処理件数、ピークメモリ）"""
+    turn = _get_turn(db, turn_id)
+    require_role(user, db, turn.season.game_id, MembershipRole.gm)
+    report = get_resolve_report(db, turn.id)
+    if not report:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resolve report not found")
+    return report
+
+
 @router.post("/{turn_id}/ack")
 def ack_turn(
     turn_id: str,
@@ -283,6 +474,12 @@ def ack_turn(
     else:
         ack_record.ack = payload.ack
         ack_record.acked_at = datetime.utcnow()
+    # state_version は進めない（シーズンの ETag を無効にしない）。/wait は ack_count と
+    # ACK_RECEIVED イベントで進み具合を拾う
+    events.publish(
+        db, turn.season_id, events.ACK_RECEIVED, club_id=payload.club_id,
+        turn_id=str(turn.id), month_index=turn.month_index, ack=payload.ack,
+    )
     db.commit()
     return {"ack": ack_record.ack}
 
@@ -315,9 +512,11 @@ def advance_turn(turn_id: str, db: Session = Depends(get_db), user=Depends(get_c
             .first()
         )
 
+        opened_turn = None
         if next_turn:
             next_turn.turn_state = TurnState.collecting
             next_turn.opened_at = datetime.utcnow()
+            opened_turn = next_turn
         else:
             # シーズンを終了扱いにして次シーズンを自動生成
             season = turn.season
@@ -350,8 +549,21 @@ def advance_turn(turn_id: str, db: Session = Depends(get_db), user=Depends(get_c
                 if first_turn:
                     first_turn.turn_state = TurnState.collecting
                     first_turn.opened_at = datetime.utcnow()
+                    opened_turn = first_turn
                     next_turn_info = {"next_turn_id": str(first_turn.id), "season_id": str(first_turn.season_id)}
 
+        bump_state_version(db, turn.season_id)
+        events.publish(
+            db, turn.season_id, events.TURN_ADVANCED,
+            turn_id=str(turn.id), month_index=turn.month_index,
+            next_turn_id=str(opened_turn.id) if opened_turn else None,
+            next_season_id=str(opened_turn.season_id) if opened_turn else None,
+        )
+        if opened_turn is not None:
+            events.publish(
+                db, opened_turn.season_id, events.TURN_OPENED,
+                turn_id=str(opened_turn.id), month_index=opened_turn.month_index,
+            )
         db.commit()
 
         if next_turn:
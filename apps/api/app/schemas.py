@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -54,6 +54,7 @@ class SeasonRead(BaseModel):
     season_number: int
     year_label: str
     status: SeasonStatus
+    state_version: int = 0
 
     class Config:
         orm_mode = True
@@ -147,6 +148,20 @@ class TurnStateResponse(BaseModel):
         orm_mode = True
 
 
+class SeasonWaitResponse(BaseModel):
+    """long-poll（/turns/seasons/{id}/wait）の結果。changed=False はタイムアウト"""
+
+    season_id: UUID
+    state_version: int
+    changed: bool
+    turn: Optional[TurnStateResponse] = None
+    # 現在のターンで commit していない決定 / ACK していないクラブの数
+    pending_decisions: int = 0
+    pending_acks: int = 0
+    # 現在のターンで ACK 済みのクラブ数（ACK は state_version を進めないので after_acks で待つ）
+    ack_count: int = 0
+
+
 class FixtureView(BaseModel):
     id: UUID
     match_month_index: int
@@ -264,6 +279,25 @@ class ClubFinancialLedgerRead(BaseModel):
         orm_mode = True
 
 
+class FinancePLRow(BaseModel):
+    kind: str
+    income: int
+    expense: int
+    net: int
+
+
+class FinancePLRead(BaseModel):
+    """PL集計（当月・シーズン累計、サーバ側で正規化・集計済み）"""
+    club_id: UUID
+    season_id: UUID
+    season_number: int
+    month_index: Optional[int]
+    month: List[FinancePLRow] = []
+    month_total: Optional[FinancePLRow] = None
+    season: List[FinancePLRow] = []
+    season_total: Optional[FinancePLRow] = None
+
+
 class ClubTaxInfoRead(BaseModel):
     season_id: UUID
     season_number: int
@@ -547,3 +581,58 @@ class GameFinalResultRead(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# =============================================================================
+# クラブ月次ダッシュボード
+# =============================================================================
+
+class PLItemRead(BaseModel):
+    """正規化済み kind ごとの金額"""
+    kind: str
+    amount: float
+
+
+class ClubDashboardRead(BaseModel):
+    """クラブ別・月次ダッシュボード（1リクエストでオーナーの確認情報をまとめて返す）"""
+    club_id: UUID
+    season_id: UUID
+    turn_id: UUID
+    month_index: int
+    balance: float
+    is_bankrupt: bool
+    pl_month: List[PLItemRead] = []
+    pl_season: List[PLItemRead] = []
+    fb_count: Optional[int] = None
+    followers_public: Optional[int] = None
+    sponsor_pipeline: Optional[Dict[str, Any]] = None
+    staff_counts: Optional[Dict[str, int]] = None
+    rank: Optional[int] = None
+    points: Optional[int] = None
+    team_power: Optional[float] = None
+    updated_at: datetime
+
+
+class ResolvePhaseRead(BaseModel):
+    ms: float
+    queries: Optional[int] = None
+
+
+class TurnResolveReportRead(BaseModel):
+    """ターン解決の性能レポート"""
+    turn_id: UUID
+    season_id: UUID
+    season_number: Optional[int] = None
+    month_index: int
+    total_ms: float
+    phases: Dict[str, ResolvePhaseRead] = {}
+    total_queries: Optional[int] = None
+    clubs_processed: int
+    fixtures_processed: int
+    ledger_rows_written: int
+    peak_memory_kb: Optional[int] = None
+    app_version: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        orm_mode = True
@@ -4,6 +4,7 @@ import random
 from sqlalchemy.orm import Session
 from sqlalchemy import select, desc
 from app.db import models
+from app.tracing import traced
 
 # Assumed v1Spec Constants
 TRANSFER_FEE_PROBABILITY_BASE = 0.01 # 1% per 10M cumulative investment
@@ -76,6 +77,7 @@ def update_academy_plan(db: Session, club_id: UUID, season_id: UUID, annual_budg
     db.add(state)
     return state
 
+@traced()
 def process_monthly_cost(db: Session, club_id: UUID, season_id: UUID, turn_id: UUID):
     state = ensure_academy_state(db, club_id, season_id)
     
@@ -105,6 +107,7 @@ def process_monthly_cost(db: Session, club_id: UUID, season_id: UUID, turn_id: U
             state.cumulative_investment += monthly_cost
             db.add(state)
 
+@traced()
 def process_transfer_fee(db: Session, club_id: UUID, season_id: UUID, turn_id: UUID):
     """
     July (Month 12). Probabilistic revenue.
@@ -1,6 +1,7 @@
 import math
 from decimal import Decimal
 from app.services.weather import get_weather_effect
+from app.tracing import traced
 
 # Coefficients
 BETA_0 = -1.986
@@ -23,6 +24,7 @@ CAPACITY = 20000
 def sigmoid(x):
     return 1 / (1 + math.exp(-x))
 
+@traced()
 def calculate_attendance(
     home_fb: int,
     away_fb: int,
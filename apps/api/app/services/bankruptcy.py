@@ -15,8 +15,10 @@ from app.db.models import (
     Club, ClubFinancialState, ClubPointPenalty, Turn, Season
 )
 from app.config.constants import DEBT_POINT_DEDUCTION
+from app.tracing import traced
 
 
+@traced()
 def check_bankruptcy(db: Session, club_id: UUID, turn_id: UUID) -> bool:
     """
     債務超過チェック
@@ -83,6 +85,7 @@ def is_bankrupt(db: Session, club_id: UUID) -> bool:
     return fin_state.is_bankrupt if fin_state else False
 
 
+@traced()
 def apply_point_penalty(
     db: Session, 
     club_id: UUID, 
@@ -123,6 +126,10 @@ def apply_point_penalty(
     
     # 適用済みフラグを立てる
     fin_state.point_penalty_applied = True
+
+    # 順位表が変わるため読み取りキャッシュを無効化
+    from app.services.state_version import bump_state_version
+    bump_state_version(db, season_id)
     db.flush()
     
     return DEBT_POINT_DEDUCTION
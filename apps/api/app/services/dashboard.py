@@ -0,0 +1,188 @@
+"""
+クラブ別・月次ダッシュボード
+
+finalize_turn_finance の最後に、各クラブの残高・PL（正規化済みkind別）・
+ファン指標・スポンサーパイプライン・スタッフ数・順位・チーム力（公開値）を
+1行にまとめて club_dashboards に保存する。オーナーの確認操作は
+GET /clubs/{id}/dashboard の1リクエストで済む。
+
+集計はクラブ数に依存しない固定回数のクエリで行う。
+"""
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.services.finance import normalize_ledger_kind
+from app.tracing import traced
+
+TEAM_POWER_DISCLOSURE_PRIORITY = ("team_power_july", "team_power_december", "team_power_july_carried")
+
+
+def _pl_by_club(db: Session, season_id: UUID, month_index: int):
+    """クラブ別に (当月, シーズン累計) の正規化済みPLを返す"""
+    stmt = (
+        select(
+            models.ClubFinancialLedger.club_id,
+            models.ClubFinancialLedger.kind,
+            models.Turn.month_index,
+            func.sum(models.ClubFinancialLedger.amount).label("amount"),
+        )
+        .join(models.Turn, models.Turn.id == models.ClubFinancialLedger.turn_id)
+        .where(models.Turn.season_id == season_id, models.Turn.month_index <= month_index)
+        .group_by(models.ClubFinancialLedger.club_id, models.ClubFinancialLedger.kind, models.Turn.month_index)
+    )
+    month_pl: Dict[UUID, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    season_pl: Dict[UUID, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for row in db.execute(stmt):
+        kind = normalize_ledger_kind(row.kind or "(unknown)")
+        if kind is None:
+            continue
+        amount = float(row.amount or 0)
+        season_pl[row.club_id][kind] += amount
+        if row.month_index == month_index:
+            month_pl[row.club_id][kind] += amount
+    return month_pl, season_pl
+
+
+def _published_team_power(db: Session, season_id: UUID) -> Dict[str, float]:
+    """最新の公開チーム力（/team-power と同じ優先順位）を club_id(str) -> 値 で返す"""
+    disclosures = (
+        db.query(models.SeasonPublicDisclosure)
+        .filter(
+            models.SeasonPublicDisclosure.season_id == season_id,
+            models.SeasonPublicDisclosure.disclosure_type.in_(TEAM_POWER_DISCLOSURE_PRIORITY),
+        )
+        .all()
+    )
+    by_type = {d.disclosure_type: d for d in disclosures}
+    for disclosure_type in TEAM_POWER_DISCLOSURE_PRIORITY:
+        disclosure = by_type.get(disclosure_type)
+        if disclosure and isinstance(disclosure.disclosed_data, dict):
+            clubs = disclosure.disclosed_data.get("clubs") or []
+            return {
+                str(entry.get("club_id")): entry.get("team_power")
+                for entry in clubs
+                if entry.get("club_id") is not None
+            }
+    return {}
+
+
+@traced()
+def write_dashboards_for_turn(db: Session, season: models.Season, turn: models.Turn) -> None:
+    """
+    ターンの月次ダッシュボードを全クラブ分 upsert する（flush まで、commit は呼び出し側）
+    """
+    from app.services.standings import StandingsCalculator
+
+    clubs = db.query(models.Club).filter(models.Club.game_id == season.game_id).all()
+    if not clubs:
+        return
+    club_ids = [club.id for club in clubs]
+
+    month_pl, season_pl = _pl_by_club(db, season.id, turn.month_index)
+
+    states = {
+        s.club_id: s
+        for s in db.query(models.ClubFinancialState).filter(models.ClubFinancialState.club_id.in_(club_ids))
+    }
+    fanbase = {
+        f.club_id: f
+        for f in db.query(models.ClubFanbaseState).filter(models.ClubFanbaseState.season_id == season.id)
+    }
+    sponsors = {
+        s.club_id: s
+        for s in db.query(models.ClubSponsorState).filter(models.ClubSponsorState.season_id == season.id)
+    }
+    staff_counts: Dict[UUID, Dict[str, int]] = defaultdict(dict)
+    for row in db.query(models.ClubStaff).filter(models.ClubStaff.club_id.in_(club_ids)):
+        staff_counts[row.club_id][row.role.value] = row.count
+
+    standings = {
+        row["club_id"]: row
+        for row in StandingsCalculator(db, season.id).calculate(up_to_month=turn.month_index)
+    }
+    team_power = _published_team_power(db, season.id)
+
+    existing = {
+        d.club_id: d
+        for d in db.query(models.ClubDashboard).filter(
+            models.ClubDashboard.season_id == season.id,
+            models.ClubDashboard.month_index == turn.month_index,
+        )
+    }
+
+    for club in clubs:
+        state = states.get(club.id)
+        fb = fanbase.get(club.id)
+        sp = sponsors.get(club.id)
+        standing = standings.get(club.id)
+        tp = team_power.get(str(club.id))
+
+        row = existing.get(club.id)
+        if row is None:
+            row = models.ClubDashboard(club_id=club.id, season_id=season.id, month_index=turn.month_index)
+            db.add(row)
+
+        row.turn_id = turn.id
+        row.balance = state.balance if state else Decimal("0")
+        row.is_bankrupt = bool(state.is_bankrupt) if state else False
+        row.pl_month = dict(month_pl.get(club.id, {}))
+        row.pl_season = dict(season_pl.get(club.id, {}))
+        row.fb_count = fb.fb_count if fb else None
+        row.followers_public = fb.followers_public if fb else None
+        row.sponsor_pipeline = (
+            {
+                "current_sponsors": sp.count,
+                "next_exist_target": sp.next_exist_count,
+                "next_new_target": sp.next_new_count,
+                "confirmed_exist": sp.pipeline_confirmed_exist,
+                "confirmed_new": sp.pipeline_confirmed_new,
+                "total_confirmed": (sp.pipeline_confirmed_exist or 0) + (sp.pipeline_confirmed_new or 0),
+                "next_total": sp.next_count,
+            }
+            if sp
+            else None
+        )
+        row.staff_counts = staff_counts.get(club.id) or None
+        row.rank = standing.get("rank") if standing else None
+        row.points = standing.get("points") if standing else None
+        row.team_power = Decimal(str(tp)) if tp is not None else None
+
+    db.flush()
+
+
+def refresh_team_power(db: Session, season_id: UUID, month_index: int) -> None:
+    """公開処理（12月・7月）の後に、当月ダッシュボードのチーム力を最新公開値に更新"""
+    team_power = _published_team_power(db, season_id)
+    if not team_power:
+        return
+    rows = db.query(models.ClubDashboard).filter(
+        models.ClubDashboard.season_id == season_id,
+        models.ClubDashboard.month_index == month_index,
+    )
+    for row in rows:
+        tp = team_power.get(str(row.club_id))
+        if tp is not None:
+            row.team_power = Decimal(str(tp))
+    db.flush()
+
+
+def get_dashboard(
+    db: Session,
+    club_id: UUID,
+    season_id: UUID,
+    month_index: Optional[int] = None,
+) -> Optional[models.ClubDashboard]:
+    """指定月（省略時は最新月）のダッシュボードを取得"""
+    query = db.query(models.ClubDashboard).filter(
+        models.ClubDashboard.club_id == club_id,
+        models.ClubDashboard.season_id == season_id,
+    )
+    if month_index is not None:
+        query = query.filter(models.ClubDashboard.month_index == month_index)
+    return query.order_by(models.ClubDashboard.month_index.desc()).first()
@@ -8,8 +8,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.db import models
+from app.tracing import traced
 
 
+@traced()
 def process_decision_expenses(
     db: Session, 
     club_id: UUID, 
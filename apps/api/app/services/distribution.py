@@ -8,8 +8,10 @@ from sqlalchemy import select
 
 from app.db import models
 from app.config.constants import DISTRIBUTION_AMOUNT
+from app.tracing import traced
 
 
+@traced()
 def process_distribution_revenue(
     db: Session, 
     club_id: UUID, 
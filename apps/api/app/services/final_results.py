@@ -15,6 +15,7 @@ from app.db.models import (
     Game, Club, Season, SeasonFinalStanding, 
     ClubFinancialSnapshot, Fixture, GameFinalResult,
 )
+from app.services.public_cache import publish_final_results
 
 
 def generate_final_results(db: Session, game_id: UUID) -> List[dict]:
@@ -79,6 +80,9 @@ def generate_final_results(db: Session, game_id: UUID) -> List[dict]:
     
     # DB保存
     _save_final_results(db, game_id, results)
+
+    # 公開用の事前シリアライズ（DBを介さず配信するため）
+    publish_final_results(db, game_id, results)
     
     return results
 
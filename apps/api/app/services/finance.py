@@ -1,13 +1,61 @@
 from uuid import UUID
 from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import case, literal, select, func
 from app.db import models
 from app.schemas import ClubFinancialProfileUpdate
+from app.tracing import traced
 
 TAX_RATE = Decimal("0.33")
 TAX_PAYMENT_MONTH_INDEX = 2
 
+# PL表示用の ledger kind 正規化（CLI show finance と共通）
+# - 内部マーカーは非表示
+# - 試合ごとのキー（ticket_rev_<fixture> 等）は接頭辞にまとめる
+PL_HIDDEN_KINDS = ("additional_reinforcement_applied",)
+PL_KIND_ALIASES = {"next_home_promo_expense": "promo_expense"}
+PL_PREFIX_KINDS = ("match_operation_cost", "merchandise_cost", "merchandise_rev", "ticket_rev")
+PL_KIND_ORDER = (
+    "sponsor_annual",
+    "sponsor",
+    "ticket_rev",
+    "merchandise_rev",
+    "distribution_revenue",
+    "prize_revenue",
+    "academy_transfer_fee",
+    "reinforcement_cost",
+    "team_operation_cost",
+    "academy_cost",
+    "match_operation_cost",
+    "sales_expense",
+    "promo_expense",
+    "merchandise_cost",
+    "hometown_expense",
+    "staff_cost",
+    "admin_cost",
+    "tax",
+)
+
+
+def normalize_ledger_kind(kind: str) -> str | None:
+    """ledger kind をPL表示用に正規化（非表示なら None）"""
+    if kind in PL_HIDDEN_KINDS:
+        return None
+    if kind in PL_KIND_ALIASES:
+        return PL_KIND_ALIASES[kind]
+    for prefix in PL_PREFIX_KINDS:
+        if kind.startswith(prefix):
+            return prefix
+    return kind
+
+
+def order_pl_items(amounts: dict) -> list[dict]:
+    """{kind: amount} を PL_KIND_ORDER 順（未定義kindは末尾・名前順）のリストに変換"""
+    index = {kind: i for i, kind in enumerate(PL_KIND_ORDER)}
+    ordered = sorted(amounts.items(), key=lambda item: (index.get(item[0], len(PL_KIND_ORDER)), item[0]))
+    return [{"kind": kind, "amount": float(amount)} for kind, amount in ordered]
+
+
 def ensure_finance_initialized_for_club(db: Session, club_id: UUID):
     """
     Ensure that a club has a financial profile and state.
@@ -55,6 +103,109 @@ def get_financial_snapshots(db: Session, club_id: UUID, season_id: UUID):
     return db.execute(stmt).scalars().all()
 
 
+def _pl_kind_expression():
+    """normalize_ledger_kind と同じ正規化をSQLのCASE式で表現"""
+    kind = models.ClubFinancialLedger.kind
+    whens = [(kind == alias, literal(target)) for alias, target in PL_KIND_ALIASES.items()]
+    whens += [(kind.startswith(prefix, autoescape=True), literal(prefix)) for prefix in PL_PREFIX_KINDS]
+    return case(*whens, else_=kind)
+
+
+def _pl_row(kind: str, amount) -> dict:
+    value = float(amount or 0)
+    return {
+        "kind": kind,
+        "income": int(round(value)) if value > 0 else 0,
+        "expense": int(round(value)) if value < 0 else 0,
+        "net": int(round(value)),
+    }
+
+
+def _pl_total(amounts: list) -> dict:
+    values = [float(a or 0) for a in amounts]
+    return {
+        "kind": "TOTAL",
+        "income": int(round(sum(v for v in values if v > 0))),
+        "expense": int(round(sum(v for v in values if v < 0))),
+        "net": int(round(sum(values))),
+    }
+
+
+def get_pl_summary(db: Session, club_id: UUID, season_id: UUID, month_index: int | None = None) -> dict:
+    """
+    PL集計（当月・シーズン累計）をSQL側で正規化・集計・並べ替えして返す
+
+    - month_index 省略時は ledger が存在する最新月
+    - シーズン累計は month_index までの合計（収入行 → 費用行の順）
+    - 現在残高はクラブ全体の状態で後のシーズンでも変わるため含めない
+      （シーズン単位の ETag で返すため。残高は /finance/state を使う）
+    """
+    season = db.execute(select(models.Season).where(models.Season.id == season_id)).scalar_one_or_none()
+    if not season:
+        raise ValueError(f"Season {season_id} not found")
+
+    ledger = models.ClubFinancialLedger
+    scope = (
+        ledger.club_id == club_id,
+        models.Turn.season_id == season_id,
+        ledger.kind.notin_(PL_HIDDEN_KINDS),
+    )
+
+    if month_index is None:
+        month_index = db.execute(
+            select(func.max(models.Turn.month_index))
+            .select_from(ledger)
+            .join(models.Turn, models.Turn.id == ledger.turn_id)
+            .where(*scope)
+        ).scalar()
+
+    result = {
+        "club_id": club_id,
+        "season_id": season_id,
+        "season_number": season.season_number,
+        "month_index": month_index,
+        "month": [],
+        "month_total": None,
+        "season": [],
+        "season_total": None,
+    }
+    if month_index is None:
+        return result
+
+    kind_expr = _pl_kind_expression().label("kind")
+    in_month = models.Turn.month_index == month_index
+    order_index = case(
+        {kind: idx for idx, kind in enumerate(PL_KIND_ORDER)},
+        value=kind_expr,
+        else_=len(PL_KIND_ORDER),
+    )
+    stmt = (
+        select(
+            kind_expr,
+            func.coalesce(func.sum(ledger.amount).filter(in_month), 0).label("month_amount"),
+            func.count().filter(in_month).label("month_entries"),
+            func.sum(ledger.amount).label("season_amount"),
+        )
+        .join(models.Turn, models.Turn.id == ledger.turn_id)
+        .where(*scope, models.Turn.month_index <= month_index)
+        .group_by(kind_expr)
+        .order_by(order_index, kind_expr)
+    )
+    rows = db.execute(stmt).all()
+
+    month_rows = [r for r in rows if r.month_entries]
+    # 累計表は収入行 → 費用行（0円行は費用側）
+    season_rows = [r for r in rows if r.season_amount > 0] + [r for r in rows if not r.season_amount > 0]
+
+    if month_rows:
+        result["month"] = [_pl_row(r.kind, r.month_amount) for r in month_rows]
+        result["month_total"] = _pl_total([r.month_amount for r in month_rows])
+    if season_rows:
+        result["season"] = [_pl_row(r.kind, r.season_amount) for r in season_rows]
+        result["season_total"] = _pl_total([r.season_amount for r in season_rows])
+    return result
+
+
 def _get_previous_season(db: Session, season: models.Season) -> models.Season | None:
     if season.season_number <= 1:
         return None
@@ -79,6 +230,7 @@ def _get_season_profit(db: Session, club_id: UUID, season_id: UUID) -> Decimal:
     return Decimal(total)
 
 
+@traced()
 def get_tax_info(db: Session, club_id: UUID, season_id: UUID) -> dict:
     season = db.execute(select(models.Season).where(models.Season.id == season_id)).scalar_one_or_none()
     if not season:
@@ -348,6 +500,10 @@ def finalize_turn_finance(db: Session, season_id: UUID, turn_id: UUID):
         if check_bankruptcy(db, club.id, turn_id):
             # 債務超過になった場合、勝点剥奪を適用
             apply_point_penalty(db, club.id, season_id, turn_id)
+
+    # 月次ダッシュボード（GET /clubs/{id}/dashboard 用の非正規化行）
+    from app.services import dashboard
+    dashboard.write_dashboards_for_turn(db, season, turn)
         
     db.commit()
 
@@ -4,8 +4,10 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.db import models
+from app.tracing import traced
 
 
+@traced()
 def get_hist_perf_value(db: Session, season_id: UUID, club_id: UUID) -> float:
     season = db.query(models.Season).filter(models.Season.id == season_id).first()
     if not season:
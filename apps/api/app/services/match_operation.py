@@ -8,8 +8,10 @@ from sqlalchemy import select
 
 from app.db import models
 from app.config.constants import MATCH_OPERATION_FIXED_COST
+from app.tracing import traced
 
 
+@traced()
 def process_match_operation_cost(
     db: Session, 
     club_id: UUID, 
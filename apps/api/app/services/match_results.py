@@ -11,6 +11,7 @@ from app.services import weather as weather_service
 from app.services import attendance as attendance_service
 from app.services import standings as standings_service
 from app.services import historical_performance
+from app.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,7 @@ SCORE_A = [((a, h), w) for (h, a), w in SCORE_W]
 
 # ---------------------------------------------------------
 
+@traced()
 def calculate_tp(db: Session, club_id: UUID, season_id: UUID) -> float:
     """
     Calculate Team Power (TP) based on Reinforcement and Academy.
@@ -89,6 +91,7 @@ def calculate_tp(db: Session, club_id: UUID, season_id: UUID) -> float:
     
     return term_b + term_a
 
+@traced()
 def get_streak(db: Session, club_id: UUID, season_id: UUID, current_turn_month: int) -> int:
     """
     Calculate current winning streak in the current season before this turn.
@@ -9,8 +9,10 @@ from sqlalchemy import select
 
 from app.db import models
 from app.config.constants import MERCHANDISE_SPEND_PER_PERSON, MERCHANDISE_MARGIN
+from app.tracing import traced
 
 
+@traced()
 def process_merchandise(
     db: Session, 
     club_id: UUID, 
@@ -8,6 +8,7 @@ from sqlalchemy import select
 
 from app.db import models
 from app.config.constants import PRIZE_AMOUNTS
+from app.tracing import traced
 
 
 def get_prize_amount_for_rank(rank: int) -> int:
@@ -15,6 +16,7 @@ def get_prize_amount_for_rank(rank: int) -> int:
     return PRIZE_AMOUNTS.get(rank, 0)
 
 
+@traced()
 def process_prize_revenue(
     db: Session, 
     club_id: UUID, 
@@ -0,0 +1,248 @@
+"""
+公開情報の事前シリアライズキャッシュ
+
+公開済みの情報（12月・7月の公開情報、チーム力、確定シーズンの拡張順位表、最終結果）は一度公開されると
+変化しないため、公開時点でJSONとgzipのバイト列をコンテンツアドレス（SHA-256）で
+ローカルディレクトリに保存する。観戦者の再読み込みは routers/public_cache.py が
+ファイルをそのまま返すだけで、DBには触れない。brotli は gzip より圧縮が遅いため
+公開時には作らず、br を受け付ける最初のリクエストで作って保存する（encoded_blob_path）。
+
+書き出しは公開処理のトランザクションが commit された後に行う（publish_* は
+内容をセッションに積むだけで、after_commit で書き込み、rollback なら捨てる）。
+認証の無い /api/public/* が、確定しなかった公開情報を配信しないようにするため。
+
+ディレクトリ構成:
+    {public_cache_dir}/blobs/{digest[:2]}/{digest}.json
+    {public_cache_dir}/blobs/{digest[:2]}/{digest}.json.gz
+    {public_cache_dir}/blobs/{digest[:2]}/{digest}.json.br   # 最初の br リクエスト時に作成
+    {public_cache_dir}/refs/{name}          # 論理名 -> digest
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.compression import available_encodings, compress
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_REF_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+_SUFFIXES = {None: ".json", "gzip": ".json.gz", "br": ".json.br"}
+# commit 待ちの (論理名, payload)
+_PENDING_KEY = "public_cache_pending"
+
+
+def _root() -> Path:
+    return Path(get_settings().public_cache_dir)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def serialize(payload: Any) -> bytes:
+    """APIレスポンスと同じ形のコンパクトなJSONバイト列に変換"""
+    return json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def blob_path(digest: str, encoding: Optional[str] = None) -> Optional[Path]:
+    """
+    digest に対応する保存済みファイルのパス（不正なdigestや未保存なら None）
+
+    encoding は None（非圧縮JSON）/ "gzip" / "br"。
+    """
+    if not _DIGEST_RE.match(digest) or encoding not in _SUFFIXES:
+        return None
+    path = _root() / "blobs" / digest[:2] / f"{digest}{_SUFFIXES[encoding]}"
+    return path if path.exists() else None
+
+
+def encoded_blob_path(digest: str, encoding: str) -> Optional[Path]:
+    """
+    圧縮版のパス。無ければ保存済みJSONから作って書き込む（作れなければ None）
+
+    brotli はここで初めて作る（store_blob は公開処理の中で呼ばれるため gzip だけにする）。
+    """
+    path = blob_path(digest, encoding)
+    if path is not None:
+        return path
+    if encoding not in available_encodings():
+        return None
+    json_path = blob_path(digest)
+    if json_path is None:
+        return None
+    settings = get_settings()
+    path = json_path.with_name(f"{digest}{_SUFFIXES[encoding]}")
+    _atomic_write(
+        path,
+        compress(json_path.read_bytes(), encoding, settings.compression_gzip_level, settings.compression_brotli_quality),
+    )
+    return path
+
+
+def store_blob(payload: Any) -> str:
+    """payload をシリアライズして保存し、digest を返す（同一内容なら再書き込みしない）"""
+    body = serialize(payload)
+    digest = hashlib.sha256(body).hexdigest()
+    base = _root() / "blobs" / digest[:2]
+    json_path = base / f"{digest}.json"
+    gzip_path = base / f"{digest}.json.gz"
+    # gzip を先に書く（.json の存在を「書き込み完了」の印にする）
+    if not gzip_path.exists():
+        _atomic_write(gzip_path, compress(body, "gzip", get_settings().compression_gzip_level))
+    if not json_path.exists():
+        _atomic_write(json_path, body)
+    return digest
+
+
+def set_ref(name: str, digest: str) -> None:
+    if not _REF_RE.match(name):
+        raise ValueError(f"invalid ref name: {name}")
+    _atomic_write(_root() / "refs" / name, digest.encode("ascii"))
+
+
+def read_ref(name: str) -> Optional[str]:
+    if not _REF_RE.match(name):
+        return None
+    path = _root() / "refs" / name
+    try:
+        digest = path.read_text(encoding="ascii").strip()
+    except OSError:
+        return None
+    return digest if _DIGEST_RE.match(digest) else None
+
+
+# =============================================================================
+# 論理名
+# =============================================================================
+
+def season_disclosures_ref(season_id: UUID) -> str:
+    return f"season-{season_id}-disclosures"
+
+
+def season_disclosure_ref(season_id: UUID, disclosure_type: str) -> str:
+    return f"season-{season_id}-disclosure-{disclosure_type}"
+
+
+def season_team_power_ref(season_id: UUID) -> str:
+    return f"season-{season_id}-team-power"
+
+
+def season_extended_standings_ref(season_id: UUID) -> str:
+    return f"season-{season_id}-standings-extended"
+
+
+def game_final_results_ref(game_id: UUID) -> str:
+    return f"game-{game_id}-final-results"
+
+
+# =============================================================================
+# 公開時の書き込み（commit 後）
+# =============================================================================
+
+def _defer(db: Session, name: str, payload: Any) -> None:
+    """論理名 name への書き込みを現在のトランザクションの commit 後に予約する"""
+    # トランザクションを確実に開始しておく（rollback 時に after_rollback が発火するように）
+    db.connection()
+    db.info.setdefault(_PENDING_KEY, []).append((name, payload))
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _write_pending(session: Session) -> None:
+    pending: List[Tuple[str, Any]] = session.info.pop(_PENDING_KEY, [])
+    for name, payload in pending:
+        try:
+            set_ref(name, store_blob(payload))
+        except (OSError, ValueError):
+            # 書き込み失敗は公開処理自体を失敗させない（DB側のAPIは引き続き利用可能）
+            logger.warning("Failed to write public cache %s", name, exc_info=True)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def publish_season_disclosures(db: Session, season_id: UUID) -> None:
+    """
+    シーズンの公開情報（一覧・種別ごと・チーム力）を commit 後に書き出す
+
+    public_disclosure.publish_* の flush 後に呼ばれる。内容はこの時点の
+    トランザクションから組み立て、ファイルへの書き込みだけを commit 後に行う。
+    """
+    from app.schemas import PublicDisclosureRead
+    from app.services import public_disclosure
+
+    try:
+        disclosures = public_disclosure.get_all_disclosures(db, season_id)
+        listing = [PublicDisclosureRead(**d).model_dump(mode="json") for d in disclosures]
+        _defer(db, season_disclosures_ref(season_id), listing)
+
+        latest_by_type = {}
+        for d in disclosures:  # created_at 降順
+            latest_by_type.setdefault(d["disclosure_type"], d)
+        for disclosure_type, latest in latest_by_type.items():
+            _defer(db, season_disclosure_ref(season_id, disclosure_type), latest)
+
+        # /team-power と同じ優先順位（7月 → 12月 → 引き継ぎ）
+        for disclosure_type in ("team_power_july", "team_power_december", "team_power_july_carried"):
+            if disclosure_type in latest_by_type:
+                _defer(db, season_team_power_ref(season_id), latest_by_type[disclosure_type])
+                break
+    except ValueError:
+        # 公開用の形に変換できない場合も公開処理自体は失敗させない
+        logger.warning("Failed to build public cache for season %s", season_id, exc_info=True)
+
+
+def publish_extended_standings(db: Session, season_id: UUID) -> None:
+    """
+    確定したシーズンの拡張順位表を commit 後に書き出す（ExtendedStandingsEntry と同じ形）
+
+    SeasonFinalizer.finalize が最終順位を flush した後に呼ぶ。確定後の順位表は
+    保存済みの最終順位から作られ、以降は変わらない。
+    """
+    from app.schemas import ExtendedStandingsEntry
+    from app.services.standings import StandingsCalculator
+
+    try:
+        standings = StandingsCalculator(db, season_id).calculate_with_may_extras()
+        payload = [ExtendedStandingsEntry(**entry).model_dump(mode="json") for entry in standings]
+    except ValueError:
+        logger.warning("Failed to build public standings for season %s", season_id, exc_info=True)
+        return
+    _defer(db, season_extended_standings_ref(season_id), payload)
+
+
+def publish_final_results(db: Session, game_id: UUID, results: List[dict]) -> None:
+    """最終結果を commit 後に書き出す（GameFinalResultRead と同じ形）"""
+    from app.schemas import GameFinalResultRead
+
+    try:
+        ordered = sorted(results, key=lambda r: r.get("final_sales_rank", 0))
+        payload = [GameFinalResultRead(**r).model_dump(mode="json") for r in ordered]
+    except ValueError:
+        logger.warning("Failed to build public cache for game %s", game_id, exc_info=True)
+        return
+    _defer(db, game_final_results_ref(game_id), payload)
@@ -22,8 +22,11 @@ from app.config.constants import (
     DISCLOSURE_MONTH_JULY,
 )
 from app.services.team_power import get_all_clubs_team_power, get_all_clubs_team_power_for_july
+from app.services.public_cache import publish_season_disclosures
+from app.tracing import traced
 
 
+@traced()
 def publish_financial_summary(
     db: Session,
     season_id: UUID,
@@ -94,10 +97,12 @@ def publish_financial_summary(
         db.add(disclosure)
     
     db.flush()
+    publish_season_disclosures(db, season_id)
     
     return {"clubs": disclosed_data}
 
 
+@traced()
 def publish_team_power_december(
     db: Session,
     season_id: UUID,
@@ -141,10 +146,12 @@ def publish_team_power_december(
         db.add(disclosure)
     
     db.flush()
+    publish_season_disclosures(db, season_id)
     
     return disclosed_data
 
 
+@traced()
 def publish_team_power_july(
     db: Session,
     season_id: UUID,
@@ -199,6 +206,7 @@ def publish_team_power_july(
         db.add(disclosure)
     
     db.flush()
+    publish_season_disclosures(db, season_id)
     
     return disclosed_data
 
@@ -407,6 +415,11 @@ def process_disclosure_for_turn(
     elif month_index == DISCLOSURE_MONTH_JULY:
         # 7月ターン終了時
         results["team_power"] = publish_team_power_july(db, season_id, turn_id)
+
+    if "team_power" in results:
+        # finalize_turn_finance で書いた当月ダッシュボードに新しい公開値を反映
+        from app.services import dashboard
+        dashboard.refresh_team_power(db, season_id, month_index)
     
     return results
 
@@ -463,5 +476,6 @@ def copy_team_power_july_to_new_season(
         db.add(new_disclosure)
     
     db.flush()
+    publish_season_disclosures(db, new_season_id)
     
     return carried_data
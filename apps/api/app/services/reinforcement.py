@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 from decimal import Decimal
 from app.db import models
+from app.tracing import traced
 
 def ensure_reinforcement_plan(db: Session, club_id: UUID, season_id: UUID):
     plan = db.execute(select(models.ClubReinforcementPlan).where(
@@ -46,6 +47,7 @@ def calculate_next_season_budget(db: Session, club_id: UUID, season_id: UUID) ->
     return total
 
 
+@traced()
 def update_next_season_reinforcement_plan(db: Session, club_id: UUID, season_id: UUID) -> Decimal:
     """Persist offseason reinforcement sum on current plan and next season plan if it exists."""
     total = calculate_next_season_budget(db, club_id, season_id)
@@ -69,6 +71,7 @@ def update_next_season_reinforcement_plan(db: Session, club_id: UUID, season_id:
     db.flush()
     return total
 
+@traced()
 def process_reinforcement_cost(db: Session, club_id: UUID, season_id: UUID, turn_id: UUID, month_index: int):
     """
     Calculate and record monthly reinforcement cost.
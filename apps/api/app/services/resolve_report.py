@@ -0,0 +1,130 @@
+"""
+ターン解決の性能レポート（turn_resolve_reports）
+
+resolve_turn の各フェーズの所要時間・SQL数、処理したクラブ数・試合数、
+書き込んだ元帳行数、tracemalloc によるピークメモリを1ターン1行で保存する。
+複数シーズンにわたる解決コストの伸びや、リリース間の性能劣化の確認に使う。
+
+ピークメモリは RESOLVE_TRACEMALLOC=true のときだけ計測する。tracemalloc は
+プロセス全体で有効になるため、計測中は同じワーカーの他リクエストも遅くなり、
+ピークは解決中に同じプロセスで確保されたメモリ全体（他スレッド分を含む）になる。
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db import models
+from app.db.query_stats import current_stats
+
+
+def _query_count() -> Optional[int]:
+    stats = current_stats()
+    return stats.queries if stats is not None else None
+
+
+class ResolveReportRecorder:
+    """resolve_turn の実行中に計測値を集め、finish() でレポート行を書き込む。"""
+
+    def __init__(self, db: Session, turn: models.Turn, club_count: int):
+        self.db = db
+        self.turn = turn
+        self.club_count = club_count
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self._owns_tracemalloc = False
+        self._started = time.perf_counter()
+        self._queries_at_start = _query_count()
+
+    def start(self) -> "ResolveReportRecorder":
+        # 他のリクエストが既に計測中の場合はピーク値が混ざるため記録しない
+        if get_settings().resolve_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._started = time.perf_counter()
+        self._queries_at_start = _query_count()
+        return self
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        queries_before = _query_count()
+        try:
+            yield
+        finally:
+            queries_after = _query_count()
+            self.phases[name] = {
+                "ms": round((time.perf_counter() - start) * 1000.0, 2),
+                "queries": (
+                    queries_after - queries_before
+                    if queries_before is not None and queries_after is not None
+                    else None
+                ),
+            }
+
+    def _stop_tracemalloc(self) -> Optional[int]:
+        if not self._owns_tracemalloc:
+            return None
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self._owns_tracemalloc = False
+        return peak // 1024
+
+    def abort(self) -> None:
+        self._stop_tracemalloc()
+
+    def finish(self) -> models.TurnResolveReport:
+        total_ms = round((time.perf_counter() - self._started) * 1000.0, 2)
+        peak_memory_kb = self._stop_tracemalloc()
+        queries_now = _query_count()
+        total_queries = (
+            queries_now - self._queries_at_start
+            if queries_now is not None and self._queries_at_start is not None
+            else None
+        )
+
+        fixtures_processed = (
+            self.db.query(func.count(models.Fixture.id))
+            .filter(
+                models.Fixture.season_id == self.turn.season_id,
+                models.Fixture.match_month_index == self.turn.month_index,
+                models.Fixture.is_bye.is_(False),
+            )
+            .scalar()
+        )
+        ledger_rows_written = (
+            self.db.query(func.count(models.ClubFinancialLedger.id))
+            .filter(models.ClubFinancialLedger.turn_id == self.turn.id)
+            .scalar()
+        )
+
+        report = (
+            self.db.query(models.TurnResolveReport)
+            .filter(models.TurnResolveReport.turn_id == self.turn.id)
+            .one_or_none()
+        )
+        if report is None:
+            report = models.TurnResolveReport(turn_id=self.turn.id, season_id=self.turn.season_id)
+            self.db.add(report)
+        report.season_number = self.turn.season.season_number
+        report.month_index = self.turn.month_index
+        report.total_ms = total_ms
+        report.phases = self.phases
+        report.total_queries = total_queries
+        report.clubs_processed = self.club_count
+        report.fixtures_processed = fixtures_processed or 0
+        report.ledger_rows_written = ledger_rows_written or 0
+        report.peak_memory_kb = peak_memory_kb
+        report.app_version = get_settings().app_version
+        return report
+
+
+def get_resolve_report(db: Session, turn_id) -> Optional[models.TurnResolveReport]:
+    return (
+        db.query(models.TurnResolveReport)
+        .filter(models.TurnResolveReport.turn_id == turn_id)
+        .one_or_none()
+    )
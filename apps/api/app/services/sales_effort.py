@@ -15,6 +15,7 @@ from app.config.constants import (
     SALES_EFFORT_LAMBDA_RET, SALES_EFFORT_LAMBDA_NEW,
     QUARTER_START_MONTHS,
 )
+from app.tracing import traced
 
 
 def get_quarter_from_month_index(month_index: int) -> int:
@@ -153,6 +154,7 @@ def update_cumulative_effort(
     sponsor_state.cumulative_effort_new = c_new_new
 
 
+@traced()
 def process_sales_effort_for_turn(
     db: Session,
     club_id: UUID,
@@ -6,7 +6,9 @@ from sqlalchemy import select, func, and_
 from fastapi import HTTPException, status
 
 from app.db import models
+from app.services.public_cache import publish_extended_standings
 from app.services.standings import StandingsCalculator
+from app.services.state_version import bump_state_version
 
 class SeasonFinalizer:
     def __init__(self, db: Session, season_id: UUID):
@@ -100,7 +102,11 @@ class SeasonFinalizer:
 
         season.is_finalized = True
         season.finalized_at = datetime.utcnow()
+        bump_state_version(self.db, self.season_id)
         self.db.add(season)
+        # PR-perf: 確定した拡張順位表を公開キャッシュに書き出す（commit 後）
+        self.db.flush()
+        publish_extended_standings(self.db, self.season_id)
         self.db.commit()
 
         return standings
@@ -12,6 +12,7 @@ from app.config.constants import (
     CONV_A0, CONV_A1, CONV_A2, CONV_A3,
     PIPELINE_PROB_EXISTING, PIPELINE_PROB_NEW,
 )
+from app.tracing import traced
 
 def ensure_sponsor_state(db: Session, club_id: UUID, season_id: UUID):
     state = db.execute(select(models.ClubSponsorState).where(
@@ -141,6 +142,7 @@ def get_performance_metrics(db: Session, club_id: UUID, season_id: UUID):
     
     return perf, followers, fan_growth
 
+@traced()
 def determine_next_sponsors(db: Session, club_id: UUID, season_id: UUID):
     """
     Determine N_next in July (Month 7 in calendar, Month 12 in index).
@@ -170,6 +172,7 @@ def determine_next_sponsors(db: Session, club_id: UUID, season_id: UUID):
     return state
 
 
+@traced()
 def process_pipeline_progress(db: Session, club_id: UUID, season_id: UUID, month_index: int):
     """
     Process sponsor pipeline progress for months 9-11 (Apr-Jun).
@@ -233,11 +236,33 @@ def _calculate_forecast_next_counts(
     Forecasts may fluctuate, but confirmations must remain non-decreasing.
     """
     perf, followers, fan_growth = get_performance_metrics(db, club_id, season_id)
+    return forecast_next_counts(
+        count=state.count,
+        cumulative_effort_ret=float(state.cumulative_effort_ret),
+        cumulative_effort_new=float(state.cumulative_effort_new),
+        perf=perf,
+        followers=followers,
+        fan_growth=fan_growth,
+        seed=f"{season_id}-{club_id}-forecast",
+    )
+
+
+def forecast_next_counts(
+    count: int,
+    cumulative_effort_ret: float,
+    cumulative_effort_new: float,
+    perf: float,
+    followers: float,
+    fan_growth: float,
+    seed: str,
+) -> tuple[int, int]:
+    """
+    Pure part of the forecast: takes the metrics gathered from the DB and draws
+    new-sponsor conversions from an RNG seeded with `seed`.
+    """
+    c_ret = cumulative_effort_ret
+    c_new = cumulative_effort_new
     
-    c_ret = float(state.cumulative_effort_ret)
-    c_new = float(state.cumulative_effort_new)
-    
-    seed = f"{season_id}-{club_id}-forecast"
     rng = random.Random(seed)
     
     # Churn calculation
@@ -246,11 +271,11 @@ def _calculate_forecast_next_counts(
     term_f = float(CHURN_C3) * fan_growth
     churn_raw = float(CHURN_C0) - term_c - term_p - term_f
     churn = max(float(CHURN_MIN), min(float(CHURN_MAX), churn_raw))
-    n_exist_next = round(state.count * (1.0 - churn))
+    n_exist_next = round(count * (1.0 - churn))
     
     # Leads calculation
     term_l_c = float(LEADS_L1) * math.log(1 + c_new)
-    term_l_n = float(LEADS_L2) * math.log(1 + state.count)
+    term_l_n = float(LEADS_L2) * math.log(1 + count)
     term_l_p = float(LEADS_L3) * (perf - 0.5)
     term_l_f = float(LEADS_L4) * math.log(1 + followers)
     leads_raw = float(LEADS_L0) + term_l_c + term_l_n + term_l_p + term_l_f
@@ -309,6 +334,7 @@ def get_next_sponsor_info(db: Session, club_id: UUID, season_id: UUID) -> dict:
         "is_finalized": state.next_count is not None,
     }
 
+@traced()
 def process_sponsor_revenue(db: Session, club_id: UUID, season_id: UUID, turn_id: UUID):
     """
     In August (Month 8), record revenue based on `count` * `unit_price`.
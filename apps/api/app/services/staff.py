@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.db import models
 from app.config.constants import STAFF_SALARY_ANNUAL
+from app.tracing import traced
 
 # Assumed v1Spec Constants
 BASE_HIRING_CHANCE = 0.8 # 80% base chance
@@ -98,6 +99,7 @@ def resolve_hiring(db: Session, club_id: UUID, season_id: UUID):
         
     db.flush()
 
+@traced()
 def process_staff_cost(db: Session, club_id: UUID, turn_id: UUID, month_index: int, season_id: UUID = None):
     """
     Calculate monthly staff cost.
@@ -1,13 +1,15 @@
 from typing import List, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.db.models import Match, MatchStatus, Fixture, Season, SeasonFinalStanding
+from app.tracing import traced
 
 class StandingsCalculator:
     def __init__(self, session: Session, season_id: UUID):
         self.session = session
         self.season_id = season_id
 
+    @traced("standings.calculate")
     def calculate(self, up_to_month: int = None, ignore_finalized: bool = False) -> List[Dict[str, Any]]:
         # 0. Check if season is finalized
         # If up_to_month is specified, we should ignore finalized state and recalculate.
@@ -16,7 +18,11 @@ class StandingsCalculator:
             return self._get_finalized_standings()
 
         # 1. Fetch all completed matches for the season
-        query = self.session.query(Match).join(Fixture).filter(
+        # fixture と両クラブを同時に読み込み、試合ごとの遅延ロード（N+1）を避ける
+        query = self.session.query(Match).join(Fixture).options(
+            joinedload(Match.fixture).joinedload(Fixture.home_club),
+            joinedload(Match.fixture).joinedload(Fixture.away_club),
+        ).filter(
             Fixture.season_id == self.season_id,
             Match.status == MatchStatus.played
         )
@@ -0,0 +1,33 @@
+"""
+シーズン状態バージョン管理
+
+順位表・日程・財務スナップショット・公開情報などの読み取り系データは
+resolve / advance / commit / 勝点剥奪 などの書き込み時にしか変化しない。
+書き込み側で `seasons.state_version` を単調増加させ、読み取り側は
+それを ETag として利用する（app.http_cache 参照）。
+"""
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Season
+
+
+def bump_state_version(db: Session, season_id: UUID) -> None:
+    """
+    シーズンの state_version をインクリメントする
+
+    UPDATE ... SET state_version = state_version + 1 を発行するだけで、
+    コミットは呼び出し側のトランザクションに任せる。
+    """
+    db.query(Season).filter(Season.id == season_id).update(
+        {Season.state_version: Season.state_version + 1},
+        synchronize_session=False,
+    )
+
+
+def get_state_version(db: Session, season_id: UUID) -> Optional[int]:
+    """シーズンの現在の state_version を取得（シーズンが存在しなければ None）"""
+    row = db.query(Season.state_version).filter(Season.id == season_id).first()
+    return row[0] if row else None
@@ -5,11 +5,13 @@ from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 
 from app.db import models
+from app.tracing import traced
 
 
 TEAM_OPERATION_RATE = Decimal("0.10")
 
 
+@traced()
 def process_team_operation_cost(db: Session, club_id: UUID, turn_id: UUID):
     """
     チーム運営費: 当月の強化費の10%
@@ -3,7 +3,9 @@ import random
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.db import models
+from app.tracing import traced
 
+@traced()
 def process_ticket_revenue(db: Session, club_id: UUID, season_id: UUID, turn_id: UUID, month_index: int):
     """
     Calculate ticket revenue for home matches in this month.
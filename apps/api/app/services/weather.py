@@ -1,5 +1,8 @@
 import random
 
+from app.tracing import traced
+
+@traced()
 def determine_weather() -> str:
     # 晴(0.55) / 曇(0.30) / 雨(0.15)
     r = random.random()
@@ -0,0 +1,163 @@
+"""
+ターン解決パイプラインの軽量スパン計測。
+
+`start_trace()` で開始したトレース内でのみ `span()` / `@traced` が記録され、
+それ以外の呼び出しでは contextvar を1回読むだけのno-opになる。各スパンは
+名前・親・club_id・所要時間・発行SQL数（db.query_stats による）を持ち、
+トレース終了時に TRACE_DIR/turn-{turn_id}.jsonl へJSON Linesで書き出す
+（同じターンを再解決した場合は上書き）。
+
+`GET /api/admin/traces/turns/{turn_id}` で取得でき、CLI の `gm trace` が
+フレーム風のツリーとして表示する。
+"""
+import functools
+import inspect
+import json
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.config import get_settings
+from app.db.query_stats import current_stats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    club_id: Optional[str]
+    start_ms: float
+    duration_ms: float = 0.0
+    queries: int = 0
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Trace:
+    trace_id: str
+    started: float
+    spans: List[Span] = field(default_factory=list)
+    stack: List[Span] = field(default_factory=list)
+
+
+_current: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+
+def _query_count() -> int:
+    stats = current_stats()
+    return stats.queries if stats is not None else 0
+
+
+@contextmanager
+def span(name: str, club_id=None, **attrs) -> Iterator[Optional[Span]]:
+    """トレース中であれば区間をスパンとして記録する。club_id は省略時に親から引き継ぐ。"""
+    trace = _current.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = trace.stack[-1] if trace.stack else None
+    if club_id is None and parent is not None:
+        club_id = parent.club_id
+    record = Span(
+        trace_id=trace.trace_id,
+        span_id=len(trace.spans),
+        parent_id=parent.span_id if parent else None,
+        name=name,
+        club_id=str(club_id) if club_id is not None else None,
+        start_ms=round((time.perf_counter() - trace.started) * 1000.0, 3),
+        attrs={k: str(v) for k, v in attrs.items()},
+    )
+    trace.spans.append(record)
+    trace.stack.append(record)
+    start = time.perf_counter()
+    queries_before = _query_count()
+    try:
+        yield record
+    finally:
+        record.duration_ms = round((time.perf_counter() - start) * 1000.0, 3)
+        record.queries = _query_count() - queries_before
+        trace.stack.pop()
+
+
+def traced(name: Optional[str] = None):
+    """
+    サービス関数をスパンで囲むデコレータ。
+
+    スパン名の既定値は `<module>.<function>`。引数に club_id があればスパンに記録する。
+    """
+
+    def decorator(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        signature = inspect.signature(func)
+        has_club_id = "club_id" in signature.parameters
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            club_id = None
+            if has_club_id:
+                club_id = signature.bind_partial(*args, **kwargs).arguments.get("club_id")
+            with span(span_name, club_id=club_id):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_path(turn_id) -> Path:
+    return Path(get_settings().trace_dir) / f"turn-{turn_id}.jsonl"
+
+
+def _export(trace: Trace, turn_id) -> None:
+    path = trace_path(turn_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as fh:
+            for record in trace.spans:
+                fh.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+    except OSError:
+        logger.exception("Failed to export trace for turn %s", turn_id)
+
+
+@contextmanager
+def start_trace(name: str, turn_id, **attrs) -> Iterator[Trace]:
+    """ルートスパン `name` でトレースを開始し、終了時にターン単位のファイルへ書き出す。"""
+    trace = Trace(trace_id=uuid.uuid4().hex, started=time.perf_counter())
+    token = _current.set(trace)
+    try:
+        with span(name, turn_id=turn_id, **attrs):
+            yield trace
+    finally:
+        _current.reset(token)
+        _export(trace, turn_id)
+
+
+def load_trace(turn_id) -> Optional[List[Dict[str, Any]]]:
+    path = trace_path(turn_id)
+    if not path.exists():
+        return None
+    with path.open(encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+__all__ = [
+    "Span",
+    "Trace",
+    "span",
+    "traced",
+    "start_trace",
+    "trace_path",
+    "load_trace",
+]
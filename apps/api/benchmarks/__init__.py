@@ -0,0 +1,8 @@
+"""
+性能ベンチマーク（pytest の対象外）
+
+- scale.py: 大規模ゲームをシードし、シーズン作成〜最終結果までの各ステップを計測
+  （要 PostgreSQL）
+
+apps/api をカレントディレクトリにして `python -m benchmarks.<name>` で実行する。
+"""
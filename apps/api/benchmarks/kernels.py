@@ -0,0 +1,211 @@
+"""
+モデル計算カーネルのマイクロベンチマーク（DB不要）
+
+試合・観客・ファンベース・営業努力・スポンサー予測・日程生成の純粋計算部分を
+timeit で繰り返し実行し、ns/op を報告する。
+
+    cd apps/api
+    python -m benchmarks.kernels                        # 一覧表示
+    python -m benchmarks.kernels --output kernels.json
+    python -m benchmarks.kernels --baseline kernels.json --tolerance 0.3
+
+各カーネルは repeat 回計測した最小値を採用する（ノイズは上振れ方向にしか乗らないため）。
+--baseline を指定すると ns/op を比較し、--tolerance を超えて遅くなったものがあれば
+終了コード1を返す。
+"""
+import argparse
+import platform
+import sys
+import timeit
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from benchmarks.stats import compare, format_comparison, load_results, write_results
+
+Kernel = Callable[[], Any]
+
+
+def _win_probs() -> Kernel:
+    from app.services.match_results import calculate_win_probs
+
+    return lambda: calculate_win_probs(31.5, 27.25)
+
+
+def _determine_score() -> Kernel:
+    from app.services.match_results import determine_score
+
+    seed = f"{uuid.UUID(int=1)}-{uuid.UUID(int=2)}-5"
+    return lambda: determine_score("H", 31.5, 27.25, seed)
+
+
+def _attendance() -> Kernel:
+    from app.services.attendance import calculate_attendance
+
+    promo = Decimal("3000000")
+    return lambda: calculate_attendance(72000, 58000, "sunny", 0.7, 0.55, promo, False)
+
+
+def _fanbase_step() -> Kernel:
+    from app.services.fanbase import step_fanbase
+
+    args = dict(
+        fb_rate=Decimal("0.06"),
+        cumulative_promo=Decimal("2500000"),
+        cumulative_ht=Decimal("1200000"),
+        last_ht_spend=Decimal("1000000"),
+        promo_spend=Decimal("3000000"),
+        ht_spend=Decimal("1500000"),
+        perf_val=0.6,
+        hist_perf_val=0.5,
+        epsilon=0.05,
+    )
+    return lambda: step_fanbase(**args)
+
+
+def _monthly_effort() -> Kernel:
+    from app.services.sales_effort import calculate_monthly_effort
+
+    spend = Decimal("5000000")
+    rho = Decimal("0.4")
+    return lambda: calculate_monthly_effort(4, spend, rho)
+
+
+def _sponsor_forecast() -> Kernel:
+    from app.services.sponsor import forecast_next_counts
+
+    seed = f"{uuid.UUID(int=1)}-{uuid.UUID(int=2)}-forecast"
+    return lambda: forecast_next_counts(
+        count=30,
+        cumulative_effort_ret=4.2,
+        cumulative_effort_new=3.1,
+        perf=0.6,
+        followers=9000.0,
+        fan_growth=0.02,
+        seed=seed,
+    )
+
+
+def _round_robin(clubs: int) -> Callable[[], Kernel]:
+    def setup() -> Kernel:
+        from app.services.fixtures import generate_round_robin
+
+        club_ids = [uuid.UUID(int=i + 1) for i in range(clubs)]
+        return lambda: generate_round_robin(club_ids, match_months=10)
+
+    return setup
+
+
+def _ledger_page() -> List[Dict[str, Any]]:
+    """台帳 API の1ページ分（500行）相当の行"""
+    return [
+        {
+            "turn_id": uuid.UUID(int=i // 20 + 1),
+            "month_index": i // 40 + 1,
+            "kind": "ticket_revenue" if i % 2 else "staff_cost",
+            "amount": Decimal(f"{(i * 7919) % 100000}.50"),
+            "meta": {"fixture_id": str(uuid.UUID(int=i)), "attendance": 12000 + i},
+            "created_at": datetime(2024, 8, 1, 12, 0, i % 60),
+        }
+        for i in range(500)
+    ]
+
+
+def _encode_stdlib() -> Kernel:
+    import json
+
+    from fastapi.encoders import jsonable_encoder
+
+    rows = _ledger_page()
+    return lambda: json.dumps(jsonable_encoder(rows), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_fast() -> Kernel:
+    from app.responses import render_json
+
+    rows = _ledger_page()
+    return lambda: render_json(rows)
+
+
+KERNELS: Dict[str, Callable[[], Kernel]] = {
+    "match.calculate_win_probs": _win_probs,
+    "match.determine_score": _determine_score,
+    "attendance.calculate_attendance": _attendance,
+    "fanbase.step_fanbase": _fanbase_step,
+    "sales_effort.calculate_monthly_effort": _monthly_effort,
+    "sponsor.forecast_next_counts": _sponsor_forecast,
+    "fixtures.generate_round_robin[10]": _round_robin(10),
+    "fixtures.generate_round_robin[80]": _round_robin(80),
+    "responses.encode_page[stdlib]": _encode_stdlib,
+    "responses.encode_page[fast]": _encode_fast,
+}
+
+
+def measure(kernel: Kernel, repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    """min_time 秒以上かかるループ回数を求め、repeat 回計測した最小値を ns/op で返す"""
+    timer = timeit.Timer(kernel)
+    number, _ = timer.autorange()
+    # autorange は 0.2 秒基準なので min_time に合わせて調整する
+    number = max(1, int(number * min_time / 0.2))
+    runs = timer.repeat(repeat=repeat, number=number)
+    per_op = sorted(run / number * 1e9 for run in runs)
+    return {
+        "ns_per_op": round(per_op[0], 1),
+        "median_ns_per_op": round(per_op[len(per_op) // 2], 1),
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def run_kernels(names: List[str], repeat: int = 5, min_time: float = 0.2) -> Dict[str, Dict[str, float]]:
+    return {name: measure(KERNELS[name](), repeat=repeat, min_time=min_time) for name in names}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="run only kernels whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing run")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="compare against a previous results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown ratio before flagging (0.3 = +30%%)")
+    args = parser.parse_args(argv)
+
+    names = [name for name in KERNELS if args.filter in name]
+    if not names:
+        parser.error(f"no kernel matches {args.filter!r}")
+
+    kernels = run_kernels(names, repeat=args.repeat, min_time=args.min_time)
+    results = {
+        "meta": {
+            "benchmark": "kernels",
+            "started_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+        },
+        "kernels": kernels,
+    }
+
+    width = max(len(name) for name in names)
+    for name, result in kernels.items():
+        ops = 1e9 / result["ns_per_op"] if result["ns_per_op"] else 0.0
+        print(f"{name.ljust(width)}  {result['ns_per_op']:>12,.1f} ns/op  {ops:>14,.0f} ops/s")
+
+    if args.output:
+        write_results(args.output, results)
+        print(f"[kernels] wrote {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = {name: r["ns_per_op"] for name, r in load_results(args.baseline).get("kernels", {}).items()}
+        rows = compare([(name, r["ns_per_op"]) for name, r in kernels.items()], baseline, args.tolerance)
+        print()
+        print("\n".join(format_comparison(rows, unit="ns/op")))
+        if any(r["regression"] for r in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+"""
+同時接続ロードテスト: 研修コホート（GM 1人 + クラブオーナー N人）を複数同時に走らせる
+
+起動済みの API（uvicorn + PostgreSQL）に対して、httpx の非同期クライアントで
+各コホートが open → commit → lock → resolve → ack → advance を繰り返す。
+オーナーは `/turns/seasons/{id}/current` を ETag 付きでポーリングして状態変化を待ち、
+思考時間をおいて commit / ack する。GM は全員の commit / ack を待ってから進行する。
+
+    cd apps/api
+    uvicorn app.main:app --workers 1 &
+    python -m benchmarks.load --base-url http://localhost:8000 --cohorts 10 --owners 5 --turns 12
+    python -m benchmarks.load --cohorts 40 --think 0.5,2 --poll 0.5 --output load.json
+
+エンドポイント（パステンプレート）ごとのスループット・p50/p95/p99・エラー率と、
+ロック/シリアライズ失敗（409/423、または本文に deadlock・could not serialize 等を含む応答）を
+集計する。API は DB エラーを 500 として返すため、本文で判別できない失敗は 5xx に計上される。
+コホート数を増やしながら p95 とエラー率の変化を見ることで、1ノードで捌ける
+同時コホート数の目安を得る。
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+
+from benchmarks.stats import summarize, write_results
+
+LOCK_FAILURE_STATUSES = (409, 423)
+LOCK_FAILURE_PATTERNS = (
+    "could not serialize",
+    "deadlock",
+    "lock timeout",
+    "could not obtain lock",
+    "concurrent update",
+)
+# API のクラブ数上限（POST /games/{id}/clubs）
+MAX_OWNERS = 5
+
+
+class StepFailed(Exception):
+    pass
+
+
+class CohortAborted(Exception):
+    pass
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+
+class Recorder:
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.lock_failures = 0
+        self.lock_failure_examples: List[str] = []
+        self.turns_completed = 0
+        self.cohort_failures: List[str] = []
+
+    def record(self, label: str, elapsed_ms: float, status: int, body: Optional[str] = None) -> None:
+        stats = self.endpoints[label]
+        stats.latencies_ms.append(elapsed_ms)
+        stats.statuses[str(status)] += 1
+        if status >= 400:
+            stats.errors += 1
+            if is_lock_failure(status, body):
+                self.lock_failures += 1
+                if len(self.lock_failure_examples) < 10:
+                    self.lock_failure_examples.append(f"{label} {status} {(body or '')[:200]}")
+
+    def record_exception(self, label: str, elapsed_ms: float, exc: Exception) -> None:
+        stats = self.endpoints[label]
+        stats.latencies_ms.append(elapsed_ms)
+        stats.statuses[type(exc).__name__] += 1
+        stats.errors += 1
+
+    def report(self, duration_s: float) -> Dict[str, Any]:
+        total = sum(len(s.latencies_ms) for s in self.endpoints.values())
+        errors = sum(s.errors for s in self.endpoints.values())
+        endpoints = {}
+        for label, stats in sorted(self.endpoints.items()):
+            summary = summarize(stats.latencies_ms)
+            summary["errors"] = stats.errors
+            summary["error_rate"] = round(stats.errors / len(stats.latencies_ms), 4) if stats.latencies_ms else 0.0
+            summary["rps"] = round(len(stats.latencies_ms) / duration_s, 2) if duration_s else 0.0
+            summary["statuses"] = dict(stats.statuses)
+            endpoints[label] = summary
+        return {
+            "duration_s": round(duration_s, 3),
+            "requests": total,
+            "throughput_rps": round(total / duration_s, 2) if duration_s else 0.0,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "lock_failures": self.lock_failures,
+            "lock_failure_examples": self.lock_failure_examples,
+            "turns_completed": self.turns_completed,
+            "turns_per_min": round(self.turns_completed / duration_s * 60.0, 2) if duration_s else 0.0,
+            "cohort_failures": self.cohort_failures,
+            "endpoints": endpoints,
+        }
+
+
+def is_lock_failure(status: int, body: Optional[str]) -> bool:
+    if status in LOCK_FAILURE_STATUSES:
+        return True
+    text = (body or "").lower()
+    return any(pattern in text for pattern in LOCK_FAILURE_PATTERNS)
+
+
+class Actor:
+    """1ユーザー分のクライアント。ポーリング用に ETag と直前の応答を保持する。"""
+
+    def __init__(self, http: httpx.AsyncClient, recorder: Recorder, email: str):
+        self.http = http
+        self.recorder = recorder
+        self.email = email
+        self._etags: Dict[str, str] = {}
+        self._cached: Dict[str, Any] = {}
+
+    async def call(self, label: str, method: str, path: str, json_body=None, conditional: bool = False):
+        headers = {"X-User-Email": self.email}
+        if conditional and path in self._etags:
+            headers["If-None-Match"] = self._etags[path]
+        start = time.perf_counter()
+        try:
+            resp = await self.http.request(method, path, json=json_body, headers=headers)
+        except httpx.HTTPError as exc:
+            self.recorder.record_exception(label, (time.perf_counter() - start) * 1000.0, exc)
+            raise StepFailed(f"{label}: {exc!r}") from exc
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        body = resp.text if resp.status_code >= 400 else None
+        self.recorder.record(label, elapsed_ms, resp.status_code, body)
+        if resp.status_code == 304:
+            return self._cached.get(path)
+        if resp.status_code >= 400:
+            raise StepFailed(f"{label}: {resp.status_code} {(body or '')[:200]}")
+        data = resp.json() if resp.content else None
+        if conditional and resp.headers.get("etag"):
+            self._etags[path] = resp.headers["etag"]
+            self._cached[path] = data
+        return data
+
+
+class Cohort:
+    def __init__(self, index: int, http: httpx.AsyncClient, recorder: Recorder, args):
+        self.index = index
+        self.args = args
+        self.recorder = recorder
+        self.rng = random.Random(f"{args.seed}-{index}")
+        self.gm = Actor(http, recorder, f"load-gm-{args.run_id}-{index}@example.com")
+        self.owners = [
+            Actor(http, recorder, f"load-owner-{args.run_id}-{index}-{i}@example.com")
+            for i in range(args.owners)
+        ]
+        self.game_id: Optional[str] = None
+        self.season_id: Optional[str] = None
+        self.club_ids: List[str] = []
+        self.committed: Dict[str, Set[str]] = defaultdict(set)
+        self.acked: Dict[str, Set[str]] = defaultdict(set)
+        self.done = False
+
+    async def think(self, bounds) -> None:
+        low, high = bounds
+        if high > 0:
+            await asyncio.sleep(self.rng.uniform(low, high))
+
+    async def setup(self) -> None:
+        gm = self.gm
+        game = await gm.call("POST /games", "POST", "/api/games", {"name": f"load {self.args.run_id} #{self.index}"})
+        self.game_id = game["id"]
+        for i, owner in enumerate(self.owners):
+            club = await gm.call(
+                "POST /games/{id}/clubs", "POST", f"/api/games/{self.game_id}/clubs", {"name": f"Load Club {i + 1}"}
+            )
+            self.club_ids.append(club["id"])
+            await gm.call(
+                "POST /games/{id}/memberships", "POST", f"/api/games/{self.game_id}/memberships",
+                {"email": owner.email, "role": "club_owner", "club_id": club["id"]},
+            )
+        season = await gm.call(
+            "POST /seasons/games/{id}", "POST", f"/api/seasons/games/{self.game_id}", {"year_label": "2025"}
+        )
+        self.season_id = season["id"]
+        await gm.call(
+            "POST /seasons/{id}/fixtures/generate", "POST", f"/api/seasons/{self.season_id}/fixtures/generate", {}
+        )
+
+    async def current(self, actor: Actor) -> Optional[Dict[str, Any]]:
+        return await actor.call(
+            "GET /turns/seasons/{id}/current", "GET", f"/api/turns/seasons/{self.season_id}/current", conditional=True
+        )
+
+    async def gm_retry(self, label: str, path: str) -> Any:
+        for attempt in range(self.args.retries + 1):
+            try:
+                return await self.gm.call(label, "POST", path)
+            except StepFailed:
+                if attempt == self.args.retries:
+                    raise
+                await asyncio.sleep(0.2 * (2 ** attempt))
+
+    async def gm_wait_for(self, members: Set[str], deadline: float) -> None:
+        """全クラブが揃うまで、GM もダッシュボードを見るように current をポーリングする"""
+        while len(members) < len(self.club_ids):
+            if time.monotonic() > deadline:
+                raise CohortAborted("timed out waiting for owners")
+            await self.current(self.gm)
+            await asyncio.sleep(self.args.poll)
+
+    async def run_gm(self) -> None:
+        try:
+            for _ in range(self.args.turns):
+                deadline = time.monotonic() + self.args.turn_timeout
+                turn = await self.current(self.gm)
+                if not turn:
+                    raise CohortAborted("no current turn")
+                turn_id = turn["id"]
+                await self.gm.call("POST /turns/{id}/open", "POST", f"/api/turns/{turn_id}/open")
+
+                await self.gm_wait_for(self.committed[turn_id], deadline)
+                await self.think(self.args.gm_think)
+                await self.gm_retry("POST /turns/{id}/lock", f"/api/turns/{turn_id}/lock")
+                await self.gm_retry("POST /turns/{id}/resolve", f"/api/turns/{turn_id}/resolve")
+
+                await self.gm_wait_for(self.acked[turn_id], deadline)
+                advanced = await self.gm_retry("POST /turns/{id}/advance", f"/api/turns/{turn_id}/advance")
+                self.recorder.turns_completed += 1
+                next_season = (advanced or {}).get("season_id")
+                if next_season and next_season != self.season_id:
+                    self.season_id = next_season
+                elif not next_season:
+                    break
+        finally:
+            self.done = True
+
+    async def run_owner(self, owner: Actor, club_id: str) -> None:
+        last_turn = None
+        while not self.done:
+            turn = await self.current(owner)
+            if not turn or turn["id"] == last_turn or turn["turn_state"] != "collecting":
+                await asyncio.sleep(self.args.poll)
+                continue
+            turn_id = turn["id"]
+            await owner.call(
+                "GET /turns/seasons/{id}/decisions/{club}/current", "GET",
+                f"/api/turns/seasons/{self.season_id}/decisions/{club_id}/current",
+            )
+            await self.think(self.args.think)
+            await owner.call(
+                "POST /turns/{id}/decisions/{club}/commit", "POST",
+                f"/api/turns/{turn_id}/decisions/{club_id}/commit", {"payload": {}},
+            )
+            self.committed[turn_id].add(club_id)
+
+            while not self.done:
+                turn = await self.current(owner)
+                if turn and turn["id"] == turn_id and turn["turn_state"] == "resolved":
+                    break
+                await asyncio.sleep(self.args.poll)
+            if self.done:
+                return
+            await self.think(self.args.ack_think)
+            await owner.call(
+                "POST /turns/{id}/ack", "POST", f"/api/turns/{turn_id}/ack", {"club_id": club_id, "ack": True}
+            )
+            self.acked[turn_id].add(club_id)
+            last_turn = turn_id
+
+    async def run(self) -> None:
+        try:
+            await self.setup()
+            owners = [self.run_owner(owner, club_id) for owner, club_id in zip(self.owners, self.club_ids)]
+            await asyncio.gather(self.run_gm(), *owners)
+        except (StepFailed, CohortAborted) as exc:
+            self.done = True
+            self.recorder.cohort_failures.append(f"cohort {self.index}: {exc}")
+
+
+async def run_load(args) -> Dict[str, Any]:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout) as http:
+        cohorts = [Cohort(i, http, recorder, args) for i in range(args.cohorts)]
+
+        async def start(cohort: Cohort) -> None:
+            if args.ramp > 0:
+                await asyncio.sleep(args.ramp * cohort.index / max(1, args.cohorts))
+            await cohort.run()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(start(c) for c in cohorts))
+        duration = time.perf_counter() - started
+    return recorder.report(duration)
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    lines = [
+        f"duration {report['duration_s']:.1f}s  requests {report['requests']}  "
+        f"throughput {report['throughput_rps']:.1f} req/s  turns {report['turns_completed']} "
+        f"({report['turns_per_min']:.1f}/min)",
+        f"errors {report['errors']} ({report['error_rate'] * 100:.2f}%)  lock/serialization failures "
+        f"{report['lock_failures']}  failed cohorts {len(report['cohort_failures'])}",
+        "",
+    ]
+    width = max((len(label) for label in report["endpoints"]), default=10)
+    lines.append(
+        f"{'endpoint'.ljust(width)}  {'n':>6}  {'rps':>7}  {'p50':>8}  {'p95':>8}  {'p99':>8}  {'max':>8}  {'err%':>6}"
+    )
+    for label, s in report["endpoints"].items():
+        lines.append(
+            f"{label.ljust(width)}  {s['n']:>6}  {s['rps']:>7.2f}  {s['p50_ms']:>8.1f}  {s['p95_ms']:>8.1f}  "
+            f"{s['p99_ms']:>8.1f}  {s['max_ms']:>8.1f}  {s['error_rate'] * 100:>6.2f}"
+        )
+    for failure in report["cohort_failures"][:10]:
+        lines.append(f"! {failure}")
+    return lines
+
+
+def _bounds(value: str):
+    parts = [float(v) for v in value.split(",")]
+    return (parts[0], parts[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--cohorts", type=int, default=5, help="concurrent games")
+    parser.add_argument("--owners", type=int, default=MAX_OWNERS, help=f"club owners per cohort (max {MAX_OWNERS})")
+    parser.add_argument("--turns", type=int, default=12, help="turns each cohort plays")
+    parser.add_argument("--think", type=_bounds, default=(2.0, 8.0), help="owner think time before commit, 'min,max' seconds")
+    parser.add_argument("--ack-think", type=_bounds, default=(0.5, 3.0), help="owner think time before ack")
+    parser.add_argument("--gm-think", type=_bounds, default=(0.5, 2.0), help="GM pause before lock")
+    parser.add_argument("--poll", type=float, default=2.0, help="polling interval for /current, seconds")
+    parser.add_argument("--ramp", type=float, default=10.0, help="spread cohort start over this many seconds")
+    parser.add_argument("--retries", type=int, default=2, help="GM retries for lock/resolve/advance")
+    parser.add_argument("--turn-timeout", type=float, default=600.0)
+    parser.add_argument("--timeout", type=float, default=120.0, help="HTTP timeout, seconds")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--seed", default="load")
+    parser.add_argument("--output", type=Path, help="write report JSON here")
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.owners <= MAX_OWNERS:
+        parser.error(f"--owners must be between 1 and {MAX_OWNERS}")
+    args.run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+
+    report = asyncio.run(run_load(args))
+    report["meta"] = {
+        "benchmark": "load",
+        "base_url": args.base_url,
+        "cohorts": args.cohorts,
+        "owners": args.owners,
+        "turns": args.turns,
+        "think": list(args.think),
+        "poll": args.poll,
+        "started_at": args.run_id,
+    }
+    print("\n".join(format_report(report)))
+    if args.output:
+        write_results(args.output, report)
+        print(f"[load] wrote {args.output}", file=sys.stderr)
+    return 1 if report["cohort_failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+"""
+大規模ゲームの高速シード
+
+API の POST /games/{id}/clubs はクラブ数を5に制限しており、1件ずつコミットする。
+ベンチマーク用にはゲーム・GMメンバーシップ・クラブをまとめて直接 INSERT する。
+シーズン作成以降は通常の API を通す（計測対象のため）。
+"""
+import uuid
+from dataclasses import dataclass
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.db.models import Club, Game, GameStatus, Membership, MembershipRole, User
+
+
+@dataclass
+class SeededGame:
+    game_id: str
+    gm_email: str
+    club_ids: List[str]
+
+
+def seed_game(db: Session, clubs: int, name: str, gm_email: str = "bench-gm@example.com") -> SeededGame:
+    user = db.query(User).filter(User.email == gm_email).one_or_none()
+    if user is None:
+        user = User(email=gm_email, display_name="Benchmark GM")
+        db.add(user)
+        db.flush()
+
+    game = Game(id=uuid.uuid4(), name=name, status=GameStatus.active)
+    db.add(game)
+    db.flush()
+    db.add(Membership(game_id=game.id, user_id=user.id, role=MembershipRole.gm))
+
+    club_rows = [
+        Club(id=uuid.uuid4(), game_id=game.id, name=f"Bench Club {i + 1:03d}", short_name=f"B{i + 1:03d}")
+        for i in range(clubs)
+    ]
+    db.add_all(club_rows)
+    db.commit()
+    return SeededGame(game_id=str(game.id), gm_email=gm_email, club_ids=[str(c.id) for c in club_rows])
@@ -0,0 +1,73 @@
+"""ベンチマーク結果の集計とベースライン比較"""
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """最近傍順位法によるパーセンタイル（pct は 0〜100）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples_ms: Sequence[float]) -> Dict[str, float]:
+    if not samples_ms:
+        return {"n": 0}
+    return {
+        "n": len(samples_ms),
+        "total_ms": round(sum(samples_ms), 3),
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 3),
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3),
+    }
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def write_results(path: Path, results: Dict[str, Any]) -> None:
+    Path(path).write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    current: Iterable[Tuple[str, float]],
+    baseline: Dict[str, float],
+    tolerance: float,
+) -> List[Dict[str, Any]]:
+    """
+    (key, value) ごとにベースラインとの比率を出す。
+
+    value がベースラインの (1 + tolerance) 倍を超えたものを regression とする。
+    ベースラインに無いキーは比較対象外として ratio=None で返す。
+    """
+    rows = []
+    for key, value in current:
+        base = baseline.get(key)
+        ratio = (value / base) if base else None
+        rows.append({
+            "key": key,
+            "current": value,
+            "baseline": base,
+            "ratio": round(ratio, 3) if ratio is not None else None,
+            "regression": ratio is not None and ratio > 1.0 + tolerance,
+        })
+    return rows
+
+
+def format_comparison(rows: Sequence[Dict[str, Any]], unit: str = "ms") -> List[str]:
+    width = max((len(r["key"]) for r in rows), default=10)
+    lines = [f"{'key'.ljust(width)}  {'baseline':>12}  {'current':>12}  {'ratio':>7}"]
+    for r in rows:
+        base = f"{r['baseline']:.3f}" if r["baseline"] is not None else "-"
+        ratio = f"{r['ratio']:.2f}x" if r["ratio"] is not None else "new"
+        flag = "  REGRESSION" if r["regression"] else ""
+        lines.append(f"{r['key'].ljust(width)}  {base:>12}  {r['current']:>12.3f}  {ratio:>7}{flag}")
+    lines.append(f"({unit})")
+    return lines
@@ -13,8 +13,18 @@ from app.db.session import engine
 import app.db.models  # noqa: F401
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "no_db: does not touch the database (runs without PostgreSQL; no schema reset)"
+    )
+
+
 @pytest.fixture(autouse=True)
-def clean_database():
+def clean_database(request):
+    # DB を使わないと明示したテスト（ベンチマークのカーネルなど）は Postgres 無しでも走らせる
+    if request.node.get_closest_marker("no_db") is not None:
+        yield
+        return
     try:
         with engine.connect() as connection:
             connection.execute(text("SELECT 1"))
@@ -51,3 +61,26 @@ def db():
 @pytest.fixture
 def db_session(db):
     return db
+
+
+@pytest.fixture
+def query_budget():
+    """
+    ホットなエンドポイントのSQL発行数の上限を検証するヘルパ。
+
+        query_budget(client.get(...), max_queries=10)
+
+    レスポンスの X-DB-Queries ヘッダ（リクエスト単位の計測値）を読む。
+    """
+    from app.db.query_stats import QUERY_COUNT_HEADER
+
+    def _check(response, max_queries: int):
+        assert QUERY_COUNT_HEADER in response.headers, "query counter middleware is not installed"
+        issued = int(response.headers[QUERY_COUNT_HEADER])
+        assert issued <= max_queries, (
+            f"{response.request.method} {response.request.url.path} issued {issued} queries "
+            f"(budget {max_queries})"
+        )
+        return issued
+
+    return _check
@@ -0,0 +1,47 @@
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.kernels import KERNELS, measure
+from app.services.fanbase import F_MAX, step_fanbase
+from app.services.sponsor import forecast_next_counts
+
+pytestmark = pytest.mark.no_db
+
+
+def test_every_kernel_runs_without_database():
+    for name, setup in KERNELS.items():
+        kernel = setup()
+        assert kernel() is not None, name
+
+
+def test_measure_reports_ns_per_op():
+    result = measure(KERNELS["match.calculate_win_probs"](), repeat=1, min_time=0.01)
+    assert result["ns_per_op"] > 0
+    assert result["loops"] >= 1
+
+
+def test_step_fanbase_is_deterministic_and_capped():
+    args = dict(
+        fb_rate=Decimal("0.249"),
+        cumulative_promo=Decimal("50000000"),
+        cumulative_ht=Decimal("50000000"),
+        last_ht_spend=Decimal("0"),
+        promo_spend=Decimal("50000000"),
+        ht_spend=Decimal("50000000"),
+        perf_val=1.0,
+        hist_perf_val=1.0,
+        epsilon=0.0,
+    )
+    first = step_fanbase(**args)
+    assert first == step_fanbase(**args)
+    assert first.fb_rate <= F_MAX
+    assert abs(first.followers_public - first.fb_count) <= 1
+
+
+def test_forecast_next_counts_is_seeded():
+    kwargs = dict(
+        count=30, cumulative_effort_ret=4.0, cumulative_effort_new=3.0,
+        perf=0.6, followers=9000.0, fan_growth=0.02, seed="s-c-forecast",
+    )
+    assert forecast_next_counts(**kwargs) == forecast_next_counts(**kwargs)
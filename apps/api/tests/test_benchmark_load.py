@@ -0,0 +1,24 @@
+from benchmarks.load import Recorder, is_lock_failure
+
+
+def test_lock_failures_are_classified_by_status_or_body():
+    assert is_lock_failure(409, None)
+    assert is_lock_failure(500, "ERROR: deadlock detected")
+    assert is_lock_failure(500, "could not serialize access due to concurrent update")
+    assert not is_lock_failure(400, '{"detail": "Not all clubs acknowledged"}')
+
+
+def test_recorder_report_per_endpoint_error_rates():
+    recorder = Recorder()
+    for ms in (10.0, 20.0, 30.0):
+        recorder.record("POST /turns/{id}/lock", ms, 200)
+    recorder.record("POST /turns/{id}/lock", 40.0, 409, "conflict")
+    report = recorder.report(duration_s=2.0)
+
+    lock = report["endpoints"]["POST /turns/{id}/lock"]
+    assert lock["n"] == 4
+    assert lock["errors"] == 1
+    assert lock["error_rate"] == 0.25
+    assert lock["statuses"] == {"200": 3, "409": 1}
+    assert report["lock_failures"] == 1
+    assert report["throughput_rps"] == 2.0
@@ -0,0 +1,30 @@
+from benchmarks.stats import compare, percentile, summarize
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([], 95) == 0.0
+
+
+def test_summarize_reports_tail_latency():
+    summary = summarize([10.0, 20.0, 30.0, 1000.0])
+    assert summary["n"] == 4
+    assert summary["max_ms"] == 1000.0
+    assert summary["p99_ms"] == 1000.0
+    assert summary["p50_ms"] == 20.0
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    rows = compare(
+        [("10x1/resolve", 130.0), ("10x1/lock", 110.0), ("80x1/resolve", 900.0)],
+        {"10x1/resolve": 100.0, "10x1/lock": 100.0},
+        tolerance=0.2,
+    )
+    by_key = {row["key"]: row for row in rows}
+    assert by_key["10x1/resolve"]["regression"] is True
+    assert by_key["10x1/lock"]["regression"] is False
+    assert by_key["80x1/resolve"]["ratio"] is None
+    assert by_key["80x1/resolve"]["regression"] is False
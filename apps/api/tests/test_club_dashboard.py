@@ -0,0 +1,35 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def _headers(email: str):
+    return {"X-User-Email": email}
+
+
+def test_dashboard_written_on_resolve():
+    client = TestClient(app)
+    gm = _headers("gm-dash@example.com")
+
+    game_id = client.post("/api/games", json={"name": "Dashboard Game"}, headers=gm).json()["id"]
+    club_a = client.post(f"/api/games/{game_id}/clubs", json={"name": "Dash A"}, headers=gm).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Dash B"}, headers=gm)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=gm).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=gm)
+
+    before = client.get(f"/api/clubs/{club_a}/dashboard", params={"season_id": season_id}, headers=gm)
+    assert before.status_code == 404
+
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=gm).json()
+    for club in client.get(f"/api/games/{game_id}/clubs", headers=gm).json():
+        client.post(f"/api/turns/{turn['id']}/decisions/{club['id']}/commit", json={"payload": {}}, headers=gm)
+    assert client.post(f"/api/turns/{turn['id']}/lock", headers=gm).status_code == 200
+    assert client.post(f"/api/turns/{turn['id']}/resolve", headers=gm).status_code == 200
+
+    res = client.get(f"/api/clubs/{club_a}/dashboard", params={"season_id": season_id}, headers=gm)
+    assert res.status_code == 200
+    data = res.json()
+    assert data["month_index"] == 1
+    kinds = [item["kind"] for item in data["pl_season"]]
+    assert "admin_cost" in kinds
+    assert data["staff_counts"]
@@ -0,0 +1,108 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.responses import Response, StreamingResponse
+
+from app import compression
+from app.compression import CompressedCache, CompressionMiddleware, choose_encoding
+
+ROWS = [{"club_id": f"c{i}", "amount": i * 1000, "memo": "sponsor income"} for i in range(200)]
+
+
+def _client(**kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/rows")
+    def rows():
+        return ROWS
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/versioned")
+    def versioned():
+        return Response(content=b'"' + b"x" * 4096 + b'"', media_type="application/json", headers={"ETag": 'W/"v1"'})
+
+    @app.get("/private")
+    def private():
+        response = Response(content=b'"' + b"x" * 4096 + b'"', media_type="application/json", headers={"Vary": "Accept"})
+        response.headers.append("Vary", "X-User-Email")
+        return response
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter([b"data: {}\n\n"] * 200), media_type="text/event-stream")
+
+    app.add_middleware(CompressionMiddleware, **kwargs)
+    return TestClient(app)
+
+
+def test_choose_encoding_honours_q_values():
+    assert choose_encoding("gzip, deflate", ("br", "gzip")) == "gzip"
+    assert choose_encoding("br, gzip", ("br", "gzip")) == "br"
+    assert choose_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+    assert choose_encoding("gzip;q=0, *;q=0.1", ("br", "gzip")) == "br"
+    assert choose_encoding("identity", ("br", "gzip")) is None
+    assert choose_encoding("", ("gzip",)) is None
+
+
+def test_large_json_is_gzipped_and_small_is_not():
+    client = _client(min_size=1024, cache_bytes=0)
+
+    resp = client.get("/rows", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert int(resp.headers["content-length"]) < len(resp.content)  # httpx decoded it
+    assert resp.json() == ROWS
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.json() == {"ok": True}
+
+    identity = client.get("/rows", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+
+
+def test_every_vary_header_is_kept():
+    resp = _client(min_size=1024, cache_bytes=0).get("/private", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept, X-User-Email, Accept-Encoding"
+
+
+def test_event_stream_is_not_buffered_or_compressed():
+    resp = _client(min_size=16, cache_bytes=0).get("/events", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+    assert resp.text.startswith("data: {}")
+
+
+def test_etag_responses_reuse_compressed_bytes(monkeypatch):
+    calls = []
+    original = compression.compress
+    monkeypatch.setattr(compression, "compress", lambda body, encoding, *levels: calls.append(encoding) or original(body, encoding, *levels))
+    client = _client(min_size=1024, cache_bytes=1 << 20)
+
+    for _ in range(3):
+        resp = client.get("/versioned", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+    client.get("/rows", headers={"Accept-Encoding": "gzip"})
+    client.get("/rows", headers={"Accept-Encoding": "gzip"})
+
+    # /versioned is compressed once; /rows has no ETag and is compressed every time
+    assert calls == ["gzip", "gzip", "gzip"]
+
+
+def test_compressed_cache_evicts_by_size():
+    cache = CompressedCache(max_bytes=10)
+    cache.put(("a", "gzip"), b"12345")
+    cache.put(("b", "gzip"), b"12345")
+    cache.get(("a", "gzip"))
+    cache.put(("c", "gzip"), b"12345")
+    assert cache.get(("b", "gzip")) is None
+    assert cache.get(("a", "gzip")) == b"12345"
+
+
+def test_brotli_is_preferred_when_installed():
+    pytest.importorskip("brotli")
+    resp = _client(min_size=1024, cache_bytes=0).get("/rows", headers={"Accept-Encoding": "gzip, br"})
+    assert resp.headers["content-encoding"] == "br"
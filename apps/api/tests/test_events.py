@@ -0,0 +1,169 @@
+import asyncio
+import json
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import events
+from app.events import EventBus, PgListener, SeasonEvent, format_sse, wait_for_season_change
+from app.metrics import LONG_POLL_WAITS
+from app.routers.events import stream_events
+
+
+def _receive(bus: EventBus, clubs, emit, count: int, season_id: str = "s1"):
+    """購読してから別スレッドで emit(bus) を実行し終えた後、count 件受け取る"""
+
+    async def run():
+        subscription = bus.subscribe(season_id, clubs)
+        try:
+            thread = threading.Thread(target=emit, args=(bus,))
+            thread.start()
+            thread.join()
+            return [await asyncio.wait_for(subscription.queue.get(), timeout=1.0) for _ in range(count)]
+        finally:
+            bus.unsubscribe(subscription)
+
+    return asyncio.run(run())
+
+
+def test_bus_filters_club_private_events():
+    def emit(bus):
+        bus.dispatch(SeasonEvent(events.DECISION_COMMITTED, "s1", club_id="c2"))
+        bus.dispatch(SeasonEvent(events.DECISION_COMMITTED, "s1", club_id="c1"))
+        bus.dispatch(SeasonEvent(events.TURN_LOCKED, "s2"))
+        bus.dispatch(SeasonEvent(events.TURN_LOCKED, "s1"))
+
+    owner = _receive(EventBus(), {"c1"}, emit, 2)
+    assert [(e.type, e.club_id) for e in owner] == [(events.DECISION_COMMITTED, "c1"), (events.TURN_LOCKED, None)]
+
+    gm = _receive(EventBus(), None, emit, 3)
+    assert [e.club_id for e in gm] == ["c2", "c1", None]
+
+
+def test_bus_replaces_overflowing_queue_with_resync():
+    def emit(bus):
+        for month in range(5):
+            bus.dispatch(SeasonEvent(events.TURN_OPENED, "s1", data={"month_index": month}))
+
+    received = _receive(EventBus(queue_size=3), None, emit, 2)
+    assert received[0].type == events.RESYNC
+    assert received[1].data == {"month_index": 4}
+
+
+def test_publish_dispatches_after_commit_and_drops_on_rollback(monkeypatch):
+    bus = EventBus()
+    monkeypatch.setattr(events, "BUS", bus)
+    engine = create_engine("sqlite://")
+
+    def emit(_bus):
+        with Session(engine) as db:
+            events.publish(db, "s1", events.TURN_RESOLVED, turn_id="t1")
+            db.rollback()
+            events.publish(db, "s1", events.ACK_RECEIVED, club_id="c1", ack=True)
+            db.commit()
+
+    (received,) = _receive(bus, {"c1"}, emit, 1)
+    assert received.type == events.ACK_RECEIVED
+    assert received.public_payload() == {"season_id": "s1", "club_id": "c1", "ack": True}
+
+
+def test_listener_ignores_own_notifications(monkeypatch):
+    dispatched = []
+    bus = EventBus()
+    monkeypatch.setattr(bus, "dispatch", dispatched.append)
+    listener = PgListener("postgresql+psycopg2://u:p@localhost/db", bus=bus)
+
+    listener.handle(SeasonEvent(events.TURN_LOCKED, "s1").to_json())
+    listener.handle(SeasonEvent(events.TURN_LOCKED, "s1", origin="other-worker").to_json())
+    listener.handle("not json")
+
+    assert [(e.type, e.origin) for e in dispatched] == [(events.TURN_LOCKED, "other-worker")]
+
+
+def test_format_sse_is_one_json_line():
+    frame = format_sse("turn_locked", {"season_id": "s1", "month_index": 3})
+    assert frame.startswith("event: turn_locked\ndata: ")
+    assert frame.endswith("\n\n")
+    assert json.loads(frame.split("data: ", 1)[1]) == {"season_id": "s1", "month_index": 3}
+
+
+class _ConnectedRequest:
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+def test_stream_events_sends_snapshot_keepalive_and_events_then_unsubscribes():
+    async def run():
+        subscription = events.BUS.subscribe("s1", None)
+        stream = stream_events(_ConnectedRequest(), subscription, {"season_id": "s1", "turn": None}, keepalive_s=0.01)
+        frames = [await stream.__anext__() for _ in range(3)]
+        events.BUS.dispatch(SeasonEvent(events.TURN_LOCKED, "s1", data={"month_index": 2}))
+        while True:
+            frame = await stream.__anext__()
+            if not frame.startswith(":"):
+                break
+        await stream.aclose()
+        return frames, frame, events.BUS.subscriber_count("s1")
+
+    frames, frame, remaining = asyncio.run(run())
+    assert frames[0] == "retry: 3000\n\n"
+    assert frames[1] == format_sse("snapshot", {"season_id": "s1", "turn": None})
+    assert frames[2] == ": keepalive\n\n"
+    assert frame == format_sse(events.TURN_LOCKED, {"season_id": "s1", "month_index": 2})
+    assert remaining == 0
+
+
+def _wait(bus: EventBus, versions, after_version: int, timeout_s: float, recheck_s: float, on_wait=None):
+    """versions を順に返す read_state で待つ。on_wait(bus) は最初の読み取りの後に呼ばれる"""
+    reads = []
+
+    def read_state():
+        reads.append(len(reads))
+        return {"state_version": versions[min(len(reads) - 1, len(versions) - 1)]}
+
+    async def run():
+        waiter = asyncio.ensure_future(
+            wait_for_season_change("s1", after_version, timeout_s, read_state, recheck_s, LONG_POLL_WAITS, bus=bus)
+        )
+        while not reads:
+            await asyncio.sleep(0.001)
+        if on_wait is not None:
+            on_wait(bus)
+        return await waiter
+
+    state, changed = asyncio.run(run())
+    return state, changed, len(reads)
+
+
+def test_wait_wakes_on_season_event():
+    def on_wait(bus):
+        bus.dispatch(SeasonEvent(events.TURN_LOCKED, "s1"))
+        bus.dispatch(SeasonEvent(events.TURN_RESOLVED, "s1"))
+
+    bus = EventBus()
+    state, changed, reads = _wait(bus, [3, 4], after_version=3, timeout_s=5.0, recheck_s=5.0, on_wait=on_wait)
+    assert (state, changed, reads) == ({"state_version": 4}, True, 2)
+    assert bus.subscriber_count("s1") == 0
+
+
+def test_wait_returns_immediately_when_already_newer_and_times_out_otherwise():
+    assert _wait(EventBus(), [5], after_version=3, timeout_s=5.0, recheck_s=5.0)[1:] == (True, 1)
+    state, changed, reads = _wait(EventBus(), [3], after_version=3, timeout_s=0.05, recheck_s=0.02)
+    assert state == {"state_version": 3}
+    assert changed is False
+    assert reads >= 2
+
+
+def test_wait_rechecks_without_events():
+    state, changed, _ = _wait(EventBus(), [3, 3, 4], after_version=3, timeout_s=5.0, recheck_s=0.01)
+    assert (state, changed) == ({"state_version": 4}, True)
+
+
+def test_wait_returns_when_ack_count_changes_at_same_version():
+    from app.events import season_state_changed
+
+    assert not season_state_changed({"state_version": 4, "ack_count": 1}, 4)
+    assert not season_state_changed({"state_version": 4, "ack_count": 1}, 4, after_acks=1)
+    assert season_state_changed({"state_version": 4, "ack_count": 2}, 4, after_acks=1)
+    assert season_state_changed({"state_version": 5, "ack_count": 0}, 4, after_acks=1)
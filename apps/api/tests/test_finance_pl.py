@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+from app.db import models
+
+
+def test_finance_pl_normalizes_and_groups_in_sql(client, db, auth_headers):
+    game_id = client.post("/api/games", json={"name": "PL Game"}, headers=auth_headers).json()["id"]
+    club_id = client.post(f"/api/games/{game_id}/clubs", json={"name": "PL Club"}, headers=auth_headers).json()["id"]
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2024"}, headers=auth_headers).json()["id"]
+
+    turns = {
+        t.month_index: t
+        for t in db.query(models.Turn).filter(models.Turn.season_id == season_id).all()
+    }
+    entries = [
+        (1, "ticket_rev_fixture_a", Decimal("300")),
+        (1, "ticket_rev_fixture_b", Decimal("200")),
+        (1, "admin_cost", Decimal("-100")),
+        (2, "next_home_promo_expense", Decimal("-50")),
+        (2, "additional_reinforcement_applied", Decimal("0")),
+        (2, "sponsor", Decimal("1000")),
+    ]
+    for month_index, kind, amount in entries:
+        db.add(models.ClubFinancialLedger(club_id=club_id, turn_id=turns[month_index].id, kind=kind, amount=amount))
+    db.commit()
+
+    resp = client.get(f"/api/clubs/{club_id}/finance/pl", params={"season_id": season_id}, headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert data["month_index"] == 2
+    # the club-wide balance changes in later seasons, so it is not part of the season-tagged PL
+    assert "balance" not in data
+    assert [row["kind"] for row in data["month"]] == ["sponsor", "promo_expense"]
+    assert [row["kind"] for row in data["season"]] == ["sponsor", "ticket_rev", "promo_expense", "admin_cost"]
+    assert data["season"][1]["income"] == 500
+    assert data["season_total"]["net"] == 1350
+
+    first_month = client.get(
+        f"/api/clubs/{club_id}/finance/pl",
+        params={"season_id": season_id, "month_index": 1},
+        headers=auth_headers,
+    ).json()
+    assert [row["kind"] for row in first_month["month"]] == ["ticket_rev", "admin_cost"]
+    assert first_month["season_total"]["net"] == 400
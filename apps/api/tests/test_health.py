@@ -10,3 +10,43 @@ def test_health_endpoint():
     payload = response.json()
     assert payload["status"] == "ok"
     assert "club-management-api" in payload["app"]
+
+
+def test_health_reports_pool_status():
+    client = TestClient(app)
+    database = client.get("/api/health").json()["database"]
+    pool = database["pool"]
+    assert pool["checkedout"] >= 0
+    assert pool["capacity"] == pool["size"] + pool["max_overflow"]
+    assert database["application_name"].startswith("club-game-api:")
+
+
+def test_engine_options_pgbouncer_mode_avoids_session_state():
+    from app.config import Settings
+    from app.db.session import engine_options
+
+    direct = engine_options(Settings(db_statement_timeout_ms=5000, db_pool_size=3))
+    assert direct["pool_size"] == 3
+    assert direct["connect_args"]["options"] == "-c statement_timeout=5000"
+
+    pooled = engine_options(Settings(
+        database_url="postgresql+psycopg://postgres@pgbouncer:6432/club_game",
+        db_pgbouncer=True,
+        db_statement_timeout_ms=5000,
+    ))
+    assert "options" not in pooled["connect_args"]
+    assert pooled["connect_args"]["prepare_threshold"] is None
+
+
+def test_application_name_follows_the_worker_pid(monkeypatch):
+    from app.config import Settings
+    from app.db import session
+
+    settings = Settings(db_application_name="club-game-api")
+    monkeypatch.setattr(session, "_application_name", None)
+    monkeypatch.setattr(session.os, "getpid", lambda: 100)
+    assert session.application_name(settings) == "club-game-api:100"
+
+    # a worker forked after import gets its own pid, not the parent's
+    monkeypatch.setattr(session.os, "getpid", lambda: 200)
+    assert session.application_name(settings) == "club-game-api:200"
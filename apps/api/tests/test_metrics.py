@@ -0,0 +1,34 @@
+from app.metrics import Histogram
+
+
+def test_metrics_endpoint_reports_route_latency_and_resolve_phases(client, auth_headers):
+    game_id = client.post("/api/games", json={"name": "Metrics Game"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club M"}, headers=auth_headers)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=auth_headers)
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=auth_headers).json()
+    client.post(f"/api/turns/{turn['id']}/open", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/lock", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/resolve", headers=auth_headers)
+
+    resp = client.get("/api/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = resp.text
+    assert 'route="/api/turns/seasons/{season_id}/current"' in body
+    assert "club_game_http_requests_in_flight" in body
+    assert "club_game_db_pool_checkout_wait_seconds_count" in body
+    assert 'phase="matches",month_index="1",club_count="1"' in body
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = Histogram("test_latency_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+    hist.observe(0.05, route="/a")
+    hist.observe(0.5, route="/a")
+    hist.observe(5.0, route="/a")
+
+    lines = hist.render()
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'test_latency_seconds_count{route="/a"} 3' in lines
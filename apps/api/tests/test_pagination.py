@@ -0,0 +1,73 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.db.models import Season
+from app.main import app
+from app.pagination import decode_cursor, encode_cursor
+
+
+def _headers(email: str):
+    return {"X-User-Email": email}
+
+
+def test_clubs_keyset_pagination_and_projection():
+    client = TestClient(app)
+    gm = _headers("gm-page@example.com")
+
+    game_id = client.post("/api/games", json={"name": "Page Game"}, headers=gm).json()["id"]
+    for name in ("Charlie", "Alpha", "Bravo"):
+        client.post(f"/api/games/{game_id}/clubs", json={"name": name}, headers=gm)
+
+    first = client.get(f"/api/games/{game_id}/clubs", params={"limit": 2}, headers=gm)
+    assert first.status_code == 200
+    assert [c["name"] for c in first.json()] == ["Alpha", "Bravo"]
+    cursor = first.headers["x-next-cursor"]
+
+    second = client.get(f"/api/games/{game_id}/clubs", params={"limit": 2, "cursor": cursor}, headers=gm)
+    assert [c["name"] for c in second.json()] == ["Charlie"]
+    assert "x-next-cursor" not in second.headers
+
+    projected = client.get(f"/api/games/{game_id}/clubs", params={"fields": "name"}, headers=gm)
+    assert projected.json() == [{"name": "Alpha"}, {"name": "Bravo"}, {"name": "Charlie"}]
+
+    bad = client.get(f"/api/games/{game_id}/clubs", params={"fields": "name,secret"}, headers=gm)
+    assert bad.status_code == 400
+
+
+def test_seasons_list_pages_newest_first():
+    client = TestClient(app)
+    gm = _headers("gm-season-page@example.com")
+
+    game_id = client.post("/api/games", json={"name": "Season Page Game"}, headers=gm).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Solo"}, headers=gm)
+    for label in ("2024", "2025", "2026"):
+        client.post(f"/api/seasons/games/{game_id}", json={"year_label": label}, headers=gm)
+
+    page = client.get(f"/api/seasons/games/{game_id}", params={"limit": 2, "fields": "season_number"}, headers=gm)
+    assert page.json() == [{"season_number": 3}, {"season_number": 2}]
+    rest = client.get(
+        f"/api/seasons/games/{game_id}",
+        params={"limit": 2, "fields": "season_number", "cursor": page.headers["x-next-cursor"]},
+        headers=gm,
+    )
+    assert rest.json() == [{"season_number": 1}]
+
+    # a well-formed cursor with the wrong value types is a 400, not a database error
+    forged = encode_cursor(["three", str(uuid.uuid4())])
+    resp = client.get(f"/api/seasons/games/{game_id}", params={"limit": 2, "cursor": forged}, headers=gm)
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid cursor"
+
+
+def test_decode_cursor_coerces_values_to_column_types():
+    season_id = uuid.uuid4()
+    values = decode_cursor(encode_cursor([3, season_id]), 2, (Season.season_number, Season.id))
+    assert values == [3, season_id]
+
+    for forged in (["3", str(season_id)], [3, "not-a-uuid"], [True, str(season_id)]):
+        with pytest.raises(HTTPException) as excinfo:
+            decode_cursor(encode_cursor(forged), 2, (Season.season_number, Season.id))
+        assert excinfo.value.status_code == 400
@@ -1,3 +1,4 @@
+import json
 import pytest
 from uuid import uuid4
 from app.db.models import Match, Club, MatchStatus, Season, Game, GameStatus, Fixture, SeasonFinalStanding
@@ -179,3 +180,26 @@ def test_final_standings_matches_calculated(db):
         assert f_row['club_id'] == c_row['club_id']
         assert f_row['points'] == c_row['points']
         assert f_row['rank'] == c_row['rank']
+
+def test_finalize_writes_public_extended_standings(db, tmp_path, monkeypatch):
+    from app.services import public_cache
+
+    monkeypatch.setenv("PUBLIC_CACHE_DIR", str(tmp_path))
+    game = create_game(db)
+    season_id = uuid4()
+    season = Season(id=season_id, game_id=game.id, year_label="2025", status="running")
+    db.add(season)
+    db.commit()
+
+    c1 = create_club(db, "A", game.id)
+    c2 = create_club(db, "B", game.id)
+
+    create_fixture(db, season_id, c1, c2, month_index=1, played=True)
+
+    SeasonFinalizer(db, season_id).finalize()
+
+    digest = public_cache.read_ref(public_cache.season_extended_standings_ref(season_id))
+    assert digest is not None
+    rows = json.loads(public_cache.blob_path(digest).read_bytes())
+    assert [row["club_name"] for row in rows] == ["A", "B"]
+    assert rows[0]["title"] == "優勝"
@@ -0,0 +1,36 @@
+def _setup(client, gm_headers):
+    game_id = client.post("/api/games", json={"name": "Profile Game"}, headers=gm_headers).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club P"}, headers=gm_headers)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=gm_headers).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=gm_headers)
+    return season_id
+
+
+def test_operator_can_profile_request_and_read_hotspots(client, auth_headers, tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("OPERATOR_EMAILS", "ops@example.com, test@example.com")
+    season_id = _setup(client, auth_headers)
+
+    resp = client.get(f"/api/seasons/{season_id}/standings", params={"profile": 1}, headers=auth_headers)
+    assert resp.status_code == 200
+    profile_id = resp.headers["x-profile-id"]
+    assert (tmp_path / f"{profile_id}.collapsed").exists()
+
+    report = client.get(f"/api/admin/profiles/{profile_id}", params={"top": 5}, headers=auth_headers)
+    assert report.status_code == 200
+    body = report.json()
+    assert body["path"] == f"/api/seasons/{season_id}/standings"
+    assert len(body["hotspots"]) <= 5
+
+
+def test_non_operator_profile_flag_is_ignored(client, auth_headers, tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("OPERATOR_EMAILS", "ops@example.com")
+    season_id = _setup(client, auth_headers)
+    outsider = {"X-User-Email": "outsider@example.com"}
+
+    # ゲームのGMであっても運用者でなければプロファイルしない（他ゲームのリクエストも採取されるため）
+    for headers in (outsider, auth_headers):
+        resp = client.get(f"/api/seasons/{season_id}/standings", headers={**headers, "X-Profile": "1"})
+        assert "x-profile-id" not in resp.headers
+        assert client.get("/api/admin/profiles/" + "0" * 32, headers=headers).status_code == 403
@@ -0,0 +1,79 @@
+import gzip
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.services import public_cache
+
+
+def test_public_cache_serves_published_bytes(tmp_path, monkeypatch):
+    monkeypatch.setenv("PUBLIC_CACHE_DIR", str(tmp_path))
+    season_id = uuid.uuid4()
+    payload = {"disclosure_type": "team_power_july", "disclosed_data": {"clubs": [{"team_power": 12.5}]}}
+
+    digest = public_cache.store_blob(payload)
+    assert public_cache.store_blob(payload) == digest  # content-addressed
+    public_cache.set_ref(public_cache.season_team_power_ref(season_id), digest)
+
+    client = TestClient(app)
+    resp = client.get(f"/api/public/seasons/{season_id}/team-power")
+    assert resp.status_code == 200
+    assert resp.json() == payload
+    assert resp.headers["etag"] == f'"{digest}"'
+
+    not_modified = client.get(
+        f"/api/public/seasons/{season_id}/team-power", headers={"If-None-Match": f'"{digest}"'}
+    )
+    assert not_modified.status_code == 304
+
+    blob = client.get(f"/api/public/blobs/{digest}")
+    assert "immutable" in blob.headers["cache-control"]
+
+    raw = gzip.decompress(public_cache.blob_path(digest, "gzip").read_bytes())
+    assert json.loads(raw) == payload
+
+
+def test_public_cache_missing_ref_returns_404(tmp_path, monkeypatch):
+    monkeypatch.setenv("PUBLIC_CACHE_DIR", str(tmp_path))
+    client = TestClient(app)
+    resp = client.get(f"/api/public/games/{uuid.uuid4()}/final-results")
+    assert resp.status_code == 404
+
+
+def test_public_cache_writes_only_after_commit(tmp_path, monkeypatch):
+    monkeypatch.setenv("PUBLIC_CACHE_DIR", str(tmp_path))
+    engine = create_engine("sqlite://")
+    game_id = uuid.uuid4()
+    ref = public_cache.game_final_results_ref(game_id)
+
+    with Session(engine) as db:
+        public_cache._defer(db, ref, [{"club_name": "Rolled Back"}])
+        assert public_cache.read_ref(ref) is None
+        db.rollback()
+        db.commit()
+    assert public_cache.read_ref(ref) is None
+
+    with Session(engine) as db:
+        public_cache._defer(db, ref, [{"club_name": "Committed"}])
+        assert public_cache.read_ref(ref) is None
+        db.commit()
+    digest = public_cache.read_ref(ref)
+    assert json.loads(public_cache.blob_path(digest).read_bytes()) == [{"club_name": "Committed"}]
+
+
+def test_public_cache_builds_brotli_on_first_request(tmp_path, monkeypatch):
+    pytest.importorskip("brotli")
+    monkeypatch.setenv("PUBLIC_CACHE_DIR", str(tmp_path))
+    digest = public_cache.store_blob({"club_name": "Lazy"})
+    # only JSON and gzip are written while publishing
+    assert public_cache.blob_path(digest, "br") is None
+
+    resp = TestClient(app).get(f"/api/public/blobs/{digest}", headers={"Accept-Encoding": "br"})
+    assert resp.headers["content-encoding"] == "br"
+    assert resp.json() == {"club_name": "Lazy"}
+    assert public_cache.blob_path(digest, "br") is not None
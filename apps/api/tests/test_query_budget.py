@@ -0,0 +1,49 @@
+import pytest
+
+from app.db.query_stats import QueryStats, RepeatedQueryError, statement_shape
+
+
+def _setup_season(client, headers, clubs=4):
+    game_id = client.post("/api/games", json={"name": "Budget Game"}, headers=headers).json()["id"]
+    for i in range(clubs):
+        client.post(f"/api/games/{game_id}/clubs", json={"name": f"Club {i}"}, headers=headers)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=headers).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=headers)
+    return game_id, season_id
+
+
+def test_hot_read_endpoints_stay_within_budget(client, auth_headers, query_budget):
+    _, season_id = _setup_season(client, auth_headers)
+
+    query_budget(client.get(f"/api/turns/seasons/{season_id}/current", headers=auth_headers), max_queries=10)
+    query_budget(client.get(f"/api/seasons/{season_id}/standings", headers=auth_headers), max_queries=15)
+    query_budget(client.get(f"/api/seasons/{season_id}/schedule", headers=auth_headers), max_queries=10)
+
+
+def test_resolve_reports_phase_breakdown(client, auth_headers):
+    _, season_id = _setup_season(client, auth_headers, clubs=2)
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=auth_headers).json()
+    client.post(f"/api/turns/{turn['id']}/open", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/lock", headers=auth_headers)
+
+    resp = client.post(f"/api/turns/{turn['id']}/resolve", headers=auth_headers)
+    assert resp.status_code == 200
+    assert int(resp.headers["x-db-queries"]) > 0
+    assert float(resp.headers["x-db-time-ms"]) >= 0
+    phases = resp.headers["x-db-phases"]
+    for name in ("expenses", "matches", "finance", "disclosure"):
+        assert f"{name}=" in phases
+
+
+def test_statement_shape_ignores_literals_and_in_lists():
+    a = statement_shape("SELECT * FROM clubs WHERE id IN (%(id_1)s, %(id_2)s) LIMIT 1")
+    b = statement_shape("SELECT *\n  FROM clubs WHERE id IN (%(id_1)s) LIMIT 5")
+    assert a == b
+
+
+def test_strict_mode_raises_on_repeated_shape():
+    stats = QueryStats(threshold=2)
+    stats.check_shape("SELECT 1 FROM clubs WHERE id = %(id)s")
+    stats.check_shape("SELECT 1 FROM clubs WHERE id = %(id)s")
+    with pytest.raises(RepeatedQueryError):
+        stats.check_shape("SELECT 1 FROM clubs WHERE id = %(id)s")
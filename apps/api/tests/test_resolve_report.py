@@ -0,0 +1,34 @@
+def test_resolve_persists_performance_report(client, auth_headers):
+    game_id = client.post("/api/games", json={"name": "Report Game"}, headers=auth_headers).json()["id"]
+    for name in ("Club R1", "Club R2"):
+        client.post(f"/api/games/{game_id}/clubs", json={"name": name}, headers=auth_headers)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=auth_headers)
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=auth_headers).json()
+
+    assert client.get(f"/api/turns/{turn['id']}/resolve-report", headers=auth_headers).status_code == 404
+
+    client.post(f"/api/turns/{turn['id']}/open", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/lock", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/resolve", headers=auth_headers)
+
+    resp = client.get(f"/api/turns/{turn['id']}/resolve-report", headers=auth_headers)
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report["month_index"] == turn["month_index"]
+    assert set(report["phases"]) == {"expenses", "matches", "finance", "disclosure"}
+    assert report["clubs_processed"] == 2
+    assert report["ledger_rows_written"] > 0
+    assert report["total_queries"] >= sum(p["queries"] for p in report["phases"].values())
+    assert report["total_ms"] >= sum(p["ms"] for p in report["phases"].values()) * 0.99
+
+
+def test_resolve_report_requires_gm(client, auth_headers):
+    game_id = client.post("/api/games", json={"name": "Report Auth"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club X"}, headers=auth_headers)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=auth_headers)
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=auth_headers).json()
+
+    resp = client.get(f"/api/turns/{turn['id']}/resolve-report", headers={"X-User-Email": "nobody@example.com"})
+    assert resp.status_code == 403
@@ -0,0 +1,70 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from app import responses
+from app.db.models import TurnState
+from app.responses import FastJSONResponse, NegotiationMiddleware, prefers_msgpack
+
+PAYLOAD = {
+    "id": UUID(int=7),
+    "amount": Decimal("-1234.50"),
+    "count": Decimal("3"),
+    "at": datetime(2024, 8, 1, 12, 30, 5, 123456),
+    "state": TurnState.collecting,
+    "rows": [{"name": "クラブA", "value": None}],
+}
+
+
+def _app() -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(NegotiationMiddleware)
+
+    @app.get("/payload")
+    def payload():
+        return PAYLOAD
+
+    return app
+
+
+def test_json_matches_jsonable_encoder():
+    body = FastJSONResponse(PAYLOAD).body
+    assert json.loads(body) == jsonable_encoder(PAYLOAD)
+    assert b" " not in body.replace("クラブA".encode(), b"")
+
+
+def test_prefers_msgpack():
+    assert prefers_msgpack("application/msgpack")
+    assert prefers_msgpack("application/msgpack, application/json;q=0.9")
+    assert not prefers_msgpack("application/json, application/msgpack;q=0.5")
+    assert not prefers_msgpack("*/*")
+    assert not prefers_msgpack("application/msgpack;q=0")
+    assert not prefers_msgpack("")
+
+
+def test_without_msgpack_always_json(monkeypatch):
+    monkeypatch.setattr(responses, "msgpack", None)
+    response = TestClient(_app()).get("/payload", headers={"Accept": "application/msgpack"})
+    assert response.headers["content-type"] == "application/json"
+    assert "vary" not in response.headers
+    assert response.json()["amount"] == -1234.5
+
+
+def test_msgpack_negotiation():
+    msgpack = pytest.importorskip("msgpack")
+    client = TestClient(_app())
+
+    packed = client.get("/payload", headers={"Accept": "application/msgpack, application/json;q=0.9"})
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert packed.headers["vary"] == "Accept"
+    assert msgpack.unpackb(packed.content, raw=False) == jsonable_encoder(PAYLOAD)
+
+    plain = client.get("/payload")
+    assert plain.headers["content-type"] == "application/json"
+    assert plain.json() == jsonable_encoder(PAYLOAD)
@@ -0,0 +1,49 @@
+from app.db import slow_queries
+
+
+def test_slow_queries_are_recorded_with_caller_and_plan(client, auth_headers, monkeypatch):
+    # どの文も「遅い」扱いにし、SELECT は必ず EXPLAIN する
+    monkeypatch.setattr(slow_queries, "_threshold_ms", 0.0001)
+    monkeypatch.setattr(slow_queries, "_explain_sample", 1.0)
+    monkeypatch.setenv("OPERATOR_EMAILS", "ops@example.com")
+    operator = {"X-User-Email": "ops@example.com"}
+    slow_queries.clear_slow_queries()
+
+    game_id = client.post("/api/games", json={"name": "Slow Game"}, headers=auth_headers).json()["id"]
+    client.get(f"/api/games/{game_id}/clubs", headers=auth_headers)
+    assert slow_queries.wait_for_explains(timeout=10)
+
+    # ゲームのGM（auth_headers）でも運用者でなければ読めない・消せない
+    assert client.get("/api/admin/slow-queries", headers=auth_headers).status_code == 403
+    assert client.delete("/api/admin/slow-queries", headers=auth_headers).status_code == 403
+
+    resp = client.get("/api/admin/slow-queries", params={"limit": 500}, headers=operator)
+    assert resp.status_code == 200
+    entries = resp.json()
+    club_select = next(e for e in entries if e["sql"].startswith("SELECT") and "FROM clubs" in e["sql"])
+    assert club_select["caller"].startswith("routers/games.py")
+    assert any(name.startswith("game_id") for name in club_select["params"])
+    assert club_select["plan"] and "Execution Time" in club_select["plan"]
+    assert all(not e["sql"].startswith("EXPLAIN") for e in entries)
+
+    assert client.delete("/api/admin/slow-queries", headers=operator).status_code == 204
+
+
+def test_parameter_shape_hides_values():
+    assert slow_queries.parameter_shape({"id": "abc", "n": 3}) == {"id": "str", "n": "int"}
+    assert slow_queries.parameter_shape([{"a": 1}, {"a": 2}]) == {"rows": 2, "row": {"a": "int"}}
+
+
+def test_caller_skips_shared_query_helpers():
+    # db/ → pagination.py → routers/games.py の順に呼ばれた文はルーターの関数に帰属させる
+    root = slow_queries._APP_ROOT
+    namespace = {"slow_queries": slow_queries}
+    for filename, source in (
+        ("db/session.py", "def execute():\n    return slow_queries._caller()\n"),
+        ("pagination.py", "def keyset_select():\n    return execute()\n"),
+        ("routers/games.py", "def list_clubs():\n    return keyset_select()\n"),
+    ):
+        exec(compile(source, f"{root}/{filename}", "exec"), namespace)
+
+    assert namespace["list_clubs"]().startswith("routers/games.py:2 list_clubs")
+    assert namespace["keyset_select"]().startswith("pagination.py:2 keyset_select")
@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def _headers(email: str):
+    return {"X-User-Email": email}
+
+
+def test_standings_etag_and_state_version_bump():
+    client = TestClient(app)
+    gm_headers = _headers("gm-etag@example.com")
+
+    game_id = client.post("/api/games", json={"name": "ETag Game"}, headers=gm_headers).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club A"}, headers=gm_headers)
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club B"}, headers=gm_headers)
+    season = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=gm_headers).json()
+    season_id = season["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=gm_headers)
+
+    first = client.get(f"/api/seasons/{season_id}/standings", headers=gm_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = client.get(
+        f"/api/seasons/{season_id}/standings",
+        headers={**gm_headers, "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=gm_headers).json()
+    client.post(f"/api/turns/{turn['id']}/lock", headers=gm_headers)
+
+    after_write = client.get(
+        f"/api/seasons/{season_id}/standings",
+        headers={**gm_headers, "If-None-Match": etag},
+    )
+    assert after_write.status_code == 200
+    assert after_write.headers["etag"] != etag
+
+    version = client.get(f"/api/seasons/{season_id}", headers=gm_headers).json()["state_version"]
+    assert version > season["state_version"]
+
+
+def test_per_club_bodies_are_private_to_the_caller():
+    client = TestClient(app)
+    gm_headers = _headers("gm-private@example.com")
+
+    game_id = client.post("/api/games", json={"name": "Private Game"}, headers=gm_headers).json()["id"]
+    club_id = client.post(f"/api/games/{game_id}/clubs", json={"name": "Club A"}, headers=gm_headers).json()["id"]
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=gm_headers).json()["id"]
+
+    ledger_url = f"/api/clubs/{club_id}/finance/ledger"
+    first = client.get(ledger_url, params={"season_id": season_id}, headers=gm_headers)
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private"
+    assert "X-User-Email" in first.headers["vary"]
+
+    cached = client.get(
+        ledger_url,
+        params={"season_id": season_id},
+        headers={**gm_headers, "If-None-Match": first.headers["etag"]},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["cache-control"] == "private"
+
+    # season-wide bodies stay shareable
+    standings = client.get(f"/api/seasons/{season_id}/standings", headers=gm_headers)
+    assert "cache-control" not in standings.headers
@@ -0,0 +1,29 @@
+def test_resolve_exports_span_tree(client, auth_headers, tmp_path, monkeypatch):
+    monkeypatch.setenv("TRACE_DIR", str(tmp_path))
+    game_id = client.post("/api/games", json={"name": "Trace Game"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club T1"}, headers=auth_headers)
+    client.post(f"/api/games/{game_id}/clubs", json={"name": "Club T2"}, headers=auth_headers)
+    season_id = client.post(f"/api/seasons/games/{game_id}", json={"year_label": "2025"}, headers=auth_headers).json()["id"]
+    client.post(f"/api/seasons/{season_id}/fixtures/generate", json={}, headers=auth_headers)
+    turn = client.get(f"/api/turns/seasons/{season_id}/current", headers=auth_headers).json()
+    client.post(f"/api/turns/{turn['id']}/open", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/lock", headers=auth_headers)
+    client.post(f"/api/turns/{turn['id']}/resolve", headers=auth_headers)
+
+    assert (tmp_path / f"turn-{turn['id']}.jsonl").exists()
+    spans = client.get(f"/api/admin/traces/turns/{turn['id']}", headers=auth_headers).json()
+    by_id = {s["span_id"]: s for s in spans}
+    root = next(s for s in spans if s["parent_id"] is None)
+    assert root["name"] == "resolve"
+    phases = {s["name"] for s in spans if s["parent_id"] == root["span_id"]}
+    assert phases == {"expenses", "matches", "finance", "disclosure"}
+
+    staff_spans = [s for s in spans if s["name"] == "staff.process_staff_cost"]
+    assert len(staff_spans) == 2
+    assert all(by_id[s["parent_id"]]["name"] == "expenses" for s in staff_spans)
+    assert all(s["club_id"] for s in staff_spans)
+
+    # 別ゲームのGM（誰でもゲームを作ればGMになれる）には見せない
+    other_gm = {"X-User-Email": "other-gm@example.com"}
+    client.post("/api/games", json={"name": "Other Game"}, headers=other_gm)
+    assert client.get(f"/api/admin/traces/turns/{turn['id']}", headers=other_gm).status_code == 403
@@ -1,14 +1,37 @@
 """Thin HTTP client wrapper for the CLI."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import importlib.util
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from urllib.parse import urljoin
 
 import httpx
 
+from .cache import LocalCache
 from .errors import ApiError, CliError
 
 DEFAULT_TIMEOUT = 10.0
+ETAG_CACHE_SIZE = 128
+# Upper bound on in-flight requests for a fan-out (one HTTP/2 connection multiplexes them)
+DEFAULT_MAX_CONCURRENCY = 6
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Server sends a keepalive comment every ~15 s; a silent stream for this long is dead
+STREAM_READ_TIMEOUT = 60.0
+
+# Server-side wait per long-poll request (/turns/seasons/{id}/wait caps it at 60 s)
+LONG_POLL_WAIT = 30.0
+
+# Rows per request when walking a keyset-paginated list (server caps it at 500)
+PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# A GET for fan-out: either a path or (path, params)
+GetRequest = Union[str, Tuple[str, Optional[Dict[str, Any]]]]
 
 
 def format_api_error(status_code: int, body: Optional[str]) -> str:
@@ -31,72 +54,330 @@ def format_api_error(status_code: int, body: Optional[str]) -> str:
     return f"{prefix}: {detail}" if detail else prefix
 
 
-class ApiClient:
-    def __init__(self, base_url: str, headers: Dict[str, str], timeout: float = DEFAULT_TIMEOUT, verbose: bool = False):
-        self.base_url = base_url.rstrip("/") + "/"
-        self.timeout = timeout
-        self.verbose = verbose
-        self._client = httpx.Client(headers=headers, timeout=self.timeout)
+def http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1 without it."""
+    return importlib.util.find_spec("h2") is not None
 
-    def close(self) -> None:
-        self._client.close()
+
+def msgpack_available() -> bool:
+    """Compact msgpack responses need the optional `msgpack` package; without it the CLI asks for JSON."""
+    global _MSGPACK_AVAILABLE
+    if _MSGPACK_AVAILABLE is None:
+        _MSGPACK_AVAILABLE = importlib.util.find_spec("msgpack") is not None
+    return _MSGPACK_AVAILABLE
+
+
+_MSGPACK_AVAILABLE: Optional[bool] = None
+
+
+def brotli_available() -> bool:
+    """httpx decodes `br` responses only with the optional `brotli` (or `brotlicffi`) package."""
+    global _BROTLI_AVAILABLE
+    if _BROTLI_AVAILABLE is None:
+        _BROTLI_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+    return _BROTLI_AVAILABLE
+
+
+_BROTLI_AVAILABLE: Optional[bool] = None
+
+
+def accept_headers() -> Dict[str, str]:
+    """
+    Accept headers for API requests.
+
+    Opts into msgpack (the API answers JSON when it cannot) and advertises the
+    content encodings httpx can decode here, so large responses come back
+    gzip/brotli-compressed.
+    """
+    headers = {"Accept-Encoding": "br, gzip, deflate" if brotli_available() else "gzip, deflate"}
+    if msgpack_available():
+        headers["Accept"] = f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.9"
+    return headers
+
+
+def _decode(response: httpx.Response) -> Any:
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith(MSGPACK_MEDIA_TYPE):
+        import msgpack
+
+        return msgpack.unpackb(response.content, raw=False)
+    if content_type.startswith("application/json"):
+        return response.json()
+    return response.text
+
+
+_MISS = object()
+
+
+def iter_sse(lines: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """Parse a text/event-stream into (event type, data) pairs; JSON data is decoded."""
+    event_type, data_lines = "message", []
+    for line in lines:
+        if not line:
+            if data_lines:
+                raw = "\n".join(data_lines)
+                try:
+                    data: Any = json.loads(raw)
+                except ValueError:
+                    data = raw
+                yield event_type, data
+            event_type, data_lines = "message", []
+            continue
+        if line.startswith(":"):
+            continue  # comment / keepalive
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event_type = value
+        elif field == "data":
+            data_lines.append(value)
+
+
+def _split_request(request: GetRequest) -> Tuple[str, Optional[Dict[str, Any]]]:
+    if isinstance(request, str):
+        return request, None
+    return request[0], request[1]
+
+
+class _EtagCacheMixin:
+    base_url: str
+    verbose: bool
+    cache: Optional[LocalCache]
+    _etag_cache: "OrderedDict[Tuple[str, Tuple], Tuple[str, Any]]"
 
     def _url(self, path: str) -> str:
         path = path.lstrip("/")
         return urljoin(self.base_url, path)
 
-    def _log(self, method: str, url: str, status: Optional[int] = None) -> None:
+    def _log(self, method: str, url: str, status: Optional[Union[int, str]] = None) -> None:
         if self.verbose:
             suffix = f" -> {status}" if status is not None else ""
             print(f"{method} {url}{suffix}")
 
-    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Tuple]:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+        return url, items
+
+    def _remember_etag(self, key: Tuple[str, Tuple], etag: str, data: Any) -> None:
+        self._etag_cache[key] = (etag, data)
+        self._etag_cache.move_to_end(key)
+        while len(self._etag_cache) > ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
+
+    @staticmethod
+    def _disk_key(key: Tuple[str, Tuple]) -> str:
+        return f"{key[0]}?{key[1]!r}"
+
+    def _prepare_get(self, path: str, params: Optional[Dict[str, Any]]):
+        """
+        Returns (url, key, cached, headers, hit). `hit` is a body served from the
+        on-disk cache without a request (finished-season data), else _MISS.
+        """
         url = self._url(path)
-        try:
-            response = self._client.get(url, params=params)
-        except httpx.RequestError as exc:
-            raise CliError(f"Network error: {exc}") from exc
+        key = self._cache_key(url, params)
+        cached = self._etag_cache.get(key)
+        if cached is None and self.cache is not None:
+            entry = self.cache.load_response(self._disk_key(key))
+            if entry is not None:
+                if entry.get("immutable") and self.cache.is_immutable(path):
+                    self._log("GET", url, "cache")
+                    return url, key, None, None, entry["body"]
+                if entry.get("etag"):
+                    cached = (entry["etag"], entry["body"])
+                    self._etag_cache[key] = cached
+        headers = {"If-None-Match": cached[0]} if cached else None
+        return url, key, cached, headers, _MISS
 
+    def _handle_get(self, path: str, url: str, key: Tuple[str, Tuple], cached, response: httpx.Response) -> Any:
         self._log("GET", url, response.status_code)
 
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1]
         if response.status_code >= 400:
             text = response.text
             raise ApiError(response.status_code, response.reason_phrase, body=text)
-        if response.headers.get("content-type", "").startswith("application/json"):
-            return response.json()
-        return response.text
+        data = _decode(response)
+        etag = response.headers.get("etag")
+        if etag:
+            self._remember_etag(key, etag, data)
+        if self.cache is not None:
+            self.cache.store_response(self._disk_key(key), path, etag, data)
+        return data
 
-    def post(self, path: str, json_body: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
-        url = self._url(path)
+    def _handle_write(self, method: str, url: str, response: httpx.Response) -> Any:
+        self._log(method, url, response.status_code)
+
+        if response.status_code >= 400:
+            text = response.text
+            raise ApiError(response.status_code, format_api_error(response.status_code, text), body=text)
+        return _decode(response)
+
+
+class ApiClient(_EtagCacheMixin):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        timeout: float = DEFAULT_TIMEOUT,
+        verbose: bool = False,
+        cache: Optional[LocalCache] = None,
+        http: Optional[httpx.Client] = None,
+    ):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cache = cache
+        self._headers = {**accept_headers(), **headers}
+        # `http` lets several clients (one per user, see session.CliSession) share a
+        # connection pool; headers and timeout are then sent per request and the pool
+        # is not ours to close.
+        self._owns_http = http is None
+        self._client = http if http is not None else httpx.Client(headers=self._headers, timeout=self.timeout)
+        # (url, params) -> (etag, decoded body); small LRU for If-None-Match
+        self._etag_cache: "OrderedDict[Tuple[str, Tuple], Tuple[str, Any]]" = OrderedDict()
+        # Created on the first get_many() and kept for the life of the command (keep-alive)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async: Optional["AsyncApiClient"] = None
+
+    def close(self) -> None:
+        if self._owns_http:
+            self._client.close()
+        if self._async is not None and self._loop is not None:
+            self._loop.run_until_complete(self._async.aclose())
+        if self._loop is not None:
+            self._loop.close()
+        self._async = None
+        self._loop = None
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        url, key, cached, headers, hit = self._prepare_get(path, params)
+        if hit is not _MISS:
+            return hit
         try:
-            response = self._client.post(url, json=json_body, params=params)
+            response = self._client.get(
+                url, params=params, headers={**self._headers, **(headers or {})}, timeout=self.timeout
+            )
         except httpx.RequestError as exc:
             raise CliError(f"Network error: {exc}") from exc
+        return self._handle_get(path, url, key, cached, response)
 
-        self._log("POST", url, response.status_code)
+    def get_many(self, requests: Sequence[GetRequest]) -> List[Any]:
+        """
+        Issue independent GETs concurrently and return their bodies in request order.
 
-        if response.status_code >= 400:
-            text = response.text
-            raise ApiError(response.status_code, format_api_error(response.status_code, text), body=text)
-        if response.headers.get("content-type", "").startswith("application/json"):
-            return response.json()
-        return response.text
+        Uses an AsyncApiClient (HTTP/2 when available) that shares this client's
+        headers, timeout and ETag cache. The first failing request, in request
+        order, is raised after all requests have finished.
+        """
+        if len(requests) <= 1:
+            return [self.get(*_split_request(r)) for r in requests]
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        if self._async is None:
+            self._async = AsyncApiClient(
+                self.base_url,
+                headers=self._headers,
+                timeout=self.timeout,
+                verbose=self.verbose,
+                etag_cache=self._etag_cache,
+                cache=self.cache,
+            )
+        self._async.timeout = self.timeout
+        return self._loop.run_until_complete(self._async.get_many(requests))
 
-    def put(self, path: str, json_body: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+    def iter_pages(self, path: str, params: Optional[Dict[str, Any]] = None, page_size: int = PAGE_SIZE) -> Iterator[Any]:
+        """
+        Yield the rows of a list endpoint page by page (limit/cursor, next page from X-Next-Cursor).
+
+        Only one page is held at a time and pages bypass the ETag cache. An
+        endpoint without pagination simply arrives as a single page.
+        """
+        url = self._url(path)
+        query: Dict[str, Any] = {**(params or {}), "limit": page_size}
+        while True:
+            try:
+                response = self._client.get(url, params=query, headers=self._headers, timeout=self.timeout)
+            except httpx.RequestError as exc:
+                raise CliError(f"Network error: {exc}") from exc
+            page = self._handle_write("GET", url, response)
+            if isinstance(page, list):
+                yield from page
+            elif page is not None:
+                yield page
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if not cursor:
+                return
+            query["cursor"] = cursor
+
+    def stream_events(self, path: str, read_timeout: float = STREAM_READ_TIMEOUT) -> Iterator[Tuple[str, Any]]:
+        """
+        Follow a Server-Sent Events endpoint, yielding (event type, data).
+
+        Raises ApiError for HTTP errors (and 406 when the server answers with
+        something other than an event stream) and CliError on network errors.
+        """
         url = self._url(path)
+        headers = {**self._headers, "Accept": "text/event-stream"}
         try:
-            response = self._client.put(url, json=json_body, params=params)
+            with self._client.stream(
+                "GET", url, headers=headers, timeout=httpx.Timeout(self.timeout, read=read_timeout)
+            ) as response:
+                self._log("GET", url, response.status_code)
+                if response.status_code >= 400:
+                    response.read()
+                    raise ApiError(response.status_code, response.reason_phrase, body=response.text)
+                if not response.headers.get("content-type", "").startswith("text/event-stream"):
+                    raise ApiError(406, "Not an event stream")
+                yield from iter_sse(response.iter_lines())
         except httpx.RequestError as exc:
             raise CliError(f"Network error: {exc}") from exc
 
-        self._log("PUT", url, response.status_code)
+    def wait_state(
+        self,
+        season_id: str,
+        after_version: Optional[int] = None,
+        wait: float = LONG_POLL_WAIT,
+        after_acks: Optional[int] = None,
+    ) -> Any:
+        """
+        Long-poll the season state: returns once state_version > after_version, the
+        current turn's ack_count differs from after_acks (ACKs do not bump the
+        version), or after `wait` seconds.
 
-        if response.status_code >= 400:
-            text = response.text
-            raise ApiError(response.status_code, format_api_error(response.status_code, text), body=text)
-        if response.headers.get("content-type", "").startswith("application/json"):
-            return response.json()
-        return response.text
+        Without after_version the current state is returned immediately. Not cached.
+        """
+        url = self._url(f"/api/turns/seasons/{season_id}/wait")
+        params: Dict[str, Any] = {"timeout": wait}
+        if after_version is not None:
+            params["after_version"] = after_version
+        if after_acks is not None:
+            params["after_acks"] = after_acks
+        try:
+            response = self._client.get(
+                url, params=params, headers=self._headers, timeout=httpx.Timeout(self.timeout, read=wait + self.timeout)
+            )
+        except httpx.RequestError as exc:
+            raise CliError(f"Network error: {exc}") from exc
+        return self._handle_write("GET", url, response)
+
+    def post(self, path: str, json_body: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        url = self._url(path)
+        try:
+            response = self._client.post(url, json=json_body, params=params, headers=self._headers, timeout=self.timeout)
+        except httpx.RequestError as exc:
+            raise CliError(f"Network error: {exc}") from exc
+        return self._handle_write("POST", url, response)
+
+    def put(self, path: str, json_body: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        url = self._url(path)
+        try:
+            response = self._client.put(url, json=json_body, params=params, headers=self._headers, timeout=self.timeout)
+        except httpx.RequestError as exc:
+            raise CliError(f"Network error: {exc}") from exc
+        return self._handle_write("PUT", url, response)
 
     def __enter__(self) -> "ApiClient":
         return self
@@ -104,3 +385,81 @@ class ApiClient:
     def __exit__(self, exc_type, exc, tb) -> None:  # pragma: no cover
         self.close()
 
+
+class AsyncApiClient(_EtagCacheMixin):
+    """
+    Async counterpart of ApiClient with the same error mapping (ApiError / CliError).
+
+    Keeps one keep-alive connection pool (HTTP/2 when `h2` is installed) and
+    bounds in-flight requests with a semaphore so fan-outs stay polite.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        timeout: float = DEFAULT_TIMEOUT,
+        verbose: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        http2: Optional[bool] = None,
+        etag_cache: "Optional[OrderedDict[Tuple[str, Tuple], Tuple[str, Any]]]" = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[LocalCache] = None,
+    ):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cache = cache
+        self.http2 = http2_available() if http2 is None else http2
+        self._client = httpx.AsyncClient(
+            headers={**accept_headers(), **headers},
+            timeout=self.timeout,
+            http2=self.http2,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._etag_cache = etag_cache if etag_cache is not None else OrderedDict()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        async with self._semaphore:
+            try:
+                return await self._client.request(method, url, **kwargs)
+            except httpx.RequestError as exc:
+                raise CliError(f"Network error: {exc}") from exc
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        url, key, cached, headers, hit = self._prepare_get(path, params)
+        if hit is not _MISS:
+            return hit
+        response = await self._request("GET", url, params=params, headers=headers)
+        return self._handle_get(path, url, key, cached, response)
+
+    async def get_many(self, requests: Sequence[GetRequest]) -> List[Any]:
+        results = await asyncio.gather(
+            *(self.get(*_split_request(r)) for r in requests), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
+
+    async def post(self, path: str, json_body: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        url = self._url(path)
+        response = await self._request("POST", url, json=json_body, params=params)
+        return self._handle_write("POST", url, response)
+
+    async def put(self, path: str, json_body: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        url = self._url(path)
+        response = await self._request("PUT", url, json=json_body, params=params)
+        return self._handle_write("PUT", url, response)
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
@@ -0,0 +1,171 @@
+"""On-disk cache for identifier lookups and immutable API payloads.
+
+Lives under ``<config dir>/cache/`` (``~/.club-game/cache/`` by default, next to
+the draft files), namespaced per API base URL and per user email: the server
+decides what each identity may read, so one user's cached bodies (including the
+finished-season data served without a request) are never shown to another
+``--user-email`` on the same machine. Two kinds of entries are kept:
+
+* identifier maps (season labels/numbers and club names -> UUIDs), so name
+  resolution can skip downloading the seasons/clubs lists;
+* GET responses with their ETag. They are revalidated with If-None-Match, except
+  for season-scoped data of finished seasons, which never changes and is served
+  without a request.
+
+Everything is best effort: unreadable or corrupt files are treated as misses.
+Pass ``--no-cache`` to bypass the cache for one invocation.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .config import CliConfig
+
+CACHE_DIR_NAME = "cache"
+MAX_RESPONSE_ENTRIES = 512
+
+# Season-scoped read endpoints whose body is frozen once the season is finished
+_SEASON_SCOPED = re.compile(
+    r"^api/seasons/(?P<season_id>[0-9a-fA-F-]{36})"
+    r"(?:/(?:standings(?:/extended)?|schedule|clubs/[^/]+/schedule|team-power|disclosures(?:/[^/]+)?))?$"
+)
+_SEASON_DETAIL = re.compile(r"^api/seasons/(?P<season_id>[0-9a-fA-F-]{36})$")
+FINISHED_SEASON_STATUS = "finished"
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+class LocalCache:
+    def __init__(self, base_dir: Path, base_url: str, user_email: str):
+        identity = user_email.strip().lower()
+        self.root = Path(base_dir) / _digest(base_url.rstrip("/"))[:16] / _digest(identity)[:16]
+        self._ids_path = self.root / "ids.json"
+        self._responses_dir = self.root / "responses"
+        self._ids: Optional[Dict[str, Dict[str, str]]] = None
+
+    # -- identifier maps ---------------------------------------------------
+
+    def _load_ids(self) -> Dict[str, Dict[str, str]]:
+        if self._ids is None:
+            self._ids = self._read_json(self._ids_path) or {}
+        return self._ids
+
+    def lookup_id(self, kind: str, scope: str, name: str) -> Optional[str]:
+        return self._load_ids().get(f"{kind}:{scope}", {}).get(str(name))
+
+    def remember_ids(self, kind: str, scope: str, pairs: Iterable[Tuple[Any, Any]]) -> None:
+        """Store name -> id pairs; names that map to several ids are dropped."""
+        mapping: Dict[str, Optional[str]] = {}
+        for name, ident in pairs:
+            if name is None or not ident:
+                continue
+            key = str(name)
+            mapping[key] = str(ident) if mapping.get(key, str(ident)) == str(ident) else None
+        ids = self._load_ids()
+        ids[f"{kind}:{scope}"] = {k: v for k, v in mapping.items() if v}
+        self._write_json(self._ids_path, ids)
+
+    def remember_seasons(self, game_id: str, seasons: Any) -> None:
+        if not isinstance(seasons, list):
+            return
+        pairs = []
+        for season in seasons:
+            if not isinstance(season, dict):
+                continue
+            pairs.append((season.get("season_number"), season.get("id")))
+            pairs.append((season.get("year_label"), season.get("id")))
+            if season.get("status") == FINISHED_SEASON_STATUS and season.get("id"):
+                self.mark_finished(str(season["id"]))
+        self.remember_ids("seasons", game_id, pairs)
+
+    def remember_clubs(self, game_id: str, clubs: Any) -> None:
+        if not isinstance(clubs, list):
+            return
+        pairs = []
+        for club in clubs:
+            if isinstance(club, dict):
+                pairs.append((club.get("name"), club.get("id")))
+                pairs.append((club.get("short_name"), club.get("id")))
+        self.remember_ids("clubs", game_id, pairs)
+
+    def mark_finished(self, season_id: str) -> None:
+        ids = self._load_ids()
+        finished = ids.setdefault("finished_seasons", {})
+        if season_id not in finished:
+            finished[season_id] = season_id
+            self._write_json(self._ids_path, ids)
+
+    def is_finished(self, season_id: str) -> bool:
+        return season_id in self._load_ids().get("finished_seasons", {})
+
+    # -- responses ---------------------------------------------------------
+
+    def _response_path(self, key: str) -> Path:
+        return self._responses_dir / f"{_digest(key)}.json"
+
+    def load_response(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._read_json(self._response_path(key))
+        if not isinstance(entry, dict) or "body" not in entry:
+            return None
+        return entry
+
+    def store_response(self, key: str, path: str, etag: Optional[str], body: Any) -> None:
+        detail = _SEASON_DETAIL.match(path.lstrip("/"))
+        if detail and isinstance(body, dict) and body.get("status") == FINISHED_SEASON_STATUS:
+            self.mark_finished(detail.group("season_id"))
+        immutable = self.is_immutable(path)
+        if not etag and not immutable:
+            return
+        self._write_json(self._response_path(key), {"etag": etag, "immutable": immutable, "body": body})
+        self._prune()
+
+    def is_immutable(self, path: str) -> bool:
+        match = _SEASON_SCOPED.match(path.lstrip("/"))
+        return bool(match) and self.is_finished(match.group("season_id"))
+
+    def _prune(self) -> None:
+        try:
+            entries = sorted(self._responses_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        except OSError:
+            return
+        for stale in entries[: max(0, len(entries) - MAX_RESPONSE_ENTRIES)]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    # -- io ----------------------------------------------------------------
+
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            pass
+
+
+def open_cache(config: CliConfig) -> Optional[LocalCache]:
+    """Cache for this config, or None when caching is disabled (--no-cache)."""
+    if config.cache_dir is None:
+        return None
+    return LocalCache(config.cache_dir, config.base_url, config.user_email)
+
+
+__all__ = ["CACHE_DIR_NAME", "LocalCache", "open_cache"]
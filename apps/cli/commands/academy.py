@@ -6,10 +6,10 @@ from typing import Dict, Optional
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig
 from ..errors import CliError, ValidationError
 from ..output import print_json
+from ..session import open_client
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -20,8 +20,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 def _resolve_turn_and_month(client: ApiClient, season_id: str, turn_id: Optional[str]) -> tuple[str, int]:
@@ -6,10 +6,11 @@ from typing import Optional
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig
 from ..errors import CliError, ValidationError
 from ..output import print_json
+from ..session import open_client
+from ..waiting import turn_left, wait_until
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -20,8 +21,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 def _format_season_turn_label(turn: Optional[dict]) -> str:
@@ -41,6 +41,8 @@ def _format_season_turn_label(turn: Optional[dict]) -> str:
 @click.option("--season-id", help="Season UUID (defaults to config when turn-id omitted)")
 @click.option("--club-id", help="Club UUID (defaults to config)")
 @click.option("-y", "--yes", is_flag=True, help="Skip confirmation prompt")
+@click.option("--wait", is_flag=True, help="After the ACK, wait until every club has ACKed and the turn advanced")
+@click.option("--wait-timeout", type=float, help="Give up waiting after this many seconds")
 @click.option("--json-output", is_flag=True, help="Print raw JSON response")
 @click.pass_context
 def ack_cmd(
@@ -49,6 +51,8 @@ def ack_cmd(
     season_id: Optional[str],
     club_id: Optional[str],
     yes: bool,
+    wait: bool,
+    wait_timeout: Optional[float],
     json_output: bool,
 ) -> None:
     """ACK a resolved turn for a club (club owner or GM)."""
@@ -84,11 +88,21 @@ def ack_cmd(
             f"/api/turns/{resolved_turn_id}/ack",
             json_body={"club_id": club_id, "ack": True},
         )
+        if not json_output:
+            click.echo("Turn ACK sent successfully.")
+
+        if wait:
+            wait_season_id = _resolve_required(season_id, config.season_id, "season_id")
+            state = wait_until(client, wait_season_id, turn_left(resolved_turn_id), wait_timeout)
+            if not json_output:
+                next_turn = state.get("turn")
+                if next_turn:
+                    click.echo(f"Turn advanced: now {_format_season_turn_label(next_turn)}.")
+                else:
+                    click.echo("Turn advanced: season finished.")
 
     if json_output:
         print_json(result)
-    else:
-        click.echo("Turn ACK sent successfully.")
 
 
 def dispatch_errors(func):
@@ -0,0 +1,148 @@
+"""`batch` and `shell` commands: run many CLI commands in one process.
+
+Every line is a normal club-game command line without the program name, e.g.
+
+    --user-email owner1@example.com commit --club-id "Club Alpha" -y
+    gm lock -y
+
+Global options given to `batch`/`shell` itself (--config-path, --base-url, ...)
+apply to every line and can be overridden per line. All commands share one
+CliSession (connection pool, local cache, per-user ETag caches); the time taken
+by each command is reported on stderr.
+"""
+from __future__ import annotations
+
+import shlex
+import time
+from typing import List, Optional, Sequence, TextIO, Tuple
+
+import click
+
+from ..errors import CliError
+from ..session import CliSession, current_session
+
+SHELL_PROMPT = "club-game> "
+SHELL_EXIT_WORDS = {"exit", "quit"}
+
+
+def _global_args(ctx: click.Context) -> List[str]:
+    """Re-create the root command's explicitly set options, to prefix every line."""
+    root = ctx.find_root()
+    args: List[str] = []
+    for param in root.command.params:
+        if not isinstance(param, click.Option):
+            continue
+        value = root.params.get(param.name)
+        if param.is_flag:
+            if value:
+                args.append(param.opts[0])
+        elif value is not None and value != param.default:
+            args.extend([param.opts[0], str(value)])
+    return args
+
+
+def parse_line(line: str) -> List[str]:
+    """Split one script line into argv; blank lines and `#` comments yield []."""
+    try:
+        return shlex.split(line, comments=True)
+    except ValueError as exc:
+        raise click.ClickException(f"Cannot parse line: {exc}")
+
+
+def run_command(ctx: click.Context, argv: Sequence[str]) -> Tuple[bool, float]:
+    """Run one command line through the root group; returns (ok, elapsed ms)."""
+    root = ctx.find_root().command
+    start = time.perf_counter()
+    ok = False
+    try:
+        exit_code = root.main(
+            args=_global_args(ctx) + list(argv),
+            prog_name=ctx.find_root().info_name,
+            standalone_mode=False,
+            obj={},
+        )
+        ok = not exit_code
+    except click.ClickException as exc:
+        exc.show()
+    except CliError as exc:
+        click.echo(f"Error: {exc}", err=True)
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+    return ok, (time.perf_counter() - start) * 1000.0
+
+
+def _report(index: int, argv: Sequence[str], ok: bool, elapsed_ms: float) -> None:
+    status = "ok" if ok else "FAILED"
+    click.echo(f"[{index}] {status:6} {elapsed_ms:8.1f} ms  {shlex.join(argv)}", err=True)
+
+
+def _ensure_not_nested() -> None:
+    if current_session() is not None:
+        raise click.ClickException("batch/shell cannot be run from inside batch/shell")
+
+
+@click.command("batch")
+@click.argument("script", type=click.File("r"))
+@click.option("--keep-going", is_flag=True, help="Continue after a failing command (default: stop)")
+@click.pass_context
+def batch_cmd(ctx: click.Context, script: TextIO, keep_going: bool) -> None:
+    """Run the commands in SCRIPT ('-' for stdin), one per line, in one process.
+
+    Confirmation prompts read from the terminal, so pass -y/--yes where commands ask.
+    """
+    _ensure_not_nested()
+    results: List[Tuple[bool, float]] = []
+    started = time.perf_counter()
+    with CliSession(timeout=ctx.obj["timeout"]):
+        for line in script:
+            argv = parse_line(line)
+            if not argv:
+                continue
+            ok, elapsed_ms = run_command(ctx, argv)
+            results.append((ok, elapsed_ms))
+            _report(len(results), argv, ok, elapsed_ms)
+            if not ok and not keep_going:
+                break
+
+    failed = sum(1 for ok, _ in results if not ok)
+    total_ms = (time.perf_counter() - started) * 1000.0
+    slowest = max((elapsed for _, elapsed in results), default=0.0)
+    click.echo(
+        f"{len(results)} commands, {failed} failed, {total_ms:.0f} ms total (slowest {slowest:.1f} ms)",
+        err=True,
+    )
+    if failed:
+        raise click.ClickException(f"{failed} command(s) failed")
+
+
+@click.command("shell")
+@click.pass_context
+def shell_cmd(ctx: click.Context) -> None:
+    """Interactive prompt that runs commands in one process (exit with `exit` or Ctrl-D)."""
+    _ensure_not_nested()
+    index = 0
+    with CliSession(timeout=ctx.obj["timeout"]):
+        while True:
+            line = _read_line()
+            if line is None or line.strip() in SHELL_EXIT_WORDS:
+                break
+            try:
+                argv = parse_line(line)
+            except click.ClickException as exc:
+                exc.show()
+                continue
+            if not argv:
+                continue
+            index += 1
+            ok, elapsed_ms = run_command(ctx, argv)
+            _report(index, argv, ok, elapsed_ms)
+
+
+def _read_line() -> Optional[str]:
+    try:
+        return input(SHELL_PROMPT)
+    except EOFError:
+        return None
+
+
+__all__ = ["batch_cmd", "shell_cmd", "parse_line", "run_command"]
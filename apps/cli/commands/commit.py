@@ -6,11 +6,11 @@ from typing import Optional
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig
 from ..errors import CliError, ValidationError
 from ..output import print_json
 from ..draft import load_draft, clear_draft
+from ..session import open_client
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -21,8 +21,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 def _format_season_turn_label(turn: Optional[dict]) -> str:
@@ -62,12 +61,14 @@ def commit_cmd(
     draft = load_draft(config_dir, season_id, club_id)
 
     with _with_client(config, timeout, verbose) as client:
-        turn_data = client.get(f"/api/turns/seasons/{season_id}/current")
-        turn_id = turn_data.get("id")
+        turn_data, decision_data = client.get_many([
+            f"/api/turns/seasons/{season_id}/current",
+            f"/api/turns/seasons/{season_id}/decisions/{club_id}/current",
+        ])
+        turn_id = turn_data.get("id") if turn_data else None
         if not turn_id:
             raise CliError("No active turn found for this season")
 
-        decision_data = client.get(f"/api/turns/seasons/{season_id}/decisions/{club_id}/current")
         api_payload = decision_data.get("payload") if decision_data else None
 
         payload = draft.payload if draft else api_payload
@@ -7,9 +7,9 @@ from typing import Optional
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig, save_config
 from ..errors import CliError, ValidationError
+from ..session import open_client
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -20,8 +20,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 @click.group("config")
@@ -1,15 +1,18 @@
 """Game master (GM) command group implementations."""
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Optional
 
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig, save_config
 from ..errors import CliError, ValidationError
-from ..output import print_json
+from ..output import format_number, print_json, print_table
+from ..session import open_client
+from ..trace_view import load_spans_file, render_trace_tree
+from ..waiting import all_acked, all_committed, wait_until
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -20,8 +23,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 def _resolve_turn_id(client: ApiClient, season_id: Optional[str], config_season_id: Optional[str], turn_id: Optional[str]) -> str:
@@ -66,15 +68,26 @@ def open_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional[st
 @gm.command("lock")
 @click.option("--turn-id", help="Turn UUID (optional; defaults to current season turn)")
 @click.option("--season-id", help="Season UUID (defaults to config when turn-id omitted)")
+@click.option("--wait", is_flag=True, help="Wait until every club has committed, then lock")
+@click.option("--wait-timeout", type=float, help="Give up waiting after this many seconds")
 @click.option("--json-output", is_flag=True, help="Print raw JSON response")
 @click.pass_context
-def lock_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional[str], json_output: bool) -> None:
+def lock_turn(
+    ctx: click.Context,
+    turn_id: Optional[str],
+    season_id: Optional[str],
+    wait: bool,
+    wait_timeout: Optional[float],
+    json_output: bool,
+) -> None:
     """Lock a turn after all decisions are committed."""
     config: CliConfig = ctx.obj["config"]
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
 
     with _with_client(config, timeout, verbose) as client:
+        if wait:
+            wait_until(client, _resolve_required(season_id, config.season_id, "season_id"), all_committed, wait_timeout)
         resolved_turn_id = _resolve_turn_id(client, season_id, config.season_id, turn_id)
         result = client.post(f"/api/turns/{resolved_turn_id}/lock")
 
@@ -108,9 +121,18 @@ def resolve_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional
 @gm.command("advance")
 @click.option("--turn-id", help="Turn UUID (optional; defaults to current season turn)")
 @click.option("--season-id", help="Season UUID (defaults to config when turn-id omitted)")
+@click.option("--wait", is_flag=True, help="Wait until every club has ACKed, then advance")
+@click.option("--wait-timeout", type=float, help="Give up waiting after this many seconds")
 @click.option("--json-output", is_flag=True, help="Print raw JSON response")
 @click.pass_context
-def advance_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional[str], json_output: bool) -> None:
+def advance_turn(
+    ctx: click.Context,
+    turn_id: Optional[str],
+    season_id: Optional[str],
+    wait: bool,
+    wait_timeout: Optional[float],
+    json_output: bool,
+) -> None:
     """Advance the season to the next turn (after all acks)."""
     config: CliConfig = ctx.obj["config"]
     timeout: float = ctx.obj["timeout"]
@@ -118,6 +140,8 @@ def advance_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional
     config_path = ctx.obj.get("config_path")
 
     with _with_client(config, timeout, verbose) as client:
+        if wait:
+            wait_until(client, _resolve_required(season_id, config.season_id, "season_id"), all_acked, wait_timeout)
         resolved_turn_id = _resolve_turn_id(client, season_id, config.season_id, turn_id)
         result = client.post(f"/api/turns/{resolved_turn_id}/advance")
 
@@ -155,3 +179,74 @@ def advance_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional
         click.echo(f"Turn advanced (id={resolved_turn_id}, season:{season_label}-month:{month_label}).")
     else:
         click.echo(f"Turn advanced (id={resolved_turn_id}).")
+
+
+@gm.command("trace")
+@click.option("--turn-id", help="Turn UUID (optional; defaults to current season turn)")
+@click.option("--season-id", help="Season UUID (defaults to config when turn-id omitted)")
+@click.option("--file", "trace_file", type=click.Path(exists=True, dir_okay=False, path_type=Path), help="Render a local turn-<id>.jsonl instead of fetching it")
+@click.option("--min-ms", default=0.0, show_default=True, help="Hide nodes faster than this (ms)")
+@click.option("--json-output", is_flag=True, help="Print raw spans")
+@click.pass_context
+def trace_turn(ctx: click.Context, turn_id: Optional[str], season_id: Optional[str], trace_file: Optional[Path], min_ms: float, json_output: bool) -> None:
+    """Show where resolve time went (phase → club → service) for a turn."""
+    if trace_file:
+        spans = load_spans_file(trace_file)
+    else:
+        config: CliConfig = ctx.obj["config"]
+        timeout: float = ctx.obj["timeout"]
+        verbose: bool = ctx.obj["verbose"]
+        with _with_client(config, timeout, verbose) as client:
+            resolved_turn_id = _resolve_turn_id(client, season_id, config.season_id, turn_id)
+            spans = client.get(f"/api/admin/traces/turns/{resolved_turn_id}")
+
+    if json_output:
+        print_json(spans)
+        return
+    if not spans:
+        click.echo("No spans recorded for this turn.")
+        return
+    for line in render_trace_tree(spans, min_ms=min_ms):
+        click.echo(line)
+
+
+@gm.command("report")
+@click.option("--turn-id", help="Turn UUID (optional; defaults to current season turn)")
+@click.option("--season-id", help="Season UUID (defaults to config when turn-id omitted)")
+@click.option("--json-output", is_flag=True, help="Print raw JSON response")
+@click.pass_context
+def resolve_report(ctx: click.Context, turn_id: Optional[str], season_id: Optional[str], json_output: bool) -> None:
+    """Show the performance report recorded when a turn was resolved."""
+    config: CliConfig = ctx.obj["config"]
+    timeout: float = ctx.obj["timeout"]
+    verbose: bool = ctx.obj["verbose"]
+
+    with _with_client(config, timeout, verbose) as client:
+        resolved_turn_id = _resolve_turn_id(client, season_id, config.season_id, turn_id)
+        report = client.get(f"/api/turns/{resolved_turn_id}/resolve-report")
+
+    if json_output:
+        print_json(report)
+        return
+
+    click.echo(
+        f"Resolve report (turn={resolved_turn_id}, season:{report.get('season_number')}-month:{report.get('month_index')}, "
+        f"version:{report.get('app_version') or '-'})"
+    )
+    click.echo(
+        f"total: {report.get('total_ms', 0):.1f} ms  queries: {format_number(report.get('total_queries'))}  "
+        f"clubs: {report.get('clubs_processed')}  fixtures: {report.get('fixtures_processed')}  "
+        f"ledger rows: {report.get('ledger_rows_written')}  peak memory: {format_number(report.get('peak_memory_kb'))} KB"
+    )
+    total_ms = report.get("total_ms") or 0.0
+    rows = [
+        {
+            "phase": name,
+            "ms": f"{phase.get('ms', 0):.1f}",
+            "queries": phase.get("queries"),
+            "share": f"{(phase.get('ms', 0) / total_ms * 100) if total_ms else 0:.1f}%",
+        }
+        for name, phase in (report.get("phases") or {}).items()
+    ]
+    if rows:
+        print_table(rows, ["phase", "ms", "queries", "share"], format_numbers=False)
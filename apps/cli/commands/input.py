@@ -7,10 +7,10 @@ from typing import Any, Dict, Optional
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig
 from ..errors import CliError, ValidationError
 from ..draft import load_draft, save_draft, clear_draft
+from ..session import open_client
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -21,8 +21,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 def _parse_decimal(value: Optional[str], label: str) -> Optional[Decimal]:
@@ -1,18 +1,19 @@
 """`show` command group implementations."""
 from __future__ import annotations
 
+import itertools
 import uuid
 from functools import wraps
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig
 from ..errors import ApiError, CliError, ValidationError
-from ..output import format_number, print_json, print_table
+from ..output import format_number, print_json, print_jsonl, print_table, print_table_stream
 from ..parsing import ensure_month_bounds, parse_month_to_index
+from ..session import open_client
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -23,8 +24,7 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
 def _is_uuid(value: str) -> bool:
@@ -35,12 +35,19 @@ def _is_uuid(value: str) -> bool:
         return False
 
 
+def _cached_id(client: ApiClient, kind: str, game_id: str, name: str) -> Optional[str]:
+    """UUID remembered by the local cache for a season label/number or club name."""
+    cache = getattr(client, "cache", None)
+    return cache.lookup_id(kind, game_id, name) if cache is not None else None
+
+
 def _resolve_season_identifier(
     client: ApiClient,
     config: CliConfig,
     season_identifier: Optional[str],
     *,
     allow_passthrough: bool = True,
+    seasons: Optional[Any] = None,
 ) -> str:
     resolved = _resolve_required(season_identifier, config.season_id, "season_id")
     if _is_uuid(resolved):
@@ -52,7 +59,14 @@ def _resolve_season_identifier(
         raise ValidationError("game_id is required to resolve season identifier")
 
     game_id = _resolve_required(config.game_id, None, "game_id")
-    seasons = client.get(f"/api/seasons/games/{game_id}")
+    cache = getattr(client, "cache", None)
+    if seasons is None:
+        cached_id = _cached_id(client, "seasons", game_id, resolved)
+        if cached_id:
+            return cached_id
+        seasons = client.get(f"/api/seasons/games/{game_id}")
+    if cache is not None:
+        cache.remember_seasons(game_id, seasons)
     if not isinstance(seasons, list):
         if allow_passthrough:
             return resolved
@@ -89,6 +103,7 @@ def _resolve_club_identifier(
     club_identifier: Optional[str],
     *,
     allow_passthrough: bool = True,
+    clubs: Optional[Any] = None,
 ) -> str:
     resolved = _resolve_required(club_identifier, config.club_id, "club_id")
     if _is_uuid(resolved):
@@ -99,7 +114,14 @@ def _resolve_club_identifier(
             return resolved
         raise ValidationError("game_id is required to resolve club name")
     game_id = _resolve_required(config.game_id, None, "game_id")
-    clubs = client.get(f"/api/games/{game_id}/clubs")
+    cache = getattr(client, "cache", None)
+    if clubs is None:
+        cached_id = _cached_id(client, "clubs", game_id, resolved)
+        if cached_id:
+            return cached_id
+        clubs = client.get(f"/api/games/{game_id}/clubs")
+    if cache is not None:
+        cache.remember_clubs(game_id, clubs)
     if not isinstance(clubs, list):
         if allow_passthrough:
             return resolved
@@ -122,6 +144,69 @@ def _resolve_club_identifier(
     return resolved_id
 
 
+def _resolve_season_and_club(
+    client: ApiClient,
+    config: CliConfig,
+    season_identifier: Optional[str],
+    club_identifier: Optional[str],
+) -> tuple[str, str]:
+    """
+    Resolve both identifiers; when both are names not yet in the local cache,
+    fetch the two lookup lists concurrently.
+    """
+    season_value = season_identifier or config.season_id
+    club_value = club_identifier or config.club_id
+    seasons = clubs = None
+    if (
+        config.game_id
+        and season_value
+        and club_value
+        and not _is_uuid(season_value)
+        and not _is_uuid(club_value)
+        and not _cached_id(client, "seasons", config.game_id, season_value)
+        and not _cached_id(client, "clubs", config.game_id, club_value)
+    ):
+        seasons, clubs = client.get_many([
+            f"/api/seasons/games/{config.game_id}",
+            f"/api/games/{config.game_id}/clubs",
+        ])
+    return (
+        _resolve_season_identifier(client, config, season_identifier, seasons=seasons),
+        _resolve_club_identifier(client, config, club_identifier, clubs=clubs),
+    )
+
+
+def _output_mode(json_output: bool, jsonl: bool = False, stream: bool = False) -> str:
+    """One of "json", "jsonl", "stream" or "table"."""
+    chosen = [name for name, flag in (("json", json_output), ("jsonl", jsonl), ("stream", stream)) if flag]
+    if len(chosen) > 1:
+        raise ValidationError("Use only one of --json-output, --jsonl and --stream")
+    return chosen[0] if chosen else "table"
+
+
+def _streaming_options(func: Callable) -> Callable:
+    """--jsonl / --stream: emit rows while pages are still being fetched."""
+    func = click.option("--stream", is_flag=True, help="Print table rows as pages arrive (columns sized from the first rows)")(func)
+    func = click.option("--jsonl", is_flag=True, help="Print one JSON object per line as pages arrive")(func)
+    return func
+
+
+def _emit_rows(rows: Iterable[Dict[str, Any]], mode: str, to_row: Callable[[Dict[str, Any]], Dict[str, Any]], columns: List[str]) -> None:
+    """Print rows in jsonl/stream mode without collecting them first."""
+    if mode == "jsonl":
+        print_jsonl(rows)
+    else:
+        print_table_stream((to_row(row) for row in rows), columns, format_numbers=True)
+
+
+def _game_season_ids(client: ApiClient, config: CliConfig) -> Iterator[str]:
+    """Season UUIDs of the configured game, page by page (for --all-seasons)."""
+    game_id = _resolve_required(config.game_id, None, "game_id")
+    for season in client.iter_pages(f"/api/seasons/games/{game_id}"):
+        if isinstance(season, dict) and season.get("id"):
+            yield season["id"]
+
+
 def _format_season_turn_label(turn: Optional[dict]) -> str:
     if not isinstance(turn, dict):
         return "-"
@@ -154,8 +239,7 @@ def show_match(ctx: click.Context, season_id: Optional[str], club_id: Optional[s
     verbose: bool = ctx.obj["verbose"]
 
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        club_id = _resolve_club_identifier(client, config, club_id)
+        season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
 
         parsed_month_index = parse_month_to_index(month) if month else month_index
         parsed_month_index = ensure_month_bounds(parsed_month_index, "month_index")
@@ -205,14 +289,26 @@ def show_table(ctx: click.Context, season_id: Optional[str], json_output: bool)
     verbose: bool = ctx.obj["verbose"]
     with _with_client(config, timeout, verbose) as client:
         season_id = _resolve_season_identifier(client, config, season_id)
-        turn = client.get(f"/api/turns/seasons/{season_id}/current")
-        bankrupt_clubs = client.get(f"/api/seasons/{season_id}/bankrupt-clubs")
-        data = client.get(f"/api/seasons/{season_id}/standings")
+        view = fetch_table(client, season_id)
 
     if json_output:
-        print_json({"as_of": turn, "standings": data})
+        print_json({"as_of": view["turn"], "standings": view["standings"]})
         return
+    render_table(view)
 
+
+def fetch_table(client: ApiClient, season_id: str) -> Dict[str, Any]:
+    """Data behind `show table` (three independent GETs, fetched concurrently)."""
+    turn, bankrupt_clubs, standings = client.get_many([
+        f"/api/turns/seasons/{season_id}/current",
+        f"/api/seasons/{season_id}/bankrupt-clubs",
+        f"/api/seasons/{season_id}/standings",
+    ])
+    return {"turn": turn, "bankrupt_clubs": bankrupt_clubs, "standings": standings}
+
+
+def render_table(view: Dict[str, Any]) -> None:
+    turn, bankrupt_clubs, data = view["turn"], view["bankrupt_clubs"], view["standings"]
     if isinstance(turn, dict):
         click.echo(f"As of {_format_season_turn_label(turn)}")
 
@@ -250,17 +346,21 @@ def show_table(ctx: click.Context, season_id: Optional[str], json_output: bool)
 @click.option("--club-id", help="Club UUID or name (defaults to config)")
 @click.option("--club-name", help="Club name (resolved within the configured game)")
 @click.option("--json-output", is_flag=True, help="Print raw JSON")
+@_streaming_options
 @click.pass_context
 def show_final_standings(
     ctx: click.Context,
     club_id: Optional[str],
     club_name: Optional[str],
     json_output: bool,
+    jsonl: bool,
+    stream: bool,
 ) -> None:
     """Show finalized standings history for a club."""
     config: CliConfig = ctx.obj["config"]
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
+    mode = _output_mode(json_output, jsonl, stream)
     with _with_client(config, timeout, verbose) as client:
         if club_id:
             resolved_club_id = _resolve_club_identifier(client, config, club_id)
@@ -268,7 +368,19 @@ def show_final_standings(
             resolved_club_id = _resolve_club_identifier(client, config, club_name, allow_passthrough=False)
         else:
             resolved_club_id = _resolve_club_identifier(client, config, config.club_id)
-        data = client.get(f"/api/clubs/{resolved_club_id}/final-standings")
+        path = f"/api/clubs/{resolved_club_id}/final-standings"
+        if mode in ("jsonl", "stream"):
+            rows = client.iter_pages(path)
+            first = next(rows, None)
+            if first is None:
+                if mode == "stream":
+                    click.echo("No finalized seasons found for this club.")
+                return
+            if mode == "stream" and isinstance(first, dict) and first.get("club_name"):
+                click.echo(f"Final standings history for {first['club_name']}")
+            _emit_rows(itertools.chain([first], rows), mode, _final_standing_row, FINAL_STANDING_COLUMNS)
+            return
+        data = client.get(path)
 
     if json_output:
         print_json(data)
@@ -282,84 +394,113 @@ def show_final_standings(
     if club_name:
         click.echo(f"Final standings history for {club_name}")
 
-    rows = [
-        {
-            "season": f"{row.get('year_label')} (#{row.get('season_number')})",
-            "rank": row.get("rank"),
-            "pts": row.get("points"),
-            "played": row.get("played"),
-            "won": row.get("won"),
-            "drawn": row.get("drawn"),
-            "lost": row.get("lost"),
-            "gf": row.get("gf"),
-            "ga": row.get("ga"),
-            "gd": row.get("gd"),
-        }
-        for row in data
-    ]
-    print_table(rows, ["season", "rank", "pts", "played", "won", "drawn", "lost", "gf", "ga", "gd"], format_numbers=True)
+    print_table([_final_standing_row(row) for row in data], FINAL_STANDING_COLUMNS, format_numbers=True)
+
+
+FINAL_STANDING_COLUMNS = ["season", "rank", "pts", "played", "won", "drawn", "lost", "gf", "ga", "gd"]
+
+
+def _final_standing_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "season": f"{row.get('year_label')} (#{row.get('season_number')})",
+        "rank": row.get("rank"),
+        "pts": row.get("points"),
+        "played": row.get("played"),
+        "won": row.get("won"),
+        "drawn": row.get("drawn"),
+        "lost": row.get("lost"),
+        "gf": row.get("gf"),
+        "ga": row.get("ga"),
+        "gd": row.get("gd"),
+    }
 
 
 @show.command("finance")
 @click.option("--season-id", help="Season UUID/season_number/year_label (defaults to config)")
 @click.option("--club-id", help="Club UUID or name (defaults to config)")
 @click.option("--month-index", type=int, help="Filter by month_index (1-12)")
+@click.option("--all-seasons", is_flag=True, help="Every season of the game, printed season by season as fetched")
 @click.option("--json-output", is_flag=True, help="Print raw JSON")
+@click.option("--jsonl", is_flag=True, help="Print one JSON object per PL line item")
 @click.pass_context
-def show_finance(ctx: click.Context, season_id: Optional[str], club_id: Optional[str], month_index: Optional[int], json_output: bool) -> None:
-    """Show financial state and ledger for a club."""
+def show_finance(
+    ctx: click.Context,
+    season_id: Optional[str],
+    club_id: Optional[str],
+    month_index: Optional[int],
+    all_seasons: bool,
+    json_output: bool,
+    jsonl: bool,
+) -> None:
+    """Show financial state and PL summary for a club."""
     config: CliConfig = ctx.obj["config"]
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
+    mode = _output_mode(json_output, jsonl)
 
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        club_id = _resolve_club_identifier(client, config, club_id)
+        if all_seasons:
+            club_id = _resolve_club_identifier(client, config, club_id)
+            season_ids: Iterable[str] = _game_season_ids(client, config)
+        else:
+            season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
+            season_ids = [season_id]
+        balance = fetch_balance(client, club_id)
+        pls = (fetch_finance(client, sid, club_id, month_index, balance=balance) for sid in season_ids)
+        if mode == "jsonl":
+            print_jsonl(line for pl in pls for line in finance_lines(pl))
+            return
+        if mode == "json":
+            data = list(pls)
+        else:
+            for index, pl in enumerate(pls):
+                if index:
+                    click.echo("")
+                render_finance(pl)
+            return
 
-        params = {"season_id": season_id}
-        if month_index is not None:
-            params["month_index"] = month_index
+    print_json(data if all_seasons else data[0])
 
-        state = client.get(f"/api/clubs/{club_id}/finance/state")
-        ledger = client.get(f"/api/clubs/{club_id}/finance/ledger", params=params)
-        season = client.get(f"/api/seasons/{season_id}")
 
-    if json_output:
-        print_json({"state": state, "ledger": ledger})
-        return
+def fetch_balance(client: ApiClient, club_id: str) -> Optional[float]:
+    state = client.get(f"/api/clubs/{club_id}/finance/state")
+    return state.get("balance") if isinstance(state, dict) else None
 
-    balance = state.get("balance") if isinstance(state, dict) else None
-    last_turn = state.get("last_applied_turn_id") if isinstance(state, dict) else None
-    season_index = season.get("season_number") if isinstance(season, dict) else None
-
-    def round_amount(value: Optional[float]) -> Optional[int]:
-        if value is None:
-            return None
-        return int(round(value))
-
-    # Latest month when not specified
-    all_months = sorted({e.get("month_index") for e in ledger or [] if e.get("month_index") is not None})
-    target_month = month_index if month_index is not None else (all_months[-1] if all_months else None)
-
-    # Map for normalization of kinds (merge fixture-specific keys)
-    def normalize_kind(kind: str) -> str:
-        # Hide internal marker entries
-        if kind == "additional_reinforcement_applied":
-            return None
-
-        if kind == "next_home_promo_expense":
-            return "promo_expense"
-        
-        prefixes = [
-            "match_operation_cost",
-            "merchandise_cost",
-            "merchandise_rev",
-            "ticket_rev",
-        ]
-        for pref in prefixes:
-            if kind.startswith(pref):
-                return pref
-        return kind
+
+def fetch_finance(
+    client: ApiClient,
+    season_id: str,
+    club_id: str,
+    month_index: Optional[int] = None,
+    balance: Optional[float] = None,
+) -> Any:
+    params = {"season_id": season_id}
+    if month_index is not None:
+        params["month_index"] = month_index
+    # Normalization, grouping and ordering happen server-side
+    pl = client.get(f"/api/clubs/{club_id}/finance/pl", params=params)
+    # The PL is cached per season, so the club-wide current balance comes from /finance/state
+    if balance is None:
+        balance = fetch_balance(client, club_id)
+    return {**pl, "balance": balance} if isinstance(pl, dict) else pl
+
+
+def finance_lines(pl: Any) -> Iterator[Dict[str, Any]]:
+    """Flatten a PL response into one row per line item, tagged with its scope."""
+    pl = pl if isinstance(pl, dict) else {}
+    base = {"season_number": pl.get("season_number"), "month_index": pl.get("month_index"), "balance": pl.get("balance")}
+    for scope in ("month", "season"):
+        for item in pl.get(scope) or []:
+            yield {**base, "scope": scope, **item}
+        if pl.get(f"{scope}_total"):
+            yield {**base, "scope": f"{scope}_total", **pl[f"{scope}_total"]}
+
+
+def render_finance(pl: Any) -> None:
+    pl = pl if isinstance(pl, dict) else {}
+    balance = pl.get("balance")
+    season_index = pl.get("season_number")
+    target_month = pl.get("month_index")
 
     month_name_lookup = {
         1: "August", 2: "September", 3: "October", 4: "November", 5: "December",
@@ -369,119 +510,27 @@ def show_finance(ctx: click.Context, season_id: Optional[str], club_id: Optional
 
     click.echo(f"Season : {format_number(season_index)}")
     click.echo(f"{month_label}(month_index={format_number(target_month)})")
-    click.echo(f"Balance: {format_number(round_amount(balance))}")
+    click.echo(f"Balance: {format_number(int(round(balance)) if balance is not None else None)}")
 
-    # Prepare ledger grouping
-    if not ledger:
+    if not pl.get("season"):
         click.echo("No ledger entries found.")
         return
 
-    # Filter ledger for target month
-    month_entries = [e for e in ledger if e.get("month_index") == target_month]
-
-    # Monthly per-item breakdown
-    monthly_by_kind: Dict[str, float] = {}
-    for entry in month_entries:
-        kind = normalize_kind(entry.get("kind") or "(unknown)")
-        if kind is None:  # Skip hidden kinds
-            continue
-        amt = entry.get("amount", 0)
-        monthly_by_kind[kind] = monthly_by_kind.get(kind, 0) + amt
-
-    preferred_order = [
-        "sponsor_annual",
-        "sponsor",
-        "ticket_rev",
-        "merchandise_rev",
-        "distribution_revenue",
-        "prize_revenue",
-        "academy_transfer_fee",
-        "reinforcement_cost",
-        "team_operation_cost",
-        "academy_cost",
-        "match_operation_cost",
-        "sales_expense",
-        "promo_expense",
-        "merchandise_cost",
-        "hometown_expense",
-        "staff_cost",
-        "admin_cost",
-        "tax",
-    ]
-    preferred_index = {key: idx for idx, key in enumerate(preferred_order)}
-
-    def sort_key(item: tuple[str, float]) -> tuple[int, str]:
-        kind, _ = item
-        return (preferred_index.get(kind, len(preferred_order)), kind)
-
-    monthly_table = []
-    for k, v in sorted(monthly_by_kind.items(), key=sort_key):
-        monthly_table.append({
-            "kind": k,
-            "income": round_amount(v) if v > 0 else 0,
-            "expense": round_amount(v) if v < 0 else 0,
-            "net": round_amount(v),
-        })
-
+    columns = ["kind", "income", "expense", "net"]
+    monthly_table = list(pl.get("month") or [])
     if monthly_table:
-        income_total = sum(v for v in monthly_by_kind.values() if v > 0)
-        expense_total = sum(v for v in monthly_by_kind.values() if v < 0)
-        net_total = sum(monthly_by_kind.values())
-        monthly_table.append(
-            {
-                "kind": "TOTAL",
-                "income": round_amount(income_total),
-                "expense": round_amount(expense_total),
-                "net": round_amount(net_total),
-            }
-        )
+        if pl.get("month_total"):
+            monthly_table.append(pl["month_total"])
         click.echo("Current month breakdown (by item):")
-        print_table(monthly_table, ["kind", "income", "expense", "net"], format_numbers=True)
+        print_table(monthly_table, columns, format_numbers=True)
     else:
         click.echo("No entries for the target month.")
 
-    # Season cumulative by normalized kind
-    kind_rows: Dict[str, float] = {}
-    for entry in ledger:
-        kind = normalize_kind(entry.get("kind") or "(unknown)")
-        if kind is None:  # Skip hidden kinds
-            continue
-        amount = entry.get("amount", 0)
-        kind_rows[kind] = kind_rows.get(kind, 0) + amount
-
-    income_rows = []
-    expense_rows = []
-    for k, v in sorted(kind_rows.items(), key=sort_key):
-        row = {
-            "kind": k,
-            "income": round_amount(v) if v > 0 else 0,
-            "expense": round_amount(v) if v < 0 else 0,
-            "net": round_amount(v),
-        }
-        if v > 0:
-            income_rows.append(row)
-        elif v < 0:
-            expense_rows.append(row)
-        else:
-            # zero rows can go with expense side for stability
-            expense_rows.append(row)
-
-    cumulative_table = income_rows + expense_rows
-    if cumulative_table:
-        income_total = sum(v for v in kind_rows.values() if v > 0)
-        expense_total = sum(v for v in kind_rows.values() if v < 0)
-        net_total = sum(kind_rows.values())
-        cumulative_table.append(
-            {
-                "kind": "TOTAL",
-                "income": round_amount(income_total),
-                "expense": round_amount(expense_total),
-                "net": round_amount(net_total),
-            }
-        )
-
+    cumulative_table = list(pl.get("season") or [])
+    if pl.get("season_total"):
+        cumulative_table.append(pl["season_total"])
     click.echo("Season cumulative by item:")
-    print_table(cumulative_table, ["kind", "income", "expense", "net"], format_numbers=True)
+    print_table(cumulative_table, columns, format_numbers=True)
 
 
 @show.command("tax")
@@ -496,8 +545,7 @@ def show_tax(ctx: click.Context, season_id: Optional[str], club_id: Optional[str
     verbose: bool = ctx.obj["verbose"]
 
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        club_id = _resolve_club_identifier(client, config, club_id)
+        season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
         data = client.get(f"/api/clubs/{club_id}/finance/tax-info", params={"season_id": season_id})
 
     if json_output:
@@ -571,10 +619,14 @@ def show_disclosure(ctx: click.Context, season_id: Optional[str], disclosure_typ
     verbose: bool = ctx.obj["verbose"]
     with _with_client(config, timeout, verbose) as client:
         season_id = _resolve_season_identifier(client, config, season_id)
-        data = client.get(f"/api/seasons/{season_id}/disclosures/{disclosure_type}")
         season_info = None
         if not json_output and disclosure_type == "financial_summary":
-            season_info = client.get(f"/api/seasons/{season_id}")
+            data, season_info = client.get_many([
+                f"/api/seasons/{season_id}/disclosures/{disclosure_type}",
+                f"/api/seasons/{season_id}",
+            ])
+        else:
+            data = client.get(f"/api/seasons/{season_id}/disclosures/{disclosure_type}")
 
     if json_output:
         print_json(data)
@@ -720,15 +772,30 @@ def show_staff(ctx: click.Context, club_id: Optional[str], json_output: bool) ->
 @click.option("--season-id", help="Season UUID/season_number/year_label (optional filter)")
 @click.option("--from", "from_month", help="From YYYY-MM (mapped to month_index)")
 @click.option("--to", "to_month", help="To YYYY-MM (mapped to month_index)")
+@click.option("--all-seasons", is_flag=True, help="Ignore the configured season and list every season")
 @click.option("--json-output", is_flag=True, help="Print raw JSON")
+@_streaming_options
 @click.pass_context
-def show_staff_history(ctx: click.Context, club_id: Optional[str], season_id: Optional[str], from_month: Optional[str], to_month: Optional[str], json_output: bool) -> None:
+def show_staff_history(
+    ctx: click.Context,
+    club_id: Optional[str],
+    season_id: Optional[str],
+    from_month: Optional[str],
+    to_month: Optional[str],
+    all_seasons: bool,
+    json_output: bool,
+    jsonl: bool,
+    stream: bool,
+) -> None:
     config: CliConfig = ctx.obj["config"]
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
+    mode = _output_mode(json_output, jsonl, stream)
     with _with_client(config, timeout, verbose) as client:
         club_id = _resolve_club_identifier(client, config, club_id)
-        resolved_season_id = _resolve_season_identifier(client, config, season_id) if season_id or config.season_id else None
+        resolved_season_id = None
+        if not all_seasons and (season_id or config.season_id):
+            resolved_season_id = _resolve_season_identifier(client, config, season_id)
 
         params: Dict[str, Any] = {}
         if resolved_season_id:
@@ -740,23 +807,30 @@ def show_staff_history(ctx: click.Context, club_id: Optional[str], season_id: Op
         if tm is not None:
             params["to_month"] = tm
 
-        data = client.get(f"/api/clubs/{club_id}/management/staff/history", params=params)
+        path = f"/api/clubs/{club_id}/management/staff/history"
+        if mode in ("jsonl", "stream"):
+            _emit_rows(client.iter_pages(path, params=params), mode, _staff_history_row, STAFF_HISTORY_COLUMNS)
+            return
+        data = client.get(path, params=params)
 
     if json_output:
         print_json(data)
         return
 
-    rows = [
-        {
-            "season": entry.get("season_id"),
-            "month": entry.get("month_index"),
-            "month_name": entry.get("month_name"),
-            "total_cost": entry.get("total_cost"),
-            "created_at": entry.get("created_at"),
-        }
-        for entry in data
-    ]
-    print_table(rows, ["season", "month", "month_name", "total_cost", "created_at"], format_numbers=True)
+    print_table([_staff_history_row(entry) for entry in data], STAFF_HISTORY_COLUMNS, format_numbers=True)
+
+
+STAFF_HISTORY_COLUMNS = ["season", "month", "month_name", "total_cost", "created_at"]
+
+
+def _staff_history_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "season": entry.get("season_id"),
+        "month": entry.get("month_index"),
+        "month_name": entry.get("month_name"),
+        "total_cost": entry.get("total_cost"),
+        "created_at": entry.get("created_at"),
+    }
 
 
 @show.command("current_input")
@@ -769,16 +843,22 @@ def show_current_input(ctx: click.Context, season_id: Optional[str], club_id: Op
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        club_id = _resolve_club_identifier(client, config, club_id)
-        data = client.get(f"/api/turns/seasons/{season_id}/decisions/{club_id}/current")
+        season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
+        data = fetch_current_input(client, season_id, club_id)
 
-    if data is None:
-        click.echo("No current input found (maybe all turns acked?)")
+    if data is not None and json_output:
+        print_json(data)
         return
+    render_current_input(data)
 
-    if json_output:
-        print_json(data)
+
+def fetch_current_input(client: ApiClient, season_id: str, club_id: str) -> Any:
+    return client.get(f"/api/turns/seasons/{season_id}/decisions/{club_id}/current")
+
+
+def render_current_input(data: Any) -> None:
+    if data is None:
+        click.echo("No current input found (maybe all turns acked?)")
         return
 
     payload = data.get("payload") if isinstance(data, dict) else None
@@ -811,15 +891,31 @@ def show_current_input(ctx: click.Context, season_id: Optional[str], club_id: Op
 @click.option("--club-id", help="Club UUID or name (defaults to config)")
 @click.option("--from", "from_month", help="From YYYY-MM (mapped to month_index)")
 @click.option("--to", "to_month", help="To YYYY-MM (mapped to month_index)")
+@click.option("--all-seasons", is_flag=True, help="Every season of the game, fetched season by season")
 @click.option("--json-output", is_flag=True, help="Print raw JSON")
+@_streaming_options
 @click.pass_context
-def show_history(ctx: click.Context, season_id: Optional[str], club_id: Optional[str], from_month: Optional[str], to_month: Optional[str], json_output: bool) -> None:
+def show_history(
+    ctx: click.Context,
+    season_id: Optional[str],
+    club_id: Optional[str],
+    from_month: Optional[str],
+    to_month: Optional[str],
+    all_seasons: bool,
+    json_output: bool,
+    jsonl: bool,
+    stream: bool,
+) -> None:
     config: CliConfig = ctx.obj["config"]
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
+    mode = _output_mode(json_output, jsonl, stream)
+    columns = (["season"] if all_seasons else []) + HISTORY_COLUMNS
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        club_id = _resolve_club_identifier(client, config, club_id)
+        if all_seasons:
+            club_id = _resolve_club_identifier(client, config, club_id)
+        else:
+            season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
 
         params: Dict[str, Any] = {}
         fm = ensure_month_bounds(parse_month_to_index(from_month) if from_month else None, "from_month")
@@ -829,22 +925,38 @@ def show_history(ctx: click.Context, season_id: Optional[str], club_id: Optional
         if tm is not None:
             params["to_month"] = tm
 
-        data = client.get(f"/api/turns/seasons/{season_id}/decisions/{club_id}", params=params)
+        if all_seasons or mode in ("jsonl", "stream"):
+            season_ids: Iterable[str] = _game_season_ids(client, config) if all_seasons else [season_id]
+            entries = (
+                entry
+                for sid in season_ids
+                for entry in client.iter_pages(f"/api/turns/seasons/{sid}/decisions/{club_id}", params=params)
+            )
+            if mode in ("jsonl", "stream"):
+                _emit_rows(entries, mode, _history_row, columns)
+                return
+            data = list(entries)
+        else:
+            data = client.get(f"/api/turns/seasons/{season_id}/decisions/{club_id}", params=params)
 
     if json_output:
         print_json(data)
         return
 
-    rows = [
-        {
-            "month": entry.get("month_index"),
-            "month_name": entry.get("month_name"),
-            "state": entry.get("decision_state"),
-            "committed_at": entry.get("committed_at"),
-        }
-        for entry in data
-    ]
-    print_table(rows, ["month", "month_name", "state", "committed_at"], format_numbers=True)
+    print_table([_history_row(entry) for entry in data], columns, format_numbers=True)
+
+
+HISTORY_COLUMNS = ["month", "month_name", "state", "committed_at"]
+
+
+def _history_row(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "season": entry.get("season_number"),
+        "month": entry.get("month_index"),
+        "month_name": entry.get("month_name"),
+        "state": entry.get("decision_state"),
+        "committed_at": entry.get("committed_at"),
+    }
 
 
 @show.command("fan_indicator")
@@ -860,9 +972,7 @@ def show_fan_indicator(ctx: click.Context, club_id: Optional[str], club_override
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        resolved_club = club_override or club_id or config.club_id
-        resolved_club = _resolve_club_identifier(client, config, resolved_club)
+        season_id, resolved_club = _resolve_season_and_club(client, config, season_id, club_override or club_id)
 
         params: Dict[str, Any] = {"season_id": season_id}
         fm = ensure_month_bounds(parse_month_to_index(from_month) if from_month else None, "from_month")
@@ -872,8 +982,10 @@ def show_fan_indicator(ctx: click.Context, club_id: Optional[str], club_override
         if tm is not None:
             params["to_month"] = tm
 
-        standings = client.get(f"/api/seasons/{season_id}/standings")
-        data = client.get(f"/api/clubs/{resolved_club}/fan_indicator", params=params)
+        standings, data = client.get_many([
+            f"/api/seasons/{season_id}/standings",
+            (f"/api/clubs/{resolved_club}/fan_indicator", params),
+        ])
 
     club_map: Dict[str, str] = {}
     if isinstance(standings, list):
@@ -909,8 +1021,7 @@ def show_sponsor_status(ctx: click.Context, club_id: Optional[str], season_id: O
     timeout: float = ctx.obj["timeout"]
     verbose: bool = ctx.obj["verbose"]
     with _with_client(config, timeout, verbose) as client:
-        season_id = _resolve_season_identifier(client, config, season_id)
-        club_id = _resolve_club_identifier(client, config, club_id)
+        season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
 
         endpoint: str
         if next_flag:
@@ -947,6 +1058,62 @@ def show_sponsor_status(ctx: click.Context, club_id: Optional[str], season_id: O
         print_table(rows, ["current", "confirmed_exist", "confirmed_new", "total_confirmed", "next_exist_target", "next_new_target", "next_total"], format_numbers=True)
 
 
+@show.command("dashboard")
+@click.option("--season-id", help="Season UUID/season_number/year_label (defaults to config)")
+@click.option("--club-id", help="Club UUID or name (defaults to config)")
+@click.option("--month-index", type=int, help="month_index (1-12); defaults to latest resolved month")
+@click.option("--json-output", is_flag=True, help="Print raw JSON")
+@click.pass_context
+def show_dashboard(ctx: click.Context, season_id: Optional[str], club_id: Optional[str], month_index: Optional[int], json_output: bool) -> None:
+    """Show the monthly club dashboard (balance, PL, fans, sponsors, staff, rank, TP) in one call."""
+    config: CliConfig = ctx.obj["config"]
+    timeout: float = ctx.obj["timeout"]
+    verbose: bool = ctx.obj["verbose"]
+    with _with_client(config, timeout, verbose) as client:
+        season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
+        params: Dict[str, Any] = {"season_id": season_id}
+        if month_index is not None:
+            params["month_index"] = month_index
+        data = client.get(f"/api/clubs/{club_id}/dashboard", params=params)
+
+    if json_output:
+        print_json(data)
+        return
+
+    sponsor = data.get("sponsor_pipeline") or {}
+    summary = [{
+        "month_index": data.get("month_index"),
+        "balance": data.get("balance"),
+        "rank": data.get("rank"),
+        "points": data.get("points"),
+        "team_power": data.get("team_power"),
+        "followers": data.get("followers_public"),
+        "sponsors": sponsor.get("current_sponsors"),
+        "next_sponsors": sponsor.get("next_total"),
+    }]
+    print_table(summary, ["month_index", "balance", "rank", "points", "team_power", "followers", "sponsors", "next_sponsors"], format_numbers=True)
+
+    staff_counts = data.get("staff_counts") or {}
+    if staff_counts:
+        click.echo("Staff:")
+        print_table([{"role": role, "count": count} for role, count in staff_counts.items()], ["role", "count"], format_numbers=True)
+
+    pl_rows = [
+        {"kind": item.get("kind"), "month": item.get("amount"), "season": None}
+        for item in data.get("pl_month") or []
+    ]
+    season_amounts = {item.get("kind"): item.get("amount") for item in data.get("pl_season") or []}
+    seen = {row["kind"] for row in pl_rows}
+    for row in pl_rows:
+        row["season"] = season_amounts.get(row["kind"])
+    for item in data.get("pl_season") or []:
+        if item.get("kind") not in seen:
+            pl_rows.append({"kind": item.get("kind"), "month": 0, "season": item.get("amount")})
+    if pl_rows:
+        click.echo("PL (month / season):")
+        print_table(pl_rows, ["kind", "month", "season"], format_numbers=True)
+
+
 def dispatch_errors(func):
     """Decorator to surface CliError as ClickException."""
 
@@ -1,15 +1,15 @@
 """Staff management commands (hiring/firing in May)."""
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import click
 
 from ..api_client import ApiClient
-from ..auth import build_headers
 from ..config import CliConfig
 from ..errors import CliError, ValidationError
 from ..output import print_json
+from ..session import open_client
 
 
 def _resolve_required(option: Optional[str], fallback: Optional[str], label: str) -> str:
@@ -20,14 +20,14 @@ def _resolve_required(option: Optional[str], fallback: Optional[str], label: str
 
 
 def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
-    headers = build_headers(config)
-    return ApiClient(config.base_url, headers=headers, timeout=timeout, verbose=verbose)
+    return open_client(config, timeout, verbose)
 
 
-def _resolve_turn_id(client: ApiClient, season_id: str, turn_id: Optional[str]) -> str:
+def _resolve_turn_id(client: ApiClient, season_id: str, turn_id: Optional[str], turn_data: Optional[Any] = None) -> str:
     if turn_id:
         return turn_id
-    turn_data = client.get(f"/api/turns/seasons/{season_id}/current")
+    if turn_data is None:
+        turn_data = client.get(f"/api/turns/seasons/{season_id}/current")
     resolved = turn_data.get("id") if isinstance(turn_data, Dict) else None
     if not resolved:
         raise CliError("No active turn found for this season")
@@ -41,8 +41,9 @@ def staff(ctx: click.Context) -> None:
     pass
 
 
-def _resolve_current_staff_count(client: ApiClient, club_id: str, role: str) -> int:
-    staff_rows = client.get(f"/api/clubs/{club_id}/management/staff")
+def _resolve_current_staff_count(client: ApiClient, club_id: str, role: str, staff_rows: Optional[Any] = None) -> int:
+    if staff_rows is None:
+        staff_rows = client.get(f"/api/clubs/{club_id}/management/staff")
     if not isinstance(staff_rows, list):
         raise CliError("Failed to load current staff counts")
     for row in staff_rows:
@@ -106,15 +107,23 @@ def set_staff_plan(ctx: click.Context, role: str, count_input: str, club_id: Opt
     club_id = _resolve_required(club_id, config.club_id, "club_id")
 
     with _with_client(config, timeout, verbose) as client:
+        relative = count_input.strip().startswith(("+", "-"))
+        turn_data = staff_rows = None
+        if relative and not turn_id:
+            # Both lookups are independent; fetch them in one round trip
+            turn_data, staff_rows = client.get_many([
+                f"/api/turns/seasons/{season_id}/current",
+                f"/api/clubs/{club_id}/management/staff",
+            ])
         current_count = None
-        if count_input.strip().startswith(("+", "-")):
-            current_count = _resolve_current_staff_count(client, club_id, role.lower())
+        if relative:
+            current_count = _resolve_current_staff_count(client, club_id, role.lower(), staff_rows=staff_rows)
         count = _parse_staff_count_input(count_input, current_count)
         if count < 1:
             raise ValidationError("count must be >= 1")
 
         payload = {"role": role.lower(), "count": count}
-        resolved_turn_id = _resolve_turn_id(client, season_id, turn_id)
+        resolved_turn_id = _resolve_turn_id(client, season_id, turn_id, turn_data=turn_data)
         result = client.post(
             f"/api/clubs/{club_id}/management/staff/plan",
             params={"turn_id": resolved_turn_id},
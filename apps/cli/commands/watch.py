@@ -0,0 +1,305 @@
+"""`watch` command: follow a season and redraw `show` views when they change.
+
+Keeps one connection open to the season event stream (/api/seasons/{id}/events),
+prints turn transitions as they happen, and re-fetches only the views an event
+can affect. Every fetch goes through the ETag cache, so a view is redrawn only
+when its data actually changed. When the server has no event stream (or it keeps
+failing), falls back to polling the current turn with exponential backoff.
+"""
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import click
+
+from ..api_client import ApiClient
+from ..config import CliConfig
+from ..errors import ApiError, CliError
+from ..session import open_client
+from .show import (
+    _format_season_turn_label,
+    _resolve_season_and_club,
+    _resolve_season_identifier,
+    fetch_current_input,
+    fetch_finance,
+    fetch_table,
+    render_current_input,
+    render_finance,
+    render_table,
+)
+
+VIEWS = ("table", "finance", "current_input")
+CLUB_VIEWS = {"finance", "current_input"}
+
+# Which views an event can change ("snapshot"/"resync" refresh everything)
+VIEW_TRIGGERS: Dict[str, set] = {
+    "table": {"turn_resolved", "turn_advanced"},
+    "finance": {"turn_resolved", "turn_advanced"},
+    "current_input": {"turn_opened", "turn_locked", "turn_advanced", "decision_committed"},
+}
+REFRESH_ALL = {"snapshot", "resync"}
+
+EVENT_LABELS = {
+    "turn_opened": "turn opened",
+    "turn_locked": "turn locked",
+    "turn_resolved": "turn resolved",
+    "turn_advanced": "turn advanced",
+    "decision_committed": "decision committed",
+    "ack_received": "ACK received",
+    "disclosure_published": "disclosure published",
+}
+
+# Status codes meaning "this server has no event stream": poll instead
+STREAM_UNSUPPORTED = {404, 405, 406, 501}
+STREAM_RETRIES = 3
+
+FETCHERS: Dict[str, Callable[..., Any]] = {
+    "table": lambda client, season_id, club_id: fetch_table(client, season_id),
+    "finance": lambda client, season_id, club_id: fetch_finance(client, season_id, club_id),
+    "current_input": lambda client, season_id, club_id: fetch_current_input(client, season_id, club_id),
+}
+RENDERERS: Dict[str, Callable[[Any], None]] = {
+    "table": render_table,
+    "finance": render_finance,
+    "current_input": render_current_input,
+}
+
+_sleep = time.sleep
+_MISSING = object()
+
+
+class _StreamFailure(Exception):
+    def __init__(self, error: CliError):
+        super().__init__(str(error))
+        self.error = error
+
+
+def _with_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
+    return open_client(config, timeout, verbose)
+
+
+def _stamp() -> str:
+    return datetime.now().strftime("%H:%M:%S")
+
+
+def describe_event(event_type: str, data: Any) -> Optional[str]:
+    """One-line description of a transition event (None for events not worth printing)."""
+    label = EVENT_LABELS.get(event_type)
+    if label is None or not isinstance(data, dict):
+        return None
+    parts = [label]
+    if data.get("month_index") is not None:
+        parts.append(f"month_index={data['month_index']}")
+    if data.get("club_id"):
+        parts.append(f"club={data['club_id']}")
+    if data.get("disclosure_types"):
+        parts.append("types=" + ",".join(data["disclosure_types"]))
+    return " ".join(parts)
+
+
+class Watcher:
+    def __init__(
+        self,
+        client: ApiClient,
+        config: CliConfig,
+        season_id: str,
+        club_id: Optional[str],
+        views: Iterable[str],
+        min_interval: float,
+        max_interval: float,
+    ):
+        self.client = client
+        self.config = config
+        self.season_id = season_id
+        self.club_id = club_id
+        self.views = [view for view in views if club_id or view not in CLUB_VIEWS]
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._last: Dict[str, Any] = {}
+
+    # -- rendering -----------------------------------------------------------
+
+    def refresh(self, views: Iterable[str]) -> List[str]:
+        """Re-fetch views and redraw the ones whose data changed; returns the redrawn views."""
+        redrawn = []
+        for view in views:
+            data = FETCHERS[view](self.client, self.season_id, self.club_id)
+            if view in self._last and self._last[view] == data:
+                continue
+            self._last[view] = data
+            click.echo(f"--- {view} ({_stamp()}) ---")
+            RENDERERS[view](data)
+            redrawn.append(view)
+        return redrawn
+
+    def views_for(self, event_type: str) -> List[str]:
+        if event_type in REFRESH_ALL:
+            return list(self.views)
+        return [view for view in self.views if event_type in VIEW_TRIGGERS[view]]
+
+    def switch_season(self, season_id: str) -> None:
+        click.echo(f"[{_stamp()}] season changed -> {season_id}")
+        self.season_id = season_id
+        self._last.clear()
+
+    # -- event stream --------------------------------------------------------
+
+    def handle_event(self, event_type: str, data: Any) -> bool:
+        """Apply one stream event; returns True when the stream must be re-opened (new season)."""
+        if event_type == "snapshot" and isinstance(data, dict):
+            click.echo(f"[{_stamp()}] watching season {self.season_id}: {_format_season_turn_label(data.get('turn'))}")
+        description = describe_event(event_type, data)
+        if description:
+            click.echo(f"[{_stamp()}] {description}")
+        if event_type == "turn_advanced" and isinstance(data, dict):
+            next_season_id = data.get("next_season_id")
+            if next_season_id and next_season_id != self.season_id:
+                self.switch_season(next_season_id)
+                return True
+        self.refresh(self.views_for(event_type))
+        return False
+
+    def _events(self):
+        """Stream events; failures of the stream itself are raised as _StreamFailure."""
+        events = self.client.stream_events(f"/api/seasons/{self.season_id}/events")
+        while True:
+            try:
+                item = next(events)
+            except StopIteration:
+                return
+            except CliError as exc:
+                raise _StreamFailure(exc) from exc
+            yield item
+
+    def stream(self) -> None:
+        """Follow the event stream; returns when the server has none (caller polls instead)."""
+        failures = 0
+        while True:
+            try:
+                switched = False
+                for event_type, data in self._events():
+                    failures = 0
+                    if self.handle_event(event_type, data):
+                        switched = True
+                        break
+                if not switched:
+                    # Server closed the stream (restart / deploy): reconnect shortly
+                    _sleep(self.min_interval)
+                continue
+            except _StreamFailure as failure:
+                error = failure.error
+                if isinstance(error, ApiError):
+                    if error.status_code not in STREAM_UNSUPPORTED:
+                        raise error
+                    click.echo("Event stream unavailable; polling instead.", err=True)
+                    return
+            except ApiError:
+                raise
+            except CliError as exc:
+                # Network error while re-fetching a view: treat like a dropped stream
+                error = exc
+            failures += 1
+            if failures > STREAM_RETRIES:
+                click.echo(f"Event stream keeps failing ({error}); polling instead.", err=True)
+                return
+            _sleep(min(self.min_interval * 2 ** (failures - 1), self.max_interval))
+
+    # -- polling fallback ----------------------------------------------------
+
+    def poll(self) -> None:
+        """Poll the current turn (ETag: 304 while nothing changed), backing off while idle."""
+        delay = self.min_interval
+        last_turn: Any = _MISSING
+        while True:
+            turn = self.client.get(f"/api/turns/seasons/{self.season_id}/current")
+            if turn != last_turn:
+                if last_turn is not _MISSING:
+                    click.echo(f"[{_stamp()}] turn changed: {_format_season_turn_label(turn) if turn else 'season finished'}")
+                last_turn = turn
+                if turn is None and self._follow_latest_season():
+                    last_turn = _MISSING
+                    continue
+                self.refresh(self.views)
+                delay = self.min_interval
+            else:
+                delay = min(delay * 2, self.max_interval)
+            _sleep(delay)
+
+    def _follow_latest_season(self) -> bool:
+        if not self.config.game_id:
+            return False
+        latest = self.client.get(f"/api/seasons/games/{self.config.game_id}/latest")
+        latest_id = latest.get("id") if isinstance(latest, dict) else None
+        if latest_id and str(latest_id) != self.season_id:
+            self.switch_season(str(latest_id))
+            return True
+        return False
+
+
+@click.command("watch")
+@click.option("--season-id", help="Season UUID/season_number/year_label (defaults to config)")
+@click.option("--club-id", help="Club UUID or name (defaults to config; needed for finance/current_input)")
+@click.option(
+    "--view",
+    "views",
+    multiple=True,
+    type=click.Choice(VIEWS),
+    help="View to keep up to date (repeatable; default: all)",
+)
+@click.option("--poll", "force_poll", is_flag=True, help="Poll with ETags instead of using the event stream")
+@click.option("--min-interval", default=2.0, show_default=True, help="Initial polling / reconnect delay (seconds)")
+@click.option("--max-interval", default=30.0, show_default=True, help="Maximum polling delay while idle (seconds)")
+@click.pass_context
+def watch_cmd(
+    ctx: click.Context,
+    season_id: Optional[str],
+    club_id: Optional[str],
+    views: Tuple[str, ...],
+    force_poll: bool,
+    min_interval: float,
+    max_interval: float,
+) -> None:
+    """Follow the season and redraw table/finance/current_input when they change (Ctrl-C to stop)."""
+    config: CliConfig = ctx.obj["config"]
+    timeout: float = ctx.obj["timeout"]
+    verbose: bool = ctx.obj["verbose"]
+    selected = list(views) or list(VIEWS)
+
+    with _with_client(config, timeout, verbose) as client:
+        if set(selected) & CLUB_VIEWS and (club_id or config.club_id):
+            season_id, club_id = _resolve_season_and_club(client, config, season_id, club_id)
+        else:
+            season_id = _resolve_season_identifier(client, config, season_id)
+            club_id = None
+            if set(selected) & CLUB_VIEWS:
+                click.echo("No club configured; watching the table only.", err=True)
+
+        watcher = Watcher(client, config, season_id, club_id, selected, min_interval, max_interval)
+        try:
+            if not force_poll:
+                watcher.stream()
+            watcher.poll()
+        except KeyboardInterrupt:
+            click.echo("Stopped.", err=True)
+
+
+def dispatch_errors(func):
+    """Decorator to surface CliError as ClickException."""
+    from functools import wraps
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except CliError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    return wrapper
+
+
+watch_cmd.callback = dispatch_errors(watch_cmd.callback)
+
+
+__all__ = ["watch_cmd", "Watcher", "describe_event"]
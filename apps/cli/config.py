@@ -8,11 +8,6 @@ from typing import Any, Dict, Optional
 
 from .errors import ConfigError
 
-try:
-    import yaml
-except Exception:  # pragma: no cover
-    yaml = None  # Optional dependency; JSON works without it.
-
 
 DEFAULT_CONFIG_PATH = Path.home() / ".club-game" / "config"
 
@@ -24,6 +19,8 @@ class CliConfig:
     game_id: Optional[str] = None
     season_id: Optional[str] = None
     club_id: Optional[str] = None
+    # Runtime only (not persisted): local cache directory, None with --no-cache
+    cache_dir: Optional[Path] = None
 
     @classmethod
     def from_mapping(cls, data: Dict[str, Any]) -> "CliConfig":
@@ -70,7 +67,10 @@ def load_config(path: Optional[Path] = None) -> CliConfig:
     try:
         data = json.loads(raw)
     except json.JSONDecodeError:
-        if yaml is None:
+        # PyYAML is optional and slow to import; only load it for non-JSON configs.
+        try:
+            import yaml
+        except Exception:
             raise ConfigError(
                 "Config is not valid JSON and PyYAML is not installed; install pyyaml or use JSON"
             )
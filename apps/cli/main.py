@@ -1,26 +1,55 @@
 """CLI entrypoint."""
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import click
 
+from .cache import CACHE_DIR_NAME
 from .config import CliConfig, DEFAULT_CONFIG_PATH, load_config
 from .errors import ConfigError, CliError
-from .commands.show import show
-from .commands.input import input_cmd
-from .commands.commit import commit_cmd
-from .commands.view import view_cmd
-from .commands.gm import gm
-from .commands.game import game
-from .commands.staff import staff
-from .commands.academy import academy
-from .commands.ack import ack_cmd
-from .commands.config_cmd import config_group
-
-
-@click.group()
+
+# Command name -> "module:attribute". Modules (and httpx behind them) are imported
+# only when the command is dispatched, so `club-game <cmd>` pays for one module.
+# Module names are relative to this package, like the imports above.
+LAZY_COMMANDS: Dict[str, str] = {
+    "show": ".commands.show:show",
+    "input": ".commands.input:input_cmd",
+    "commit": ".commands.commit:commit_cmd",
+    "view": ".commands.view:view_cmd",
+    "gm": ".commands.gm:gm",
+    "game": ".commands.game:game",
+    "staff": ".commands.staff:staff",
+    "academy": ".commands.academy:academy",
+    "ack": ".commands.ack:ack_cmd",
+    "config": ".commands.config_cmd:config_group",
+    "batch": ".commands.batch:batch_cmd",
+    "shell": ".commands.batch:shell_cmd",
+    "watch": ".commands.watch:watch_cmd",
+}
+
+
+class LazyGroup(click.Group):
+    """click.Group that imports subcommands from `lazy_commands` on first use."""
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":", 1)
+            command = getattr(importlib.import_module(module_name, __package__), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option("--config-path", type=click.Path(exists=False, dir_okay=False, path_type=Path), help="Path to config file (default: ~/.club-game/config)")
 @click.option("--base-url", help="Override API base URL")
 @click.option("--user-email", help="Override user email (X-User-Email)")
@@ -29,8 +58,9 @@ from .commands.config_cmd import config_group
 @click.option("--club-id", help="Default club UUID")
 @click.option("--timeout", default=10.0, show_default=True, help="HTTP timeout (seconds)")
 @click.option("--verbose", is_flag=True, help="Show HTTP status for debugging")
+@click.option("--no-cache", is_flag=True, help="Bypass the local cache (~/.club-game/cache)")
 @click.pass_context
-def cli(ctx: click.Context, config_path: Optional[Path], base_url: Optional[str], user_email: Optional[str], game_id: Optional[str], season_id: Optional[str], club_id: Optional[str], timeout: float, verbose: bool) -> None:
+def cli(ctx: click.Context, config_path: Optional[Path], base_url: Optional[str], user_email: Optional[str], game_id: Optional[str], season_id: Optional[str], club_id: Optional[str], timeout: float, verbose: bool, no_cache: bool) -> None:
     try:
         resolved_path = (config_path or DEFAULT_CONFIG_PATH).expanduser()
         config = load_config(resolved_path)
@@ -47,6 +77,7 @@ def cli(ctx: click.Context, config_path: Optional[Path], base_url: Optional[str]
         config.season_id = season_id
     if club_id:
         config.club_id = club_id
+    config.cache_dir = None if no_cache else resolved_path.parent / CACHE_DIR_NAME
 
     ctx.obj = {
         "config": config,
@@ -57,18 +88,6 @@ def cli(ctx: click.Context, config_path: Optional[Path], base_url: Optional[str]
     }
 
 
-cli.add_command(show)
-cli.add_command(input_cmd)
-cli.add_command(commit_cmd)
-cli.add_command(view_cmd)
-cli.add_command(gm)
-cli.add_command(game)
-cli.add_command(staff)
-cli.add_command(academy)
-cli.add_command(ack_cmd)
-cli.add_command(config_group)
-
-
 @cli.command("help")
 @click.argument("command", required=False)
 @click.argument("subcommand", required=False)
@@ -79,7 +98,7 @@ def help_cmd(ctx: click.Context, command: Optional[str], subcommand: Optional[st
     target_name = "club-game"
 
     if command:
-        cmd = cli.commands.get(command)
+        cmd = cli.get_command(ctx, command)
         if not cmd:
             raise click.ClickException(f"Unknown command: {command}")
         target = cmd
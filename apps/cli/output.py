@@ -1,9 +1,14 @@
 """Simple output helpers (no extra deps)."""
 from __future__ import annotations
 
+import itertools
 import json
+import sys
 from typing import Any, Iterable, List, Mapping, Sequence
 
+# Rows buffered by print_table_stream to size the columns
+STREAM_SAMPLE_ROWS = 50
+
 
 def print_json(data: Any) -> None:
     print(json.dumps(data, ensure_ascii=False, indent=2, sort_keys=False))
@@ -29,16 +34,63 @@ def _stringify(value: Any, *, format_numbers: bool) -> str:
     return str(value)
 
 
+def _table_cells(row: Mapping[str, Any], columns: Sequence[str], format_numbers: bool) -> List[str]:
+    return [_stringify(row.get(col, ""), format_numbers=format_numbers) for col in columns]
+
+
+def _column_widths(headers: Sequence[str], str_rows: Sequence[Sequence[str]]) -> List[int]:
+    return [max(len(h), *(len(r[idx]) for r in str_rows) if str_rows else [0]) for idx, h in enumerate(headers)]
+
+
+def _format_table_row(row: Iterable[str], widths: Sequence[int]) -> str:
+    return " | ".join(val.ljust(widths[idx]) for idx, val in enumerate(row))
+
+
 def print_table(rows: Sequence[Mapping[str, Any]], columns: List[str], *, format_numbers: bool = False) -> None:
     # Compute column widths
     headers = [col for col in columns]
-    str_rows = [[_stringify(row.get(col, ""), format_numbers=format_numbers) for col in columns] for row in rows]
-    widths = [max(len(h), *(len(r[idx]) for r in str_rows) if str_rows else [0]) for idx, h in enumerate(headers)]
-
-    def fmt_row(row: Iterable[str]) -> str:
-        return " | ".join(val.ljust(widths[idx]) for idx, val in enumerate(row))
+    str_rows = [_table_cells(row, columns, format_numbers) for row in rows]
+    widths = _column_widths(headers, str_rows)
 
-    print(fmt_row(headers))
+    print(_format_table_row(headers, widths))
     print("-+-".join("-" * w for w in widths))
     for row in str_rows:
-        print(fmt_row(row))
+        print(_format_table_row(row, widths))
+
+
+def print_table_stream(
+    rows: Iterable[Mapping[str, Any]],
+    columns: List[str],
+    *,
+    format_numbers: bool = False,
+    sample_size: int = STREAM_SAMPLE_ROWS,
+) -> int:
+    """
+    Print a table while rows are still arriving; returns the number of rows.
+
+    Column widths come from the header and the first `sample_size` rows, so
+    only those are buffered (a wider value later just pushes its row out).
+    """
+    iterator = iter(rows)
+    sample = [_table_cells(row, columns, format_numbers) for row in itertools.islice(iterator, sample_size)]
+    widths = _column_widths(columns, sample)
+
+    print(_format_table_row(columns, widths))
+    print("-+-".join("-" * w for w in widths))
+    for cells in sample:
+        print(_format_table_row(cells, widths))
+    sys.stdout.flush()
+    count = len(sample)
+    for row in iterator:
+        print(_format_table_row(_table_cells(row, columns, format_numbers), widths), flush=True)
+        count += 1
+    return count
+
+
+def print_jsonl(rows: Iterable[Any]) -> int:
+    """Print one compact JSON document per line as rows arrive; returns the number of rows."""
+    count = 0
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False, separators=(",", ":")), flush=True)
+        count += 1
+    return count
@@ -0,0 +1,98 @@
+"""Client construction shared by every command, and the long-lived session used by
+``club-game batch`` / ``club-game shell``.
+
+Outside a session each command opens (and closes) its own ApiClient. Inside one,
+commands borrow clients from the session instead: a single httpx connection pool
+stays open for the whole script, the local cache is loaded once, and each
+identity (X-User-Email) keeps its ETag cache between commands.
+"""
+from __future__ import annotations
+
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from .api_client import ApiClient
+from .auth import build_headers
+from .cache import LocalCache, open_cache
+from .config import CliConfig
+
+_current_session: ContextVar[Optional["CliSession"]] = ContextVar("cli_session", default=None)
+
+
+class _SessionClient(ApiClient):
+    """ApiClient owned by a CliSession: leaving a command's `with` block keeps it open."""
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+class CliSession:
+    def __init__(self, timeout: float, transport: Optional[httpx.BaseTransport] = None):
+        self.timeout = timeout
+        self._http = httpx.Client(timeout=timeout, transport=transport)
+        self._clients: Dict[Tuple, ApiClient] = {}
+        self._caches: Dict[Tuple[Optional[Path], str, str], Optional[LocalCache]] = {}
+        self._token = None
+
+    def client(self, config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
+        headers = build_headers(config)
+        key = (config.base_url, tuple(sorted(headers.items())), config.cache_dir)
+        client = self._clients.get(key)
+        if client is None:
+            client = _SessionClient(
+                config.base_url,
+                headers=headers,
+                timeout=timeout,
+                verbose=verbose,
+                cache=self._cache(config),
+                http=self._http,
+            )
+            self._clients[key] = client
+        # The pool is shared, so a per-line --timeout is applied per request
+        client.timeout = timeout
+        client.verbose = verbose
+        return client
+
+    def _cache(self, config: CliConfig) -> Optional[LocalCache]:
+        key = (config.cache_dir, config.base_url, config.user_email)
+        if key not in self._caches:
+            self._caches[key] = open_cache(config)
+        return self._caches[key]
+
+    def close(self) -> None:
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+        self._http.close()
+
+    def __enter__(self) -> "CliSession":
+        self._token = _current_session.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_session.reset(self._token)
+        self.close()
+
+
+def current_session() -> Optional[CliSession]:
+    return _current_session.get()
+
+
+def open_client(config: CliConfig, timeout: float, verbose: bool) -> ApiClient:
+    """ApiClient for one command: borrowed from the active CliSession, if any."""
+    session = _current_session.get()
+    if session is not None:
+        return session.client(config, timeout, verbose)
+    return ApiClient(
+        config.base_url,
+        headers=build_headers(config),
+        timeout=timeout,
+        verbose=verbose,
+        cache=open_cache(config),
+    )
+
+
+__all__ = ["CliSession", "current_session", "open_client"]
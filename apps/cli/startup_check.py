@@ -0,0 +1,102 @@
+"""Startup regression check for the CLI.
+
+Runs ``python -X importtime -c "import apps.cli.main"`` in a fresh interpreter and
+fails when importing the entrypoint exceeds the budget or pulls in modules that
+should only load once a command is dispatched (httpx, PyYAML, command modules).
+
+    python -m apps.cli.startup_check --budget-ms 80
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ENTRYPOINT = "apps.cli.main"
+DEFAULT_BUDGET_MS = 80.0
+# Packages (and their submodules) that must not be imported by `import apps.cli.main`
+DEFERRED_MODULES = ("httpx", "yaml", "apps.cli.commands", "apps.cli.api_client")
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, cumulative µs, nesting depth) in the order `-X importtime` prints them."""
+    rows: List[Tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(parts[1].strip()), depth))
+    return rows
+
+
+def imported_by(rows: List[Tuple[str, int, int]], entrypoint: str = ENTRYPOINT) -> Dict[str, int]:
+    """Cumulative times of `entrypoint` and every module first imported underneath it."""
+    for index, (name, micros, depth) in enumerate(rows):
+        if name != entrypoint:
+            continue
+        # Children are printed before their parent, at a deeper indentation
+        timings = {name: micros}
+        for child, child_micros, child_depth in reversed(rows[:index]):
+            if child_depth <= depth:
+                break
+            timings[child] = child_micros
+        return timings
+    return {}
+
+
+def measure(entrypoint: str = ENTRYPOINT) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entrypoint}"],
+        cwd=_REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return imported_by(parse_importtime(result.stderr), entrypoint)
+
+
+def check(timings: Dict[str, int], budget_ms: float, entrypoint: str = ENTRYPOINT) -> List[str]:
+    """Problems found (empty when within budget)."""
+    problems: List[str] = []
+    total_ms = timings.get(entrypoint, 0) / 1000.0
+    if total_ms > budget_ms:
+        problems.append(f"import {entrypoint} took {total_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+    for prefix in DEFERRED_MODULES:
+        if any(name == prefix or name.startswith(prefix + ".") for name in timings):
+            problems.append(f"{prefix} is imported at startup")
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="Best of N runs (reduces noise)")
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(max(args.runs, 1))]
+    best = min(runs, key=lambda t: t.get(ENTRYPOINT, 0))
+    slowest = sorted(
+        ((name, micros) for name, micros in best.items() if name != ENTRYPOINT),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:5]
+    print(f"import {ENTRYPOINT}: {best.get(ENTRYPOINT, 0) / 1000.0:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    for name, micros in slowest:
+        print(f"  {micros / 1000.0:7.1f} ms  {name}")
+
+    problems = check(best, args.budget_ms)
+    for problem in problems:
+        print(f"FAIL: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
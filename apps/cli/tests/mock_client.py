@@ -0,0 +1,30 @@
+"""Shared test doubles for CLI command tests."""
+from typing import Any, Callable, List, Sequence
+
+from apps.cli.api_client import ApiClient, GetRequest, _split_request
+
+
+def sequential_get_many(self, requests: Sequence[GetRequest]) -> List[Any]:
+    """get_many that issues the fan-out one request at a time through self.get."""
+    return [self.get(*_split_request(r)) for r in requests]
+
+
+class MockApiClientBase:
+    """Base for per-module MockApiClient classes: subclasses define get/post/put."""
+
+    get_many = sequential_get_many
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def stub_get(monkeypatch, fake_get: Callable[..., Any]) -> None:
+    """Replace ApiClient.get with fake_get; get_many fans out through the same stub."""
+    monkeypatch.setattr(ApiClient, "get", fake_get)
+    monkeypatch.setattr(ApiClient, "get_many", sequential_get_many)
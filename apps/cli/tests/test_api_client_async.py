@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+
+from apps.cli.api_client import ApiClient, AsyncApiClient
+from apps.cli.errors import ApiError, CliError
+
+
+def _async_client(handler, **kwargs) -> AsyncApiClient:
+    return AsyncApiClient(
+        "http://example.invalid", headers={}, http2=False, transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def test_get_many_runs_requests_concurrently_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run():
+        async with _async_client(handler, max_concurrency=2) as client:
+            return await client.get_many(["/a", "/b", ("/c", {"x": 1})])
+
+    assert asyncio.run(run()) == [{"path": "/a"}, {"path": "/b"}, {"path": "/c"}]
+    assert peak == 2
+
+
+def test_async_errors_match_sync_client_mapping():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404, json={"detail": "nope"})
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(400, json={"detail": "bad input"})
+
+    async def run():
+        async with _async_client(handler) as client:
+            with pytest.raises(ApiError) as missing:
+                await client.get("/missing")
+            with pytest.raises(ApiError) as invalid:
+                await client.post("/write", json_body={})
+            with pytest.raises(CliError, match="Network error"):
+                await client.get("/down")
+            return missing.value, invalid.value
+
+    missing, invalid = asyncio.run(run())
+    assert missing.status_code == 404
+    assert str(invalid) == "HTTP 400: Validation error: bad input"
+
+
+def test_sync_get_many_shares_etag_cache():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers.get("if-none-match")))
+        if request.headers.get("if-none-match") == 'W/"v1"':
+            return httpx.Response(304, headers={"ETag": 'W/"v1"'})
+        return httpx.Response(200, json={"path": request.url.path}, headers={"ETag": 'W/"v1"'})
+
+    client = ApiClient("http://example.invalid", headers={})
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    client._async = AsyncApiClient(
+        client.base_url, headers={}, http2=False, etag_cache=client._etag_cache,
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        assert client.get("/a") == {"path": "/a"}
+        assert client.get_many(["/a", "/b"]) == [{"path": "/a"}, {"path": "/b"}]
+    finally:
+        client.close()
+    assert ("/a", 'W/"v1"') in seen[1:]
+    assert ("/b", None) in seen
+
+
+def test_get_many_raises_first_failure_in_request_order():
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = {"/a": 200, "/b": 404, "/c": 409}[request.url.path]
+        return httpx.Response(status, json={"detail": request.url.path})
+
+    async def run():
+        async with _async_client(handler) as client:
+            await client.get_many(["/a", "/b", "/c"])
+
+    with pytest.raises(ApiError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.status_code == 404
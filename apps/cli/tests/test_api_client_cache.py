@@ -0,0 +1,24 @@
+import httpx
+
+from apps.cli.api_client import ApiClient
+
+
+def test_get_reuses_cached_body_on_304():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == 'W/"v1"':
+            return httpx.Response(304, headers={"ETag": 'W/"v1"'})
+        return httpx.Response(200, json={"rank": 1}, headers={"ETag": 'W/"v1"'})
+
+    client = ApiClient("http://example.invalid", headers={})
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert client.get("/api/seasons/s1/standings") == {"rank": 1}
+    assert client.get("/api/seasons/s1/standings") == {"rank": 1}
+    assert calls == [None, 'W/"v1"']
+
+    # Different params are cached independently
+    client.get("/api/seasons/s1/standings", params={"month_index": 2})
+    assert calls[-1] is None
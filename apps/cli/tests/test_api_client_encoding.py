@@ -0,0 +1,54 @@
+"""Tests for the msgpack opt-in of ApiClient."""
+import httpx
+import pytest
+
+from apps.cli import api_client
+from apps.cli.api_client import ApiClient
+
+
+def _client(monkeypatch, available: bool, handler) -> ApiClient:
+    monkeypatch.setattr(api_client, "_MSGPACK_AVAILABLE", available)
+    client = ApiClient("http://example.invalid", headers={"X-User-Email": "a@example.com"})
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_accept_header_follows_msgpack_availability(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("accept"))
+        return httpx.Response(200, json={"ok": True})
+
+    assert _client(monkeypatch, True, handler).get("/api/x") == {"ok": True}
+    assert _client(monkeypatch, False, handler).get("/api/y") == {"ok": True}
+    assert seen[0] == "application/msgpack, application/json;q=0.9"
+    assert seen[1] != seen[0]
+
+
+def test_msgpack_response_is_decoded(monkeypatch):
+    msgpack = pytest.importorskip("msgpack")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = msgpack.packb([{"id": "c1", "amount": -1234.5}], use_bin_type=True)
+        return httpx.Response(200, content=body, headers={"content-type": "application/msgpack", "etag": 'W/"v1"'})
+
+    assert _client(monkeypatch, True, handler).get("/api/rows") == [{"id": "c1", "amount": -1234.5}]
+
+
+def test_accept_encoding_advertises_decodable_encodings(monkeypatch):
+    import gzip
+    import json
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("accept-encoding"))
+        body = gzip.compress(json.dumps({"rows": list(range(500))}).encode())
+        return httpx.Response(200, content=body, headers={"content-type": "application/json", "content-encoding": "gzip"})
+
+    monkeypatch.setattr(api_client, "_BROTLI_AVAILABLE", False)
+    assert _client(monkeypatch, False, handler).get("/api/rows") == {"rows": list(range(500))}
+    monkeypatch.setattr(api_client, "_BROTLI_AVAILABLE", True)
+    _client(monkeypatch, False, handler).get("/api/rows")
+    assert seen == ["gzip, deflate", "br, gzip, deflate"]
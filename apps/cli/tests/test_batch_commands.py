@@ -0,0 +1,136 @@
+import json
+from pathlib import Path
+
+import httpx
+from click.testing import CliRunner
+
+from apps.cli.commands import batch as batch_module
+from apps.cli.commands.batch import parse_line
+from apps.cli.main import cli
+from apps.cli.session import CliSession
+
+
+def _write_config(tmp_path: Path) -> Path:
+    cfg = tmp_path / "config.json"
+    cfg.write_text(
+        json.dumps({"base_url": "http://example.invalid", "user_email": "gm@example.com", "game_id": "g1"}),
+        encoding="utf-8",
+    )
+    return cfg
+
+
+def _mock_session(monkeypatch, handler) -> list:
+    sessions = []
+
+    def factory(timeout):
+        session = CliSession(timeout, transport=httpx.MockTransport(handler))
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(batch_module, "CliSession", factory)
+    return sessions
+
+
+def test_parse_line_skips_comments_and_blank_lines():
+    assert parse_line("  # setup\n") == []
+    assert parse_line("") == []
+    assert parse_line('ack --club-id "Club A" -y  # owner') == ["ack", "--club-id", "Club A", "-y"]
+
+
+def test_batch_runs_every_line_in_one_session_with_per_line_identity(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers["x-user-email"], json.loads(request.content)["club_id"]))
+        return httpx.Response(200, json={"ok": True})
+
+    sessions = _mock_session(monkeypatch, handler)
+    script = tmp_path / "session.txt"
+    script.write_text(
+        "# ack for every club\n"
+        "--user-email a@example.com ack --turn-id t1 --club-id c1 -y\n"
+        "\n"
+        "--user-email b@example.com ack --turn-id t1 --club-id c2 -y\n",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(cli, ["--config-path", str(cfg), "--no-cache", "batch", str(script)])
+
+    assert result.exit_code == 0, result.output
+    assert seen == [
+        ("/api/turns/t1/ack", "a@example.com", "c1"),
+        ("/api/turns/t1/ack", "b@example.com", "c2"),
+    ]
+    assert len(sessions) == 1
+    assert result.output.count("Turn ACK sent successfully.") == 2
+    assert "[2] ok" in result.output
+    assert "2 commands, 0 failed" in result.output
+
+
+def test_batch_applies_per_line_timeout_to_the_shared_pool(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"ok": True})
+
+    _mock_session(monkeypatch, handler)
+    script = tmp_path / "session.txt"
+    script.write_text(
+        "--timeout 3 ack --turn-id t1 --club-id c1 -y\nack --turn-id t2 --club-id c1 -y\n",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(cli, ["--config-path", str(cfg), "--no-cache", "--timeout", "20", "batch", str(script)])
+
+    assert result.exit_code == 0, result.output
+    assert timeouts == [3.0, 20.0]
+
+
+def test_batch_stops_at_first_failure_unless_keep_going(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/api/turns/bad/ack":
+            return httpx.Response(409, json={"detail": "Turn is not resolved"})
+        return httpx.Response(200, json={"ok": True})
+
+    _mock_session(monkeypatch, handler)
+    script = tmp_path / "session.txt"
+    script.write_text("ack --turn-id bad --club-id c1 -y\nack --turn-id t2 --club-id c1 -y\n", encoding="utf-8")
+
+    runner = CliRunner()
+    stopped = runner.invoke(cli, ["--config-path", str(cfg), "--no-cache", "batch", str(script)])
+    assert stopped.exit_code == 1
+    assert paths == ["/api/turns/bad/ack"]
+    assert "1 commands, 1 failed" in stopped.output
+
+    paths.clear()
+    kept = runner.invoke(cli, ["--config-path", str(cfg), "--no-cache", "batch", "--keep-going", str(script)])
+    assert kept.exit_code == 1
+    assert paths == ["/api/turns/bad/ack", "/api/turns/t2/ack"]
+    assert "2 commands, 1 failed" in kept.output
+
+
+def test_shell_runs_commands_until_exit(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    _mock_session(monkeypatch, handler)
+    result = CliRunner().invoke(
+        cli,
+        ["--config-path", str(cfg), "--no-cache", "shell"],
+        input="ack --turn-id t1 --club-id c1 -y\nshell\nexit\nack --turn-id t2 --club-id c1 -y\n",
+    )
+
+    assert result.exit_code == 0, result.output
+    assert paths == ["/api/turns/t1/ack"]
+    assert "cannot be run from inside batch/shell" in result.output
@@ -4,7 +4,7 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from apps.cli.main import cli
-from apps.cli.api_client import ApiClient
+from apps.cli.tests.mock_client import stub_get
 
 
 def _write_config(tmp_path: Path) -> Path:
@@ -48,7 +48,7 @@ def test_show_table_smoke(tmp_path, monkeypatch):
         assert path == "/api/seasons/s1/standings"
         return standings
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
+    stub_get(monkeypatch, fake_get)
 
     runner = CliRunner()
     result = runner.invoke(cli, ["--config-path", str(cfg), "show", "table"])
@@ -79,7 +79,7 @@ def test_show_match_month_mapping(tmp_path, monkeypatch):
         assert params == {"month_index": 9}
         return schedule
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
+    stub_get(monkeypatch, fake_get)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -94,30 +94,41 @@ def test_show_match_month_mapping(tmp_path, monkeypatch):
 def test_show_finance_smoke(tmp_path, monkeypatch):
     cfg = _write_config(tmp_path)
 
-    state = {"balance": 1000, "last_applied_turn_id": "t1"}
-    ledger = [
-        {"turn_id": "t1", "month_index": 1, "kind": "sponsor", "amount": 2000, "meta": {}},
-        {"turn_id": "t1", "month_index": 1, "kind": "cost", "amount": -1000, "meta": {}},
-    ]
+    pl = {
+        "club_id": "c1",
+        "season_id": "s1",
+        "season_number": 1,
+        "month_index": 1,
+        "month": [
+            {"kind": "sponsor", "income": 2000, "expense": 0, "net": 2000},
+            {"kind": "cost", "income": 0, "expense": -1000, "net": -1000},
+        ],
+        "month_total": {"kind": "TOTAL", "income": 2000, "expense": -1000, "net": 1000},
+        "season": [
+            {"kind": "sponsor", "income": 2000, "expense": 0, "net": 2000},
+            {"kind": "cost", "income": 0, "expense": -1000, "net": -1000},
+        ],
+        "season_total": {"kind": "TOTAL", "income": 2000, "expense": -1000, "net": 1000},
+    }
 
     def fake_get(self, path, params=None):  # noqa: ANN001
+        if path.endswith("/finance/pl"):
+            assert params == {"season_id": "s1"}
+            return pl
         if path.endswith("/finance/state"):
-            return state
-        if path.endswith("/finance/ledger"):
-            return ledger
-        if path == "/api/seasons/s1":
-            return {"season_number": 1}
+            return {"balance": 1000}
         raise AssertionError(f"Unexpected path {path}")
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
+    stub_get(monkeypatch, fake_get)
 
     runner = CliRunner()
     result = runner.invoke(cli, ["--config-path", str(cfg), "show", "finance"])
 
     assert result.exit_code == 0
-    assert "Balance" in result.output
+    assert "Balance: 1,000" in result.output
     assert "sponsor" in result.output
     assert "cost" in result.output
+    assert "TOTAL" in result.output
 
 
 def test_show_final_standings_by_name(tmp_path, monkeypatch):
@@ -166,7 +177,7 @@ def test_show_final_standings_by_name(tmp_path, monkeypatch):
             return standings
         raise AssertionError(f"Unexpected path {path}")
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
+    stub_get(monkeypatch, fake_get)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -214,7 +225,7 @@ def test_show_disclosure_financial_summary_table(tmp_path, monkeypatch):
             return {"year_label": "2026", "season_number": 5}
         raise AssertionError(f"Unexpected path {path}")
 
-    monkeypatch.setattr(ApiClient, "get", fake_get)
+    stub_get(monkeypatch, fake_get)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -230,3 +241,41 @@ def test_show_disclosure_financial_summary_table(tmp_path, monkeypatch):
     assert "bonus_income" in result.output
     assert "579,973,200" in result.output
     assert "club_id" not in result.output
+
+
+def test_show_dashboard_single_call(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+    calls = []
+    dashboard = {
+        "club_id": "c1",
+        "season_id": "s1",
+        "turn_id": "t1",
+        "month_index": 3,
+        "balance": 1200000,
+        "is_bankrupt": False,
+        "pl_month": [{"kind": "ticket_rev", "amount": 500}],
+        "pl_season": [{"kind": "sponsor_annual", "amount": 1000}, {"kind": "ticket_rev", "amount": 900}],
+        "followers_public": 8000,
+        "sponsor_pipeline": {"current_sponsors": 10, "next_total": None},
+        "staff_counts": {"sales": 2},
+        "rank": 1,
+        "points": 9,
+        "team_power": 12.3,
+    }
+
+    def fake_get(self, path, params=None):  # noqa: ANN001
+        calls.append(path)
+        if path == "/api/clubs/c1/dashboard":
+            assert params == {"season_id": "s1"}
+            return dashboard
+        raise AssertionError(f"Unexpected path {path}")
+
+    stub_get(monkeypatch, fake_get)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config-path", str(cfg), "show", "dashboard"])
+
+    assert result.exit_code == 0, result.output
+    assert calls == ["/api/clubs/c1/dashboard"]
+    assert "sponsor_annual" in result.output
+    assert "sales" in result.output
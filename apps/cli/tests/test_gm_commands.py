@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from click.testing import CliRunner
 
 from apps.cli.main import cli
+from apps.cli.tests.mock_client import MockApiClientBase
 
 
 def _write_config(tmp_path: Path) -> Path:
@@ -23,12 +24,13 @@ def _write_config(tmp_path: Path) -> Path:
     return cfg
 
 
-class MockApiClient:
+class MockApiClient(MockApiClientBase):
     """Mock API client for GM command tests."""
 
     def __init__(self):
         self.calls: list[tuple[str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = []
         self.responses: Dict[tuple[str, str], Any] = {}
+        self.wait_states: list[Dict[str, Any]] = []
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         self.calls.append(("GET", path, None, params))
@@ -38,14 +40,11 @@ class MockApiClient:
         self.calls.append(("POST", path, json_body, params))
         return self.responses.get(("POST", path), {})
 
-    def close(self) -> None:
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        pass
+    def wait_state(
+        self, season_id: str, after_version: Optional[int] = None, wait: float = 30.0, after_acks: Optional[int] = None
+    ) -> Any:
+        self.calls.append(("WAIT", season_id, None, {"after_version": after_version}))
+        return self.wait_states.pop(0)
 
 
 def test_gm_lock_uses_current_turn(tmp_path, monkeypatch):
@@ -69,6 +68,29 @@ def test_gm_lock_uses_current_turn(tmp_path, monkeypatch):
     assert ("POST", "/api/turns/turn-1/lock", None, None) in mock_client.calls
 
 
+def test_gm_lock_wait_long_polls_until_all_committed(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+
+    mock_client = MockApiClient()
+    turn = {"id": "turn-1", "turn_state": "collecting"}
+    mock_client.wait_states = [
+        {"state_version": 5, "turn": turn, "pending_decisions": 2},
+        {"state_version": 6, "turn": turn, "pending_decisions": 1},
+        {"state_version": 7, "turn": turn, "pending_decisions": 0},
+    ]
+    mock_client.responses[("GET", "/api/turns/seasons/s1/current")] = {"id": "turn-1"}
+    monkeypatch.setattr("apps.cli.commands.gm._with_client", lambda *args, **kwargs: mock_client)
+
+    result = CliRunner().invoke(cli, ["--config-path", str(cfg), "gm", "lock", "--wait"])
+
+    assert result.exit_code == 0, result.output
+    assert "Waiting: 2 decision(s) not committed" in result.output
+    assert "Waiting: 1 decision(s) not committed" in result.output
+    waits = [call[3]["after_version"] for call in mock_client.calls if call[0] == "WAIT"]
+    assert waits == [None, 5, 6]
+    assert mock_client.calls[-1] == ("POST", "/api/turns/turn-1/lock", None, None)
+
+
 def test_gm_resolve_with_turn_id(tmp_path, monkeypatch):
     cfg = _write_config(tmp_path)
 
@@ -86,3 +108,77 @@ def test_gm_resolve_with_turn_id(tmp_path, monkeypatch):
     assert result.exit_code == 0
     assert "Turn resolved" in result.output
     assert ("POST", "/api/turns/turn-9/resolve", None, None) in mock_client.calls
+
+
+TRACE_SPANS = [
+    {"span_id": 0, "parent_id": None, "name": "resolve", "club_id": None, "duration_ms": 100.0, "queries": 50},
+    {"span_id": 1, "parent_id": 0, "name": "expenses", "club_id": None, "duration_ms": 80.0, "queries": 40},
+    {"span_id": 2, "parent_id": 1, "name": "staff.process_staff_cost", "club_id": "club-a", "duration_ms": 60.0, "queries": 30},
+    {"span_id": 3, "parent_id": 1, "name": "staff.process_staff_cost", "club_id": "club-b", "duration_ms": 10.0, "queries": 5},
+    {"span_id": 4, "parent_id": 1, "name": "sponsor.process_sponsor_revenue", "club_id": "club-a", "duration_ms": 5.0, "queries": 2},
+    {"span_id": 5, "parent_id": 0, "name": "matches", "club_id": None, "duration_ms": 15.0, "queries": 8},
+    {"span_id": 6, "parent_id": 5, "name": "match_results.calculate_tp", "club_id": "club-a", "duration_ms": 2.0, "queries": 1},
+    {"span_id": 7, "parent_id": 5, "name": "match_results.calculate_tp", "club_id": "club-a", "duration_ms": 3.0, "queries": 1},
+]
+
+
+def test_gm_trace_renders_tree_grouped_by_club(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+
+    mock_client = MockApiClient()
+    mock_client.responses[("GET", "/api/admin/traces/turns/turn-9")] = TRACE_SPANS
+    monkeypatch.setattr("apps.cli.commands.gm._with_client", lambda *args, **kwargs: mock_client)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config-path", str(cfg), "gm", "trace", "--turn-id", "turn-9"])
+
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0].startswith("resolve  100.0 ms  50 q  100.0%")
+    # expenses の下はクラブ単位にまとめられ、重いクラブが先に来る
+    expenses_idx = next(i for i, line in enumerate(lines) if "expenses" in line)
+    assert "club club-a  65.0 ms" in lines[expenses_idx + 1]
+    assert any("match_results.calculate_tp ×2  5.0 ms" in line for line in lines)
+
+
+def test_gm_trace_reads_local_file(tmp_path):
+    cfg = _write_config(tmp_path)
+    trace_file = tmp_path / "turn-1.jsonl"
+    trace_file.write_text("\n".join(json.dumps(s) for s in TRACE_SPANS) + "\n", encoding="utf-8")
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config-path", str(cfg), "gm", "trace", "--file", str(trace_file), "--min-ms", "20"])
+
+    assert result.exit_code == 0, result.output
+    assert "expenses" in result.output
+    assert "matches" not in result.output
+
+
+def test_gm_report_prints_phase_table(tmp_path, monkeypatch):
+    cfg = _write_config(tmp_path)
+
+    mock_client = MockApiClient()
+    mock_client.responses[("GET", "/api/turns/seasons/s1/current")] = {"id": "turn-1"}
+    mock_client.responses[("GET", "/api/turns/turn-1/resolve-report")] = {
+        "turn_id": "turn-1",
+        "season_number": 2,
+        "month_index": 5,
+        "total_ms": 200.0,
+        "phases": {"expenses": {"ms": 150.0, "queries": 120}, "matches": {"ms": 50.0, "queries": 30}},
+        "total_queries": 160,
+        "clubs_processed": 8,
+        "fixtures_processed": 4,
+        "ledger_rows_written": 96,
+        "peak_memory_kb": 20480,
+        "app_version": "1.4.0",
+    }
+    monkeypatch.setattr("apps.cli.commands.gm._with_client", lambda *args, **kwargs: mock_client)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--config-path", str(cfg), "gm", "report"])
+
+    assert result.exit_code == 0, result.output
+    assert "season:2-month:5" in result.output
+    assert "peak memory: 20,480 KB" in result.output
+    assert "expenses | 150.0" in result.output
+    assert "75.0%" in result.output
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from click.testing import CliRunner
 
 from apps.cli.main import cli
+from apps.cli.tests.mock_client import MockApiClientBase
 from apps.cli.draft import save_draft, load_draft
 
 
@@ -25,7 +26,7 @@ def _write_config(tmp_path: Path) -> Path:
     return cfg
 
 
-class MockApiClient:
+class MockApiClient(MockApiClientBase):
     """Mock API client for testing input commands."""
 
     def __init__(self):
@@ -44,15 +45,6 @@ class MockApiClient:
         self.calls.append(("PUT", path, json_body, params))
         return self.responses.get(("PUT", path), {})
 
-    def close(self) -> None:
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        pass
-
 
 def test_input_updates_local_draft_and_merges_with_api(tmp_path, monkeypatch):
     cfg = _write_config(tmp_path)
@@ -0,0 +1,130 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from apps.cli.api_client import ApiClient
+from apps.cli.cache import LocalCache
+from apps.cli.commands import show as show_module
+from apps.cli.commands.show import _resolve_season_and_club
+from apps.cli.config import CliConfig
+from apps.cli.errors import ApiError
+from apps.cli.main import cli
+
+SEASON_ID = "11111111-1111-1111-1111-111111111111"
+USER = "u@example.com"
+
+
+def _client(cache: LocalCache, handler) -> ApiClient:
+    client = ApiClient("http://example.invalid", headers={}, cache=cache)
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_id_maps_round_trip_and_drop_ambiguous_names(tmp_path):
+    cache = LocalCache(tmp_path, "http://example.invalid", USER)
+    cache.remember_clubs("g1", [
+        {"id": "c1", "name": "Club Alpha", "short_name": "Alpha"},
+        {"id": "c2", "name": "Club Beta", "short_name": "Alpha"},
+    ])
+
+    reloaded = LocalCache(tmp_path, "http://example.invalid/", USER)
+    assert reloaded.lookup_id("clubs", "g1", "Club Beta") == "c2"
+    assert reloaded.lookup_id("clubs", "g1", "Alpha") is None
+    assert reloaded.lookup_id("clubs", "g2", "Club Beta") is None
+    assert LocalCache(tmp_path, "http://other.invalid", USER).lookup_id("clubs", "g1", "Club Beta") is None
+
+
+def test_finished_season_payloads_are_served_without_request(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/standings"):
+            return httpx.Response(200, json=[{"rank": 1}], headers={"ETag": 'W/"v9"'})
+        return httpx.Response(200, json={"id": SEASON_ID, "status": "finished"})
+
+    cache = LocalCache(tmp_path, "http://example.invalid", USER)
+    first = _client(cache, handler)
+    first.get(f"/api/seasons/{SEASON_ID}")
+    assert first.get(f"/api/seasons/{SEASON_ID}/standings") == [{"rank": 1}]
+
+    # A new process (fresh in-memory state) answers from disk
+    second = _client(LocalCache(tmp_path, "http://example.invalid", USER), handler)
+    assert second.get(f"/api/seasons/{SEASON_ID}/standings") == [{"rank": 1}]
+    assert calls == [f"/api/seasons/{SEASON_ID}", f"/api/seasons/{SEASON_ID}/standings"]
+
+    # Another identity on the same machine neither sees the body nor revalidates its ETag
+    seen = []
+
+    def other_handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        return httpx.Response(403, json={"detail": "User not part of game"})
+
+    other = _client(LocalCache(tmp_path, "http://example.invalid", "other@example.com"), other_handler)
+    with pytest.raises(ApiError):
+        other.get(f"/api/seasons/{SEASON_ID}/standings")
+    assert seen == [None]
+
+
+def test_running_season_payloads_are_revalidated_with_stored_etag(tmp_path):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == 'W/"v1"':
+            return httpx.Response(304, headers={"ETag": 'W/"v1"'})
+        return httpx.Response(200, json=[{"rank": 2}], headers={"ETag": 'W/"v1"'})
+
+    _client(LocalCache(tmp_path, "http://example.invalid", USER), handler).get(f"/api/seasons/{SEASON_ID}/standings")
+    client = _client(LocalCache(tmp_path, "http://example.invalid", USER), handler)
+    assert client.get(f"/api/seasons/{SEASON_ID}/standings") == [{"rank": 2}]
+    assert seen == [None, 'W/"v1"']
+
+
+class _CachedMockClient:
+    def __init__(self, cache: LocalCache):
+        self.cache = cache
+        self.calls = []
+
+    def get(self, path, params=None):
+        self.calls.append(path)
+        if path == "/api/seasons/games/g1":
+            return [{"id": "s2", "season_number": 2, "year_label": "2025"}]
+        if path == "/api/games/g1/clubs":
+            return [{"id": "c2", "name": "Club Beta", "short_name": "Beta"}]
+        return {}
+
+    def get_many(self, requests):
+        return [self.get(r) for r in requests]
+
+
+def test_name_resolution_skips_lookup_lists_once_cached(tmp_path):
+    config = CliConfig(base_url="http://example.invalid", user_email="u@example.com", game_id="g1")
+    cache = LocalCache(tmp_path, config.base_url, config.user_email)
+
+    first = _CachedMockClient(cache)
+    assert _resolve_season_and_club(first, config, "2025", "Beta") == ("s2", "c2")
+    assert len(first.calls) == 2
+
+    second = _CachedMockClient(LocalCache(tmp_path, config.base_url, config.user_email))
+    assert _resolve_season_and_club(second, config, "2", "Club Beta") == ("s2", "c2")
+    assert second.calls == []
+
+
+def test_no_cache_flag_disables_local_cache(tmp_path, monkeypatch):
+    cfg = tmp_path / "config.json"
+    cfg.write_text(json.dumps({"base_url": "http://example.invalid", "user_email": "u@example.com"}), encoding="utf-8")
+    seen = []
+
+    def fake_with_client(config, timeout, verbose):
+        seen.append(config.cache_dir)
+        raise SystemExit(0)
+
+    monkeypatch.setattr(show_module, "_with_client", fake_with_client)
+    runner = CliRunner()
+    runner.invoke(cli, ["--config-path", str(cfg), "show", "table", "--season-id", "s1"])
+    runner.invoke(cli, ["--config-path", str(cfg), "--no-cache", "show", "table", "--season-id", "s1"])
+    assert seen == [Path(tmp_path) / "cache", None]
@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 from click.testing import CliRunner
 
 from apps.cli.main import cli
+from apps.cli.tests.mock_client import MockApiClientBase
 
 
 def _write_config(tmp_path: Path) -> Path:
@@ -22,7 +23,7 @@ def _write_config(tmp_path: Path) -> Path:
     return cfg
 
 
-class MockApiClient:
+class MockApiClient(MockApiClientBase):
     """Mock API client capturing params for verification."""
 
     def __init__(self):
@@ -33,15 +34,6 @@ class MockApiClient:
         self.calls.append(("GET", path, params))
         return self.responses.get(("GET", path), {})
 
-    def close(self) -> None:
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        pass
-
 
 def test_show_match_resolves_season_and_club_identifiers(tmp_path, monkeypatch):
     cfg = _write_config(tmp_path)
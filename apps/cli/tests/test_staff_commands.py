@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 from click.testing import CliRunner
 
 from apps.cli.main import cli
+from apps.cli.tests.mock_client import MockApiClientBase
 
 
 def _write_config(tmp_path: Path) -> Path:
@@ -24,7 +25,7 @@ def _write_config(tmp_path: Path) -> Path:
     return cfg
 
 
-class MockApiClient:
+class MockApiClient(MockApiClientBase):
     """Mock API client for staff command tests."""
 
     def __init__(self):
@@ -39,15 +40,6 @@ class MockApiClient:
         self.calls.append(("POST", path, json_body, params))
         return self.responses.get(("POST", path), {})
 
-    def close(self) -> None:
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        pass
-
 
 def test_staff_plan_delta_uses_current_count(tmp_path, monkeypatch):
     cfg = _write_config(tmp_path)
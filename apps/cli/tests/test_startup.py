@@ -0,0 +1,34 @@
+import click
+
+from apps.cli.main import LAZY_COMMANDS, cli
+from apps.cli.startup_check import check, imported_by, measure, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       900 |        900 | site
+import time:       300 |        300 |     click.types
+import time:       500 |        800 |   click
+import time:       100 |        100 |   apps.cli.errors
+import time:       400 |       1300 | apps.cli.main
+"""
+
+
+def test_imported_by_only_counts_the_entrypoint_subtree():
+    timings = imported_by(parse_importtime(SAMPLE))
+    assert timings == {"apps.cli.main": 1300, "apps.cli.errors": 100, "click": 800, "click.types": 300}
+    assert check(timings, budget_ms=1.0) == ["import apps.cli.main took 1.3 ms (budget 1.0 ms)"]
+    assert check({**timings, "httpx._client": 5}, budget_ms=10.0) == ["httpx is imported at startup"]
+
+
+def test_entrypoint_import_defers_commands_httpx_and_yaml():
+    # Generous budget: this guards the import graph, the timing budget is for CI runs
+    assert check(measure(), budget_ms=2000.0) == []
+
+
+def test_lazy_group_lists_and_resolves_every_command():
+    ctx = click.Context(cli)
+    assert set(LAZY_COMMANDS) <= set(cli.list_commands(ctx))
+    # resolved relative to the package, so the CLI also works when imported under another name
+    assert all(target.startswith(".commands.") for target in LAZY_COMMANDS.values())
+    for name in LAZY_COMMANDS:
+        assert cli.get_command(ctx, name).name == name
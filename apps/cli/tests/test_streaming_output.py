@@ -0,0 +1,86 @@
+"""Tests for --jsonl / --stream output and paginated reads."""
+import json
+from pathlib import Path
+
+import httpx
+from click.testing import CliRunner
+
+from apps.cli.api_client import ApiClient
+from apps.cli.main import cli
+from apps.cli.output import print_jsonl, print_table_stream
+
+CLUB = "22222222-2222-2222-2222-222222222222"
+
+
+def test_print_table_stream_prints_before_the_source_is_exhausted(capsys):
+    def rows():
+        yield {"name": "a", "n": 1}
+        yield {"name": "bb", "n": 1000}
+        # everything above is already on stdout when the next page is requested
+        assert "bb   | 1,000" in capsys.readouterr().out
+        yield {"name": "a-much-longer-name", "n": 2}
+
+    assert print_table_stream(rows(), ["name", "n"], format_numbers=True, sample_size=2) == 3
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ["a-much-longer-name | 2    "]
+
+
+def test_print_jsonl_writes_one_compact_object_per_line(capsys):
+    assert print_jsonl(iter([{"a": 1}, {"b": "é"}])) == 2
+    assert capsys.readouterr().out == '{"a":1}\n{"b":"é"}\n'
+
+
+def test_iter_pages_follows_next_cursor():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        seen.append((request.url.params.get("limit"), cursor))
+        if cursor is None:
+            return httpx.Response(200, json=[{"i": 1}, {"i": 2}], headers={"X-Next-Cursor": "c2"})
+        return httpx.Response(200, json=[{"i": 3}])
+
+    client = ApiClient("http://example.invalid", headers={})
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert list(client.iter_pages("/api/items", params={"season_id": "s1"}, page_size=2)) == [{"i": 1}, {"i": 2}, {"i": 3}]
+    assert seen == [("2", None), ("2", "c2")]
+
+
+class PagedClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def iter_pages(self, path, params=None, page_size=200):
+        self.requested.append(path)
+        yield from self.pages.get(path, [])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_history_all_seasons_jsonl(tmp_path: Path, monkeypatch):
+    cfg = tmp_path / "config.json"
+    cfg.write_text(
+        json.dumps({"base_url": "http://example.invalid", "user_email": "o@example.com", "game_id": "g1", "club_id": CLUB}),
+        encoding="utf-8",
+    )
+    client = PagedClient({
+        "/api/seasons/games/g1": [{"id": "s1"}, {"id": "s2"}],
+        f"/api/turns/seasons/s1/decisions/{CLUB}": [{"season_number": 1, "month_index": 1}],
+        f"/api/turns/seasons/s2/decisions/{CLUB}": [{"season_number": 2, "month_index": 1}, {"season_number": 2, "month_index": 2}],
+    })
+    monkeypatch.setattr("apps.cli.commands.show._with_client", lambda *args, **kwargs: client)
+
+    result = CliRunner().invoke(cli, ["--config-path", str(cfg), "--no-cache", "show", "history", "--all-seasons", "--jsonl"])
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["season_number"] for line in result.output.splitlines()] == [1, 2, 2]
+
+    result = CliRunner().invoke(cli, ["--config-path", str(cfg), "show", "history", "--jsonl", "--json-output"])
+    assert result.exit_code != 0
+    assert "only one of" in result.output
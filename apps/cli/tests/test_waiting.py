@@ -0,0 +1,84 @@
+"""Tests for the long-poll wait helper and `ack --wait`."""
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from apps.cli import waiting
+from apps.cli.errors import CliError
+from apps.cli.main import cli
+
+
+class WaitClient:
+    def __init__(self, states):
+        self.states = list(states)
+        self.waits = []
+        self.after_acks = []
+        self.posts = []
+
+    def wait_state(self, season_id, after_version=None, wait=30.0, after_acks=None):
+        self.waits.append((after_version, wait))
+        self.after_acks.append(after_acks)
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+    def post(self, path, json_body=None, params=None):
+        self.posts.append((path, json_body))
+        return {"ack": True}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_wait_until_times_out_with_progress(monkeypatch):
+    clock = iter([0.0, 1.0, 4.0, 11.0])
+    monkeypatch.setattr(waiting, "_monotonic", lambda: next(clock))
+    state = {"state_version": 3, "turn": {"id": "t1", "turn_state": "resolved"}, "pending_acks": 2}
+    client = WaitClient([state])
+
+    with pytest.raises(CliError, match="2 club\\(s\\) yet to ACK"):
+        waiting.wait_until(client, "s1", waiting.all_acked, timeout=10.0)
+    # each long-poll is capped by the remaining time
+    assert client.waits == [(None, 30.0), (3, 9.0), (3, 6.0)]
+
+
+def test_wait_until_follows_ack_count_without_version_bumps():
+    resolved = {"id": "t1", "turn_state": "resolved"}
+    client = WaitClient([
+        {"state_version": 5, "turn": resolved, "pending_acks": 2, "ack_count": 1},
+        {"state_version": 5, "turn": resolved, "pending_acks": 1, "ack_count": 2},
+        {"state_version": 5, "turn": resolved, "pending_acks": 0, "ack_count": 3},
+    ])
+
+    state = waiting.wait_until(client, "s1", waiting.all_acked)
+
+    assert state["pending_acks"] == 0
+    # ACKs do not move state_version: each long-poll also passes the last seen ack_count
+    assert client.waits == [(None, 30.0), (5, 30.0), (5, 30.0)]
+    assert client.after_acks == [None, 1, 2]
+
+
+def test_ack_wait_returns_when_turn_advanced(tmp_path: Path, monkeypatch):
+    cfg = tmp_path / "config.json"
+    cfg.write_text(
+        json.dumps({"base_url": "http://example.invalid", "user_email": "owner@example.com", "season_id": "s1", "club_id": "c1"}),
+        encoding="utf-8",
+    )
+    resolved = {"id": "t1", "turn_state": "resolved", "season_number": 1, "month_name": "August", "month_index": 1}
+    next_turn = {"id": "t2", "turn_state": "collecting", "season_number": 1, "month_name": "September", "month_index": 2}
+    client = WaitClient([
+        {"state_version": 8, "turn": resolved, "pending_acks": 1},
+        {"state_version": 9, "turn": next_turn, "pending_decisions": 4},
+    ])
+    monkeypatch.setattr("apps.cli.commands.ack._with_client", lambda *args, **kwargs: client)
+
+    result = CliRunner().invoke(cli, ["--config-path", str(cfg), "ack", "--turn-id", "t1", "-y", "--wait"])
+
+    assert result.exit_code == 0, result.output
+    assert client.posts == [("/api/turns/t1/ack", {"club_id": "c1", "ack": True})]
+    assert "Waiting: 1 club(s) yet to ACK" in result.output
+    assert "Turn advanced: now season1-September(2)." in result.output
+    assert [after for after, _ in client.waits] == [None, 8]
@@ -0,0 +1,149 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from apps.cli.api_client import ApiClient, iter_sse
+from apps.cli.commands import watch as watch_module
+from apps.cli.errors import ApiError
+from apps.cli.main import cli
+
+SEASON = "11111111-1111-1111-1111-111111111111"
+CLUB = "22222222-2222-2222-2222-222222222222"
+
+
+def _write_config(tmp_path: Path) -> Path:
+    cfg = tmp_path / "config.json"
+    cfg.write_text(
+        json.dumps({"base_url": "http://example.invalid", "user_email": "owner@example.com"}),
+        encoding="utf-8",
+    )
+    return cfg
+
+
+class MockWatchClient:
+    def __init__(self, streams: List[Any]):
+        self.responses: Dict[str, Any] = {}
+        self.calls: List[str] = []
+        self._streams = list(streams)
+
+    def _lookup(self, path: str, advance: bool) -> Any:
+        # ".../current" responses are sequences: each direct get() moves to the next one
+        self.calls.append(path)
+        value = self.responses.get(path)
+        if not (isinstance(value, list) and value and path.endswith("/current")):
+            return value
+        return value.pop(0) if advance and len(value) > 1 else value[0]
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self._lookup(path, advance=True)
+
+    def get_many(self, requests):
+        return [self._lookup(r if isinstance(r, str) else r[0], advance=False) for r in requests]
+
+    def stream_events(self, path: str):
+        self.calls.append(f"STREAM {path}")
+        item = self._streams.pop(0)
+        if isinstance(item, BaseException):
+            raise item
+        yield from item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def _invoke(tmp_path, monkeypatch, client, *args):
+    monkeypatch.setattr(watch_module, "_with_client", lambda config, timeout, verbose: client)
+    return CliRunner().invoke(
+        cli,
+        ["--config-path", str(_write_config(tmp_path)), "--no-cache", "watch", "--season-id", SEASON, *args],
+    )
+
+
+def test_iter_sse_parses_events_and_skips_comments():
+    lines = [
+        "retry: 3000", "",
+        "event: snapshot", 'data: {"turn": null}', "",
+        ": keepalive", "",
+        "event: turn_locked", 'data: {"month_index": 2}', "",
+    ]
+    assert list(iter_sse(lines)) == [("snapshot", {"turn": None}), ("turn_locked", {"month_index": 2})]
+
+
+def test_stream_events_reads_event_stream_and_maps_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/missing/events"):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        assert request.headers["accept"] == "text/event-stream"
+        body = b'event: turn_opened\ndata: {"month_index": 3}\n\n: keepalive\n\n'
+        return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+    client = ApiClient("http://example.invalid", headers={"X-User-Email": "a@example.com"})
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    assert list(client.stream_events("/api/seasons/s1/events")) == [("turn_opened", {"month_index": 3})]
+    with pytest.raises(ApiError) as excinfo:
+        list(client.stream_events("/api/seasons/missing/events"))
+    assert excinfo.value.status_code == 404
+
+
+def test_watch_redraws_only_views_affected_by_events(tmp_path, monkeypatch):
+    client = MockWatchClient([
+        [
+            ("snapshot", {"season_id": SEASON, "turn": {"season_number": 1, "month_name": "August", "month_index": 1}}),
+            ("decision_committed", {"season_id": SEASON, "club_id": CLUB, "month_index": 1}),
+            ("ack_received", {"season_id": SEASON, "club_id": CLUB, "month_index": 1}),
+        ],
+        KeyboardInterrupt(),
+    ])
+    client.responses = {
+        f"/api/seasons/{SEASON}/standings": [{"rank": 1, "club_name": "Alpha", "points": 3}],
+        f"/api/seasons/{SEASON}/bankrupt-clubs": [],
+        f"/api/turns/seasons/{SEASON}/current": {"season_number": 1, "month_name": "August", "month_index": 1},
+        f"/api/turns/seasons/{SEASON}/decisions/{CLUB}/current": [
+            {"month_index": 1, "decision_state": "draft"},
+            {"month_index": 1, "decision_state": "committed"},
+        ],
+    }
+    monkeypatch.setattr(watch_module, "_sleep", lambda seconds: None)
+
+    result = _invoke(tmp_path, monkeypatch, client, "--club-id", CLUB, "--view", "table", "--view", "current_input")
+
+    assert result.exit_code == 0, result.output
+    assert "decision committed month_index=1" in result.output
+    assert "ACK received" in result.output
+    assert result.output.count("--- table") == 1
+    assert result.output.count("--- current_input") == 2
+    # ack_received affects no watched view: nothing re-fetched after it
+    assert client.calls[-1] == f"STREAM /api/seasons/{SEASON}/events"
+
+
+def test_watch_falls_back_to_polling_with_backoff(tmp_path, monkeypatch):
+    client = MockWatchClient([ApiError(404, "Not Found")])
+    turn_1 = {"season_number": 1, "month_name": "August", "month_index": 1, "turn_state": "collecting"}
+    turn_2 = {"season_number": 1, "month_name": "September", "month_index": 2, "turn_state": "collecting"}
+    client.responses = {
+        f"/api/seasons/{SEASON}/standings": [],
+        f"/api/seasons/{SEASON}/bankrupt-clubs": [],
+        f"/api/turns/seasons/{SEASON}/current": [turn_1, turn_1, turn_1, turn_1, turn_2, turn_2],
+    }
+    delays: List[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+        if len(delays) == 6:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch_module, "_sleep", fake_sleep)
+    result = _invoke(tmp_path, monkeypatch, client, "--view", "table", "--max-interval", "8")
+
+    assert result.exit_code == 0, result.output
+    assert "polling instead" in result.output
+    assert delays == [2.0, 4.0, 8.0, 8.0, 2.0, 4.0]
+    assert "turn changed: season1-September(2)" in result.output
@@ -0,0 +1,108 @@
+"""Render resolve trace spans (JSON lines) as a flame-style tree."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+BAR_WIDTH = 20
+
+
+@dataclass
+class TraceNode:
+    name: str
+    duration_ms: float = 0.0
+    queries: int = 0
+    calls: int = 0
+    children: List["TraceNode"] = field(default_factory=list)
+
+
+def load_spans_file(path: Path) -> List[Dict[str, Any]]:
+    with path.open(encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def _merge(name: str, spans: Sequence[Mapping[str, Any]], children_of: Mapping[Any, List[Mapping[str, Any]]]) -> TraceNode:
+    """Merge same-named sibling spans into one node, then group their children."""
+    node = TraceNode(
+        name=name,
+        duration_ms=sum(float(s.get("duration_ms") or 0.0) for s in spans),
+        queries=sum(int(s.get("queries") or 0) for s in spans),
+        calls=len(spans),
+    )
+    children = [child for s in spans for child in children_of.get(s["span_id"], [])]
+    node.children = _group_children(children, spans[0].get("club_id"), children_of)
+    return node
+
+
+def _group_children(
+    children: Sequence[Mapping[str, Any]],
+    parent_club: Optional[str],
+    children_of: Mapping[Any, List[Mapping[str, Any]]],
+) -> List[TraceNode]:
+    # Children belonging to several clubs (e.g. a phase looping over clubs) are
+    # bucketed per club first so one club dominating a phase is visible.
+    clubs = {c.get("club_id") for c in children if c.get("club_id") and c.get("club_id") != parent_club}
+    if len(clubs) > 1:
+        nodes = []
+        for club_id in clubs:
+            club_spans = [c for c in children if c.get("club_id") == club_id]
+            club_node = TraceNode(
+                name=f"club {club_id}",
+                duration_ms=sum(float(c.get("duration_ms") or 0.0) for c in club_spans),
+                queries=sum(int(c.get("queries") or 0) for c in club_spans),
+                calls=1,
+            )
+            club_node.children = _group_by_name(club_spans, children_of)
+            nodes.append(club_node)
+        rest = [c for c in children if c.get("club_id") not in clubs]
+        nodes.extend(_group_by_name(rest, children_of))
+        return sorted(nodes, key=lambda n: n.duration_ms, reverse=True)
+    return _group_by_name(children, children_of)
+
+
+def _group_by_name(spans: Sequence[Mapping[str, Any]], children_of: Mapping[Any, List[Mapping[str, Any]]]) -> List[TraceNode]:
+    by_name: Dict[str, List[Mapping[str, Any]]] = {}
+    for s in spans:
+        by_name.setdefault(s["name"], []).append(s)
+    nodes = [_merge(name, group, children_of) for name, group in by_name.items()]
+    return sorted(nodes, key=lambda n: n.duration_ms, reverse=True)
+
+
+def build_trace_tree(spans: Sequence[Mapping[str, Any]]) -> List[TraceNode]:
+    children_of: Dict[Any, List[Mapping[str, Any]]] = {}
+    roots = []
+    for s in spans:
+        if s.get("parent_id") is None:
+            roots.append(s)
+        else:
+            children_of.setdefault(s["parent_id"], []).append(s)
+    return _group_by_name(roots, children_of)
+
+
+def render_trace_tree(spans: Sequence[Mapping[str, Any]], min_ms: float = 0.0) -> List[str]:
+    roots = build_trace_tree(spans)
+    total = sum(root.duration_ms for root in roots) or 1.0
+    lines: List[str] = []
+
+    def walk(node: TraceNode, prefix: str, is_last: bool, depth: int) -> None:
+        share = node.duration_ms / total
+        bar = "█" * max(1, round(share * BAR_WIDTH)) if node.duration_ms > 0 else ""
+        connector = "" if depth == 0 else ("└─ " if is_last else "├─ ")
+        calls = f" ×{node.calls}" if node.calls > 1 else ""
+        lines.append(
+            f"{prefix}{connector}{node.name}{calls}  {node.duration_ms:.1f} ms  "
+            f"{node.queries} q  {share * 100:.1f}%  {bar}"
+        )
+        visible = [c for c in node.children if c.duration_ms >= min_ms]
+        child_prefix = prefix if depth == 0 else prefix + ("   " if is_last else "│  ")
+        for idx, child in enumerate(visible):
+            walk(child, child_prefix, idx == len(visible) - 1, depth + 1)
+
+    for root in roots:
+        walk(root, "", True, 0)
+    return lines
+
+
+__all__ = ["TraceNode", "load_spans_file", "build_trace_tree", "render_trace_tree"]
@@ -0,0 +1,85 @@
+"""Block until the season reaches a state, via the /wait long-poll endpoint.
+
+Used by `gm lock --wait`, `gm advance --wait` and `ack --wait`: each request
+is held server-side until the season's state_version moves, so waiting for the
+other clubs costs one request per change instead of a sleep/poll loop.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+import click
+
+from .api_client import LONG_POLL_WAIT, ApiClient
+from .errors import CliError
+
+State = Dict[str, Any]
+
+_monotonic = time.monotonic
+
+
+def _turn(state: State) -> Dict[str, Any]:
+    return state.get("turn") or {}
+
+
+def all_committed(state: State) -> bool:
+    """Ready to lock: every club committed (or the turn is no longer collecting)."""
+    turn = _turn(state)
+    return turn.get("turn_state") != "collecting" or state.get("pending_decisions", 0) == 0
+
+
+def all_acked(state: State) -> bool:
+    """Ready to advance: every club ACKed the resolved turn (or the turn is not resolved)."""
+    turn = _turn(state)
+    return turn.get("turn_state") != "resolved" or state.get("pending_acks", 0) == 0
+
+
+def turn_left(turn_id: str) -> Callable[[State], bool]:
+    """The season moved past `turn_id` (advanced, or finished)."""
+    return lambda state: str(_turn(state).get("id")) != str(turn_id)
+
+
+def describe_progress(state: State) -> str:
+    turn = _turn(state)
+    if not turn:
+        return "no active turn"
+    turn_state = turn.get("turn_state")
+    if turn_state == "collecting":
+        return f"{state.get('pending_decisions', 0)} decision(s) not committed"
+    if turn_state == "resolved":
+        return f"{state.get('pending_acks', 0)} club(s) yet to ACK"
+    return f"turn {turn_state}"
+
+
+def wait_until(
+    client: ApiClient,
+    season_id: str,
+    done: Callable[[State], bool],
+    timeout: Optional[float] = None,
+) -> State:
+    """
+    Return the season state once `done(state)` holds.
+
+    Progress is printed to stderr whenever it changes. Raises CliError when
+    `timeout` seconds pass first (None waits indefinitely).
+    """
+    deadline = None if timeout is None else _monotonic() + timeout
+    state = client.wait_state(season_id)
+    last_message = None
+    while not done(state):
+        message = describe_progress(state)
+        if message != last_message:
+            click.echo(f"Waiting: {message}", err=True)
+            last_message = message
+        wait = LONG_POLL_WAIT
+        if deadline is not None:
+            remaining = deadline - _monotonic()
+            if remaining <= 0:
+                raise CliError(f"Timed out waiting ({message})")
+            wait = min(wait, remaining)
+        state = client.wait_state(season_id, state["state_version"], wait, after_acks=state.get("ack_count"))
+    return state
+
+
+__all__ = ["all_acked", "all_committed", "describe_progress", "turn_left", "wait_until"]